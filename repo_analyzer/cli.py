@@ -142,6 +142,15 @@ def merge_config(file_config: Dict[str, Any], cli_args: argparse.Namespace) -> D
     if 'dry_run' not in config:
         config['dry_run'] = False
     
+    # --jobs overrides the worker count (used by file summaries and the
+    # dependency graph) without mutating the loaded file_summary_config
+    jobs = getattr(cli_args, 'jobs', None)
+    if jobs is not None:
+        config['file_summary_config'] = {
+            **config.get('file_summary_config', {}),
+            'max_workers': jobs,
+        }
+    
     return config
 
 
@@ -177,7 +186,7 @@ def detect_repository_languages(root_path: Path, exclude_patterns: List[str]) ->
     Returns:
         Set of detected language names (e.g., {"Python", "C", "C++", "Rust"})
     """
-    from repo_analyzer.tree_report import DEFAULT_EXCLUDES, _should_exclude
+    from repo_analyzer.tree_report import DEFAULT_EXCLUDES, _compile_excludes
     
     detected_languages = set()
     registry = get_global_registry()
@@ -185,6 +194,7 @@ def detect_repository_languages(root_path: Path, exclude_patterns: List[str]) ->
     # Combine default excludes with user-provided patterns
     all_excludes = DEFAULT_EXCLUDES.copy()
     all_excludes.update(exclude_patterns)
+    is_excluded = _compile_excludes(all_excludes)
     
     # Quick scan: only check up to MAX_FILES_TO_CHECK_FOR_DETECTION files to avoid performance issues
     files_checked = 0
@@ -192,14 +202,14 @@ def detect_repository_languages(root_path: Path, exclude_patterns: List[str]) ->
     try:
         for dirpath, dirnames, filenames in os.walk(root_path):
             # Filter out excluded directories in-place
-            dirnames[:] = [d for d in dirnames if not _should_exclude(d, all_excludes)]
+            dirnames[:] = [d for d in dirnames if not is_excluded(d)]
             
             for filename in filenames:
                 if files_checked >= MAX_FILES_TO_CHECK_FOR_DETECTION:
                     break
                     
                 # Skip excluded files
-                if _should_exclude(filename, all_excludes):
+                if is_excluded(filename):
                     continue
                 
                 # Get file extension
@@ -575,6 +585,9 @@ def run_scan(config: Dict[str, Any]) -> int:
         # Get detail level and legacy summary options with safe defaults
         detail_level = file_summary_config.get('detail_level', 'standard')
         include_legacy_summary = file_summary_config.get('include_legacy_summary', True)
+        include_summary_text = file_summary_config.get('include_summary_text', False)
+        max_workers = file_summary_config.get('max_workers')
+        use_cache = file_summary_config.get('use_cache', False)
         
         generate_file_summaries(
             root_path=repo_root,
@@ -584,7 +597,10 @@ def run_scan(config: Dict[str, Any]) -> int:
             exclude_dirs=exclude_dirs,
             dry_run=dry_run,
             detail_level=detail_level,
-            include_legacy_summary=include_legacy_summary
+            include_legacy_summary=include_legacy_summary,
+            include_summary_text=include_summary_text,
+            max_workers=max_workers,
+            use_cache=use_cache
         )
         
         # Generate dependency graph
@@ -594,7 +610,8 @@ def run_scan(config: Dict[str, Any]) -> int:
             include_patterns=include_patterns,
             exclude_patterns=all_exclude_patterns,
             exclude_dirs=exclude_dirs,
-            dry_run=dry_run
+            dry_run=dry_run,
+            max_workers=max_workers
         )
         
         if dry_run:
@@ -642,6 +659,28 @@ def scan_command(args: argparse.Namespace) -> int:
         return 1
 
 
+def _positive_int(value: str) -> int:
+    """
+    Parse a command-line value as an integer of at least 1.
+    
+    Args:
+        value: Raw argument string
+    
+    Returns:
+        Parsed integer
+    
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
@@ -671,6 +710,11 @@ def main() -> None:
         action='store_true',
         help='Preview actions without writing files'
     )
+    scan_parser.add_argument(
+        '-j', '--jobs',
+        type=_positive_int,
+        help='Number of worker processes for file summaries and the dependency graph (default: number of CPUs)'
+    )
     
     args = parser.parse_args()
     
@@ -24,12 +24,18 @@ Supported languages:
 - SQL: vendor-specific include statements
 """
 
+import functools
 import json
+import mmap
 import os
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
-from repo_analyzer.stdlib_classification import classify_import
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional, Any
+from repo_analyzer.stdlib_classification import classify_imports_batch
 
 
 class DependencyGraphError(Exception):
@@ -37,6 +43,453 @@ class DependencyGraphError(Exception):
     pass
 
 
+# Extensions tried, in order, when resolving an extensionless JS/TS import
+_JS_EXTS: Tuple[str, ...] = ('.js', '.ts', '.jsx', '.tsx', '.mjs', '.cjs')
+
+
+# CDN domains whose references are treated as external
+_CDN_DOMAINS: Tuple[str, ...] = (
+    'cdn.', 'unpkg.', 'jsdelivr.', 'cloudflare.',
+    'cdnjs.', 'rawgit.', 'gitcdn.', 'staticfile.',
+    'bootcdn.', 'maxcdn.', 'yandex.', 'ajax.googleapis.',
+    'code.jquery.', 'stackpath.bootstrapcdn.'
+)
+
+# Single-pass check for any CDN domain within a reference
+_CDN_DOMAIN_RE = re.compile('|'.join(re.escape(d) for d in _CDN_DOMAINS), re.IGNORECASE)
+
+# Reference prefixes that are never local files
+_HTML_SKIP_PREFIXES: Tuple[str, ...] = (
+    'http://', 'https://', '//', 'data:', 'mailto:', 'tel:', '#', 'javascript:'
+)
+_CSS_SKIP_PREFIXES: Tuple[str, ...] = ('http://', 'https://', '//', 'data:')
+
+# HTML href/src attributes (group 'attr') and CSS url(...) references
+# (group 'url'), matched in a single pass
+_HTML_CSS_REF_PATTERN = re.compile(
+    r'(?:href|src)\s*=\s*["\'](?P<attr>[^"\']+)["\']'
+    r'|url\s*\(\s*["\']?(?P<url>[^"\'()]+)["\']?\s*\)',
+    re.IGNORECASE
+)
+
+
+# Root-level directories searched for includes that don't resolve next to
+# the including file or at the repository root, in priority order
+_C_SEARCH_DIRS: Tuple[str, ...] = ('include', 'src', 'lib', 'inc')
+_SQL_SEARCH_DIRS: Tuple[str, ...] = ('sql', 'migrations', 'schemas', 'db')
+_ASM_SEARCH_DIRS: Tuple[str, ...] = ('include', 'inc', 'asm', 'src')
+
+# Remainder of a single-line Go import after the keyword: optional alias
+# (a word or dot) followed by the quoted package path
+_GO_SINGLE_IMPORT_PATTERN = re.compile(r'\s+(?:[\w.]+\s+)?"([^"]+)"')
+
+# Python import statements, string literals and comments in one scan.
+# Strings and comments match without a group, so they are consumed in
+# document order and import-like text inside them is skipped. An import
+# statement starts a line or follows a ';' and runs to the end of its logical
+# line: group 1 is the keyword and group 2 the rest, including backslash
+# continuations and parenthesized lists spanning lines.
+_PYTHON_IMPORT_SCAN_PATTERN = re.compile(
+    r'''(?:^|(?<=;))[ \t]*(import|from)(?=[ \t\\])((?:[^\n\\#;()'"]|\\\n|\((?:[^)#]|#[^\n]*)*\))*)'''
+    r"""|[rRbBuUfF]{0,2}(?:'''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''"""
+    r'''|"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*"""'''
+    r"""|'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'"""
+    r'''|"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*")'''
+    r'|#[^\n]*',
+    re.MULTILINE
+)
+
+# Comments, continuations and brackets within a captured import statement
+_PYTHON_IMPORT_NOISE_PATTERN = re.compile(r'#[^\n]*|\\\n|[()\n]')
+
+# 'module import names' after the 'from' keyword
+_PYTHON_FROM_IMPORT_PATTERN = re.compile(r'\s*([\w.]+)\s+import\s+(.*)', re.DOTALL)
+
+
+# Line-anchored import patterns, compiled with re.MULTILINE so a single
+# finditer() pass covers the whole file. [^\S\n] is whitespace other than a
+# newline, which keeps every match within one line.
+
+# C/C++: #include "header.h" or #include <header.h>
+_C_INCLUDE_PATTERN = re.compile(
+    r'^[^\S\n]*#[^\S\n]*include[^\S\n]*[<"]([^>"\n]+)[>"]', re.MULTILINE
+)
+
+# Rust: 'use module::path;' (group 1) or 'mod module;' (group 2)
+_RUST_USE_MOD_PATTERN = re.compile(
+    r'^[^\S\n]*(?:use[^\S\n]+([\w:]+)|mod[^\S\n]+(\w+))', re.MULTILINE
+)
+
+# Java: 'import package.Class;' or 'import static package.Class.method;'
+_JAVA_IMPORT_PATTERN = re.compile(
+    r'^[^\S\n]*import[^\S\n]+(?:static[^\S\n]+)?([\w.]+)', re.MULTILINE
+)
+
+# C#: 'using Namespace;' or 'using Alias = Namespace;'
+_CSHARP_USING_PATTERN = re.compile(
+    r'^[^\S\n]*using[^\S\n]+(?:\w+[^\S\n]*=[^\S\n]*)?([\w.]+)', re.MULTILINE
+)
+
+# Swift: 'import Module' or 'import kind Module' (e.g., 'import struct Foundation.URL')
+_SWIFT_IMPORT_PATTERN = re.compile(
+    r'^[^\S\n]*import[^\S\n]+'
+    r'(?:(?:struct|class|enum|protocol|typealias|func|let|var)[^\S\n]+)?([\w.]+)',
+    re.MULTILINE
+)
+
+# SQL comments, /* ... */ and -- to end of line, matched in document order so
+# that a '/*' inside a line comment does not open a block
+_SQL_COMMENT_PATTERN = re.compile(r'/\*[\s\S]*?\*/|--[^\n]*')
+
+# SQL include statements (vendor-specific), one group per dialect:
+# PostgreSQL '\i file' / '\include file', MySQL 'SOURCE file' / '\. file',
+# and SQL Server EXEC/EXECUTE with a quoted .sql path
+_SQL_INCLUDE_PATTERN = re.compile(
+    r'^[^\S\n]*(?:'
+    r'\\(?:i|include)[^\S\n]+([^\s;]+)'
+    r'|(?:SOURCE|\\\.)[^\S\n]+([^\s;]+)'
+    r'|(?:EXEC|EXECUTE)[^\S\n]+.*["\']([^"\'\n]+\.sql)["\']'
+    r')',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Assembly include directives for all supported syntaxes:
+# - gas .include "file.inc" and NASM %include 'file.asm' (quoted only)
+# - MASM include file.inc, INCLUDE path\file.inc or include "file.inc"
+_ASM_INCLUDE_PATTERN = re.compile(
+    r'\s*(?:[.%]include\s+["\']([^"\']+)["\']'
+    r'|include\s+(?:["\']([^"\']+)["\']|([^\s;]+)))',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _py_search_bases(repo_root: Path) -> Tuple[Path, ...]:
+    """
+    Return the directories absolute Python imports are resolved against.
+    
+    Covers the common layouts: modules directly under the repository root,
+    under src/, and under lib/.
+    
+    Args:
+        repo_root: Repository root directory
+    
+    Returns:
+        Tuple of base directories in search order
+    """
+    return (repo_root, repo_root / 'src', repo_root / 'lib')
+
+
+# Classification of imports by (module, language). The same modules (os,
+# sys, stdio.h, fmt, ...) recur across most files of a repository, so each
+# distinct pair is classified once per process. The full module name is part
+# of the key because some languages (C/C++, Perl) classify on more than the
+# top-level name.
+_CLASSIFY_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def _python_classify_key(module_name: str) -> str:
+    """
+    Reduce a Python import to the part its classification depends on.
+    
+    Absolute imports classify by their top-level package alone, so
+    numpy.linalg and numpy.fft share one cache entry. Relative imports are
+    kept whole since they classify differently from their first segment.
+    """
+    if module_name.startswith('.'):
+        return module_name
+    return module_name.partition('.')[0]
+
+
+# Languages whose classification depends only on part of the import name,
+# mapped to the function extracting that part. Other languages are cached
+# on the full name.
+_CLASSIFY_KEY_FUNCS = {
+    'Python': _python_classify_key,
+}
+
+
+# Repositories with at least this many files are scanned in a process pool;
+# below it, worker start-up costs more than the parallel scan saves
+_PARALLEL_SCAN_THRESHOLD = 256
+
+# Files handed to each worker at a time
+_SCAN_CHUNKSIZE = 32
+
+
+# Files at least this large are memory-mapped rather than read into a bytes
+# buffer before decoding
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Only the first this-many bytes of a file are scanned for imports. Real
+# source files stay well below it; it bounds the work spent on generated
+# bundles, minified assets and data dumps that happen to match a pattern.
+_MAX_IMPORT_SCAN_BYTES = 4 * 1024 * 1024
+
+# Shared external-dependency result for files with nothing to classify (and
+# files that failed to scan). Read-only: callers must not mutate it.
+_EMPTY_EXTERNAL_DEPS: Dict[str, FrozenSet[str]] = {
+    'stdlib': frozenset(),
+    'third-party': frozenset()
+}
+
+
+# Directory listings used during import resolution, keyed by directory path.
+# One os.scandir() call answers every existence check within a directory.
+# Cleared at the start of each build_dependency_graph() and
+# generate_file_summaries() run.
+_SCAN_CACHE: Dict[str, Dict[str, os.DirEntry]] = {}
+
+# The same listings keyed by lower-cased name, built on the first lookup in a
+# directory that misses (see _dir_entry). Cleared with _SCAN_CACHE.
+_FOLDED_SCAN_CACHE: Dict[str, Dict[str, os.DirEntry]] = {}
+
+# Resolver results keyed by (resolver, import string, source directory, repo
+# root). Hits are kept in _RESOLVE_CACHE and misses in _NEGATIVE_CACHE, so an
+# include such as <stdio.h> that appears in hundreds of files probes the
+# candidate locations once per directory. Cleared with _SCAN_CACHE.
+_RESOLVE_CACHE: Dict[Tuple[Any, str, str, str], Path] = {}
+_NEGATIVE_CACHE: Set[Tuple[Any, str, str, str]] = set()
+
+
+def _clear_resolution_caches() -> None:
+    """Drop directory listings and resolver results from a previous run."""
+    _SCAN_CACHE.clear()
+    _FOLDED_SCAN_CACHE.clear()
+    _RESOLVE_CACHE.clear()
+    _NEGATIVE_CACHE.clear()
+
+
+def _memoized_resolve(
+    resolver,
+    import_path: str,
+    source_file: Path,
+    repo_root: Path
+) -> Optional[Path]:
+    """
+    Call a _resolve_* function, reusing earlier results for the same inputs.
+    
+    Resolution only depends on the import string, the directory of the
+    importing file and the repository root, so files in the same directory
+    share results.
+    
+    Args:
+        resolver: Resolver function taking (import_path, source_file, repo_root)
+        import_path: Import string to resolve
+        source_file: Path to the file containing the import
+        repo_root: Repository root directory
+    
+    Returns:
+        Resolved Path or None if not found/external
+    """
+    key = (resolver, import_path, str(source_file.parent), str(repo_root))
+    if key in _NEGATIVE_CACHE:
+        return None
+    resolved = _RESOLVE_CACHE.get(key)
+    if resolved is None:
+        resolved = resolver(import_path, source_file, repo_root)
+        if resolved is None:
+            _NEGATIVE_CACHE.add(key)
+        else:
+            _RESOLVE_CACHE[key] = resolved
+    return resolved
+
+
+def _list_dir(directory: Path) -> Dict[str, os.DirEntry]:
+    """
+    Return the entries of a directory keyed by name, memoized per directory.
+    
+    Args:
+        directory: Directory to list
+    
+    Returns:
+        Mapping of entry name to DirEntry (empty if the directory is unreadable)
+    """
+    key = str(directory)
+    entries = _SCAN_CACHE.get(key)
+    if entries is None:
+        try:
+            with os.scandir(key) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+        _SCAN_CACHE[key] = entries
+    return entries
+
+
+def _dir_entry(directory: Path, name: str) -> Optional[os.DirEntry]:
+    """
+    Look up a name in the cached listing of a directory.
+    
+    Listings hold names as stored, but on a case-insensitive filesystem
+    (the macOS and Windows defaults) a path that differs only in case, such
+    as #include "Foo.h" for foo.h, exists too. A name missing from the
+    listing whose lower-cased form matches an entry is therefore checked
+    with one lstat() call, which succeeds only where case is ignored.
+    
+    Args:
+        directory: Directory to look in
+        name: Entry name as written by the import
+    
+    Returns:
+        The matching DirEntry, or None if the directory has no such entry
+    """
+    entries = _list_dir(directory)
+    entry = entries.get(name)
+    if entry is not None or not entries:
+        return entry
+    
+    key = str(directory)
+    folded = _FOLDED_SCAN_CACHE.get(key)
+    if folded is None:
+        folded = {entry_name.lower(): entry for entry_name, entry in entries.items()}
+        _FOLDED_SCAN_CACHE[key] = folded
+    entry = folded.get(name.lower())
+    if entry is not None and os.path.lexists(os.path.join(key, name)):
+        return entry
+    return None
+
+
+def _dir_has(directory: Path, name: str) -> bool:
+    """Check whether a directory contains an entry with the given name."""
+    return _dir_entry(directory, name) is not None
+
+
+def _dir_has_subdir(directory: Path, name: str) -> bool:
+    """Check whether a directory contains a subdirectory with the given name."""
+    entry = _dir_entry(directory, name)
+    if entry is None:
+        return False
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _path_exists(path: Path) -> bool:
+    """
+    Check whether a path exists, using the cached listing of its parent.
+    
+    Like Path.exists(), symlinks are followed, so a dangling link does not
+    count. Only symlinks cost a stat() call; other entries are answered from
+    the listing alone.
+    """
+    entry = _dir_entry(path.parent, path.name)
+    if entry is None:
+        return False
+    try:
+        if entry.is_symlink():
+            entry.stat()
+        return True
+    except OSError:
+        return False
+
+
+def _is_regular_file(path: Path) -> bool:
+    """
+    Check whether a path is a regular file, using the cached listing of its parent.
+    
+    Replaces the exists() + is_file() pair, which costs two stat() calls per
+    candidate, with a single lookup. DirEntry.is_file() follows symlinks and
+    only needs a stat() call for them.
+    """
+    entry = _dir_entry(path.parent, path.name)
+    if entry is None:
+        return False
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _root_prefix(repo_root: str) -> str:
+    """Return repo_root as a string ending in exactly one path separator."""
+    return repo_root.rstrip(os.sep) + os.sep
+
+
+def _is_within(path: Path, repo_root: Path) -> bool:
+    """
+    Check whether a path lies inside the repository root.
+    
+    A string-prefix test equivalent to path.relative_to(repo_root) succeeding,
+    without building a new Path or raising on the miss path.
+    
+    Args:
+        path: Absolute path to check
+        repo_root: Repository root directory (absolute)
+    
+    Returns:
+        True if path is repo_root or below it
+    """
+    path_str = os.fspath(path)
+    root_str = os.fspath(repo_root)
+    return path_str == root_str or path_str.startswith(_root_prefix(root_str))
+
+
+def _relative_posix(path: Path, repo_root: Path) -> str:
+    """
+    Return path relative to the repository root as an interned posix string.
+    
+    A string-prefix equivalent of path.relative_to(repo_root).as_posix();
+    paths outside the root fall back to str(path).
+    
+    Args:
+        path: Absolute path to convert
+        repo_root: Repository root directory (absolute)
+    
+    Returns:
+        Repository-relative posix path, or str(path) if outside the root
+    """
+    path_str = os.fspath(path)
+    root_str = os.fspath(repo_root)
+    if path_str == root_str:
+        return '.'
+    prefix = _root_prefix(root_str)
+    if not path_str.startswith(prefix):
+        return sys.intern(path_str)
+    rel = path_str[len(prefix):]
+    if os.sep != '/':
+        rel = rel.replace(os.sep, '/')
+    return sys.intern(rel)
+
+
+def _posix_sort_key(rel_path: str) -> List[str]:
+    """Sort key ordering posix path strings component-wise, like Path objects."""
+    return rel_path.split('/')
+
+
+def _strip_block_comments(content: str) -> str:
+    """
+    Remove /* ... */ block comments from content.
+    
+    Uses str.find rather than a DOTALL non-greedy regex, which has to probe
+    for the closing delimiter one character at a time. An unterminated
+    comment is left in place, matching the previous regex behaviour.
+    
+    Args:
+        content: Source code content
+    
+    Returns:
+        Content with block comments removed
+    """
+    start = content.find('/*')
+    if start < 0:
+        return content
+    
+    parts = []
+    pos = 0
+    while start >= 0:
+        end = content.find('*/', start + 2)
+        if end < 0:
+            break
+        parts.append(content[pos:start])
+        pos = end + 2
+        start = content.find('/*', pos)
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
 def _remove_c_style_comments(content: str) -> str:
     """
     Remove C-style comments (// and /* */) from content.
@@ -48,7 +501,7 @@ def _remove_c_style_comments(content: str) -> str:
         Content with comments removed
     """
     # Remove multi-line comments /* ... */
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+    content = _strip_block_comments(content)
     
     # Remove single-line comments //
     lines = []
@@ -61,27 +514,22 @@ def _remove_c_style_comments(content: str) -> str:
     return '\n'.join(lines)
 
 
-def _remove_sql_comments(content: str) -> str:
+def _split_import_names(names: str) -> List[str]:
     """
-    Remove SQL-style comments (-- and /* */) from content.
+    Split a comma-separated import list into names, dropping 'as' aliases.
     
     Args:
-        content: SQL code content
+        names: Import list with comments and brackets already removed
     
     Returns:
-        Content with comments removed
+        Dotted names in order of appearance (a trailing comma adds none)
     """
-    # Remove multi-line comments /* ... */
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-    
-    # Remove single-line comments --
-    lines = []
-    for line in content.split('\n'):
-        if '--' in line:
-            line = line.split('--')[0]
-        lines.append(line)
-    
-    return '\n'.join(lines)
+    result = []
+    for part in names.split(','):
+        words = part.split()
+        if words:
+            result.append(words[0])
+    return result
 
 
 def _parse_python_imports(content: str, file_path: Path) -> List[str]:
@@ -95,157 +543,42 @@ def _parse_python_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported module paths (relative or absolute)
     """
-    imports = []
-    
-    # Helper function to filter out lines that are in strings/docstrings
-    def _filter_string_content(content: str) -> List[Tuple[int, str]]:
-        """
-        Filter out content inside strings and return list of (line_num, line) tuples
-        that contain actual code (not strings/docstrings).
-        """
-        lines = content.split('\n')
-        filtered = []
-        in_triple_single = False
-        in_triple_double = False
-        
-        for i, line in enumerate(lines):
-            # Track multi-line string state
-            if '"""' in line:
-                count = line.count('"""')
-                # Toggle state for each triple quote
-                for _ in range(count):
-                    in_triple_double = not in_triple_double
-            if "'''" in line:
-                count = line.count("'''")
-                for _ in range(count):
-                    in_triple_single = not in_triple_single
-            
-            # Only include lines not in multi-line strings
-            if not in_triple_single and not in_triple_double:
-                # Additional check: skip if this line appears to be a single-line string
-                stripped = line.strip()
-                # Simple heuristic: if line starts with a quote, it's likely a string
-                if not (stripped.startswith('"') and not stripped.startswith('"""')) and \
-                   not (stripped.startswith("'") and not stripped.startswith("'''")):
-                    filtered.append((i, line))
-        
-        return filtered
+    # Fast path: every import statement contains the 'import' keyword
+    if 'import' not in content:
+        return []
     
-    # Filter out string content first
-    code_lines = _filter_string_content(content)
+    imports = []
     
-    # Pre-process content to handle line continuations and parenthesized imports
-    # Join lines that are part of multi-line import statements
-    processed_lines = []
-    i = 0
-    while i < len(code_lines):
-        line_num, line = code_lines[i]
-        stripped = line.strip()
-        
-        # Skip comment lines
-        if stripped.startswith('#'):
-            i += 1
+    for match in _PYTHON_IMPORT_SCAN_PATTERN.finditer(content):
+        keyword = match.group(1)
+        if keyword is None:
+            # A string literal or comment
             continue
+        statement = _PYTHON_IMPORT_NOISE_PATTERN.sub(' ', match.group(2))
         
-        # Check if this is an import or from statement that might continue
-        if stripped.startswith('import ') or stripped.startswith('from '):
-            # Accumulate lines until we find the end of the statement
-            accumulated = line
-            
-            # Check if there's a parenthesis that needs to be closed
-            if '(' in accumulated and ')' not in accumulated:
-                i += 1
-                while i < len(code_lines):
-                    _, next_line = code_lines[i]
-                    accumulated += ' ' + next_line.strip()
-                    if ')' in next_line:
-                        break
-                    i += 1
-            # Check for line continuation with backslash
-            elif accumulated.rstrip().endswith('\\'):
-                accumulated = accumulated.rstrip()[:-1]  # Remove the backslash
-                i += 1
-                while i < len(code_lines):
-                    _, next_line = code_lines[i]
-                    accumulated += ' ' + next_line.strip()
-                    if not next_line.rstrip().endswith('\\'):
-                        break
-                    accumulated = accumulated.rstrip()[:-1]  # Remove the backslash
-                    i += 1
-            
-            processed_lines.append(accumulated)
-        else:
-            processed_lines.append(line)
-        
-        i += 1
-    
-    # Match 'import module' statements - captures all modules in comma-separated list
-    import_pattern = r'^\s*import\s+([\w.,\s]+?)(?:\s*#.*)?$'
-    
-    # Match 'from module import name' - captures both module and imported names
-    # Updated to handle parentheses and whitespace more flexibly
-    from_pattern = r'^\s*from\s+([\w.]+)\s+import\s+(?:\()?([^)#]+)(?:\))?'
-    
-    for line in processed_lines:
-        # Skip comments
-        if line.strip().startswith('#'):
+        if keyword == 'import':
+            # "import os, sys as system" -> each module, without its alias
+            imports.extend(map(sys.intern, _split_import_names(statement)))
             continue
         
-        # Check for 'import' statement
-        match = re.match(import_pattern, line)
-        if match:
-            # Parse comma-separated modules (e.g., "import os, sys, json")
-            modules_str = match.group(1)
-            # Split by comma and process each module
-            for module_part in modules_str.split(','):
-                module_part = module_part.strip()
-                if not module_part:
-                    continue
-                # Handle "module as alias" - extract just the module name
-                if ' as ' in module_part:
-                    module = module_part.split(' as ')[0].strip()
-                else:
-                    module = module_part
-                imports.append(module)
+        # "from module import names"
+        from_match = _PYTHON_FROM_IMPORT_PATTERN.match(statement)
+        if not from_match:
             continue
+        module = from_match.group(1)
         
-        # Check for 'from' statement
-        match = re.match(from_pattern, line)
-        if match:
-            module = match.group(1)
-            imported_names = match.group(2)
-            
-            # For relative imports like "from . import utils", combine module and name
-            if module.startswith('.'):
-                # Extract individual names from the import list
-                names = [n.strip() for n in imported_names.split(',')]
-                for name in names:
-                    # Skip wildcard imports
-                    if name == '*':
-                        imports.append(module)
-                        continue
-                    # Remove 'as alias' part if present
-                    name = name.split()[0] if ' ' in name else name
-                    # Combine relative path with imported name
-                    # If module has alpha (like '...parent'), add dot separator
-                    # If module is only dots (like '..'), concatenate directly
-                    if any(c.isalpha() for c in module):
-                        imports.append(f"{module}.{name}")
-                    else:
-                        imports.append(f"{module}{name}")
+        for name in _split_import_names(from_match.group(2)):
+            # Wildcard imports just use the base module
+            if name == '*':
+                imports.append(sys.intern(module))
+            elif module.startswith('.') and not any(c.isalpha() for c in module):
+                # Relative import of only dots (like '..'): concatenate directly
+                imports.append(sys.intern(f"{module}{name}"))
             else:
-                # For absolute imports, combine module with imported names
-                # e.g., "from pkg import mod" should resolve to "pkg.mod"
-                names = [n.strip() for n in imported_names.split(',')]
-                for name in names:
-                    # Skip wildcard imports - just use the base module
-                    if name == '*':
-                        imports.append(module)
-                        continue
-                    # Remove 'as alias' part if present
-                    name = name.split()[0] if ' ' in name else name
-                    # Combine module with imported name
-                    imports.append(f"{module}.{name}")
+                # Combine module with imported name, e.g. "from pkg import mod"
+                # resolves to "pkg.mod" and "from ...parent import mod" to
+                # "...parent.mod"
+                imports.append(sys.intern(f"{module}.{name}"))
     
     return imports
 
@@ -261,11 +594,15 @@ def _parse_js_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported module paths (relative or absolute)
     """
+    # Fast path: ES6, dynamic and CommonJS imports all need one of these keywords
+    if 'import' not in content and 'require' not in content:
+        return []
+    
     imports = []
     
     # Remove comments more carefully to avoid removing // in strings
     # Remove multi-line comments first
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+    content = _strip_block_comments(content)
     # Remove single-line comments, but only actual comments (not // in strings)
     # This is a simplified approach: remove // comments only when they appear after code
     # More sophisticated parsing would require a full tokenizer
@@ -336,19 +673,19 @@ def _parse_js_imports(content: str, file_path: Path) -> List[str]:
         # Check if this match is inside a string literal
         if not is_in_string(content, match.start()):
             module = match.group(1)
-            imports.append(module)
+            imports.append(sys.intern(module))
     
     # Find CommonJS require
     for match in re.finditer(require_pattern, content):
         if not is_in_string(content, match.start()):
             module = match.group(1)
-            imports.append(module)
+            imports.append(sys.intern(module))
     
     # Find dynamic imports
     for match in re.finditer(dynamic_pattern, content):
         if not is_in_string(content, match.start()):
             module = match.group(1)
-            imports.append(module)
+            imports.append(sys.intern(module))
     
     return imports
 
@@ -364,21 +701,17 @@ def _parse_c_cpp_includes(content: str, file_path: Path) -> List[str]:
     Returns:
         List of included header paths
     """
+    # Fast path: no include directive anywhere in the file
+    if 'include' not in content:
+        return []
+    
     includes = []
     
     # Remove comments to avoid false positives
     content = _remove_c_style_comments(content)
     
-    # Match #include "header.h" or #include <header.h>
-    # Pattern captures both quoted includes ("...") and angle-bracket includes (<...>)
-    # The character class [<"] matches either < or ", and [>"] matches either > or "
-    include_pattern = r'^\s*#\s*include\s*[<"]([^>"]+)[>"]'
-    
-    for line in content.split('\n'):
-        match = re.match(include_pattern, line)
-        if match:
-            header = match.group(1)
-            includes.append(header)
+    for match in _C_INCLUDE_PATTERN.finditer(content):
+        includes.append(sys.intern(match.group(1)))
     
     return includes
 
@@ -394,30 +727,18 @@ def _parse_rust_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported module paths
     """
+    # Fast path: no use or mod statement anywhere in the file
+    if 'use' not in content and 'mod' not in content:
+        return []
+    
     imports = []
     
     # Remove comments
     content = _remove_c_style_comments(content)
     
-    # Match 'use module::path;' statements
-    use_pattern = r'^\s*use\s+([\w:]+)'
-    
-    # Match 'mod module;' statements
-    mod_pattern = r'^\s*mod\s+([\w]+)'
-    
-    for line in content.split('\n'):
-        # Check for use statements
-        match = re.match(use_pattern, line)
-        if match:
-            module = match.group(1)
-            imports.append(module)
-            continue
-        
-        # Check for mod statements
-        match = re.match(mod_pattern, line)
-        if match:
-            module = match.group(1)
-            imports.append(module)
+    for match in _RUST_USE_MOD_PATTERN.finditer(content):
+        # Group 1 is a use path, group 2 a mod name
+        imports.append(sys.intern(match.group(1) or match.group(2)))
     
     return imports
 
@@ -433,43 +754,44 @@ def _parse_go_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported package paths
     """
+    # Fast path: no import keyword anywhere in the file
+    if 'import' not in content:
+        return []
+    
     imports = []
     
     # Remove comments
     content = _remove_c_style_comments(content)
     
-    # Match 'import "package"' or 'import alias "package"'
-    # Alias can be a word or dot (.)
-    single_import_pattern = r'^\s*import\s+(?:[\w.]+\s+)?"([^"]+)"'
-    
-    # Match multi-line imports: import ( ... )
-    multi_import_start = r'^\s*import\s+\('
-    import_line_pattern = r'^\s*(?:[\w.]+\s+)?"([^"]+)"'
-    
-    in_import_block = False
-    for line in content.split('\n'):
-        # Check for single-line import
-        if not in_import_block:
-            match = re.match(single_import_pattern, line)
-            if match:
-                package = match.group(1)
-                imports.append(package)
-                continue
-            
-            # Check for start of multi-line import block
-            if re.match(multi_import_start, line):
-                in_import_block = True
-                continue
-        else:
-            # We're inside an import block
-            if ')' in line:
-                in_import_block = False
-                continue
-            
-            match = re.match(import_line_pattern, line)
-            if match:
-                package = match.group(1)
-                imports.append(package)
+    pos = content.find('import')
+    while pos >= 0:
+        after = pos + len('import')
+        line_start = content.rfind('\n', 0, pos) + 1
+        # Only 'import' keywords that start a line count
+        if content[line_start:pos].strip() or content[after:after + 1] not in ' \t(':
+            pos = content.find('import', after)
+            continue
+        
+        line_end = content.find('\n', after)
+        if line_end < 0:
+            line_end = len(content)
+        paren = content.find('(', after, line_end)
+        
+        if paren >= 0 and not content[after:paren].strip():
+            # Multi-line import block: import ( ... )
+            # Every quoted string in the block is a package path (aliases precede them)
+            block_end = content.find(')', paren)
+            if block_end < 0:
+                block_end = len(content)
+            imports.extend(map(sys.intern, content[paren + 1:block_end].split('"')[1::2]))
+            pos = content.find('import', block_end)
+            continue
+        
+        # Single import: 'import "package"' or 'import alias "package"'
+        match = _GO_SINGLE_IMPORT_PATTERN.match(content, after, line_end)
+        if match:
+            imports.append(sys.intern(match.group(1)))
+        pos = content.find('import', line_end)
     
     return imports
 
@@ -485,19 +807,17 @@ def _parse_java_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported class paths
     """
+    # Fast path: no import keyword anywhere in the file
+    if 'import' not in content:
+        return []
+    
     imports = []
     
     # Remove comments
     content = _remove_c_style_comments(content)
     
-    # Match 'import package.Class;' or 'import static package.Class.method;'
-    import_pattern = r'^\s*import\s+(?:static\s+)?([\w.]+)'
-    
-    for line in content.split('\n'):
-        match = re.match(import_pattern, line)
-        if match:
-            class_path = match.group(1)
-            imports.append(class_path)
+    for match in _JAVA_IMPORT_PATTERN.finditer(content):
+        imports.append(sys.intern(match.group(1)))
     
     return imports
 
@@ -513,19 +833,17 @@ def _parse_csharp_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported namespace paths
     """
+    # Fast path: no using directive anywhere in the file
+    if 'using' not in content:
+        return []
+    
     imports = []
     
     # Remove comments
     content = _remove_c_style_comments(content)
     
-    # Match 'using Namespace;' or 'using Alias = Namespace;'
-    using_pattern = r'^\s*using\s+(?:[\w]+\s*=\s*)?([\w.]+)'
-    
-    for line in content.split('\n'):
-        match = re.match(using_pattern, line)
-        if match:
-            namespace = match.group(1)
-            imports.append(namespace)
+    for match in _CSHARP_USING_PATTERN.finditer(content):
+        imports.append(sys.intern(match.group(1)))
     
     return imports
 
@@ -541,19 +859,17 @@ def _parse_swift_imports(content: str, file_path: Path) -> List[str]:
     Returns:
         List of imported module paths
     """
+    # Fast path: no import keyword anywhere in the file
+    if 'import' not in content:
+        return []
+    
     imports = []
     
     # Remove comments
     content = _remove_c_style_comments(content)
     
-    # Match 'import Module' or 'import kind Module' (e.g., 'import struct Foundation.URL')
-    import_pattern = r'^\s*import\s+(?:(?:struct|class|enum|protocol|typealias|func|let|var)\s+)?([\w.]+)'
-    
-    for line in content.split('\n'):
-        match = re.match(import_pattern, line)
-        if match:
-            module = match.group(1)
-            imports.append(module)
+    for match in _SWIFT_IMPORT_PATTERN.finditer(content):
+        imports.append(sys.intern(match.group(1)))
     
     return imports
 
@@ -569,37 +885,28 @@ def _parse_html_css_references(content: str, file_path: Path) -> List[str]:
     Returns:
         List of local file references
     """
-    references = []
+    # Fast path: attributes need '=' and url() needs '('
+    if '=' not in content and '(' not in content:
+        return []
     
-    # CDN domains to filter out - expanded list
-    CDN_DOMAINS = [
-        'cdn.', 'unpkg.', 'jsdelivr.', 'cloudflare.',
-        'cdnjs.', 'rawgit.', 'gitcdn.', 'staticfile.',
-        'bootcdn.', 'maxcdn.', 'yandex.', 'ajax.googleapis.',
-        'code.jquery.', 'stackpath.bootstrapcdn.'
-    ]
+    # Then require one of the (case-insensitive) keywords; minified JS/CSS
+    # nearly always contains '(' but often has no references at all
+    lowered = content.lower()
+    if 'href' not in lowered and 'src' not in lowered and 'url' not in lowered:
+        return []
     
-    # For HTML: match href and src attributes with local paths
-    # Pattern captures href="..." and src="..."
-    html_ref_pattern = r'(?:href|src)\s*=\s*["\']([^"\']+)["\']'
-    
-    # For CSS: match url(...) references
-    css_ref_pattern = r'url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)'
+    references = []
     
-    for match in re.finditer(html_ref_pattern, content, re.IGNORECASE):
-        ref = match.group(1)
+    # One pass over the content handles both HTML attributes and CSS url()
+    for match in _HTML_CSS_REF_PATTERN.finditer(content):
+        kind = match.lastgroup
+        ref = match.group(kind)
         # Skip absolute URLs (http://, https://, //, etc.)
-        if not ref.startswith(('http://', 'https://', '//', 'data:', 'mailto:', 'tel:', '#', 'javascript:')):
-            # Skip CDN and external references - check if any CDN domain is in the ref
-            if not any(domain in ref.lower() for domain in CDN_DOMAINS):
-                references.append(ref)
-    
-    for match in re.finditer(css_ref_pattern, content, re.IGNORECASE):
-        ref = match.group(1)
-        # Skip absolute URLs
-        if not ref.startswith(('http://', 'https://', '//', 'data:')):
-            if not any(domain in ref.lower() for domain in CDN_DOMAINS):
-                references.append(ref)
+        if ref.startswith(_HTML_SKIP_PREFIXES if kind == 'attr' else _CSS_SKIP_PREFIXES):
+            continue
+        # Skip CDN and external references - check if any CDN domain is in the ref
+        if not _CDN_DOMAIN_RE.search(ref):
+            references.append(ref)
     
     return references
 
@@ -622,19 +929,14 @@ def _parse_asm_includes(content: str, file_path: Path) -> List[str]:
     """
     includes = []
     
-    # GNU assembler (gas) .include directive
-    # Matches: .include "file.inc" or .include "path/to/file.s"
-    gas_include_pattern = r'^\s*\.include\s+["\']([^"\']+)["\']'
-    
-    # NASM %include directive
-    # Matches: %include "file.inc" or %include 'file.asm'
-    nasm_include_pattern = r'^\s*%include\s+["\']([^"\']+)["\']'
-    
-    # MASM include directive (supports both quoted and unquoted)
-    # Matches: include file.inc, INCLUDE path\file.inc, or include "file.inc"
-    masm_include_pattern = r'^\s*include\s+(?:["\']([^"\']+)["\']|([^\s;]+))'
+    # Fast path: every syntax's directive contains the 'include' keyword
+    if 'include' not in content.lower():
+        return includes
     
     for line in content.split('\n'):
+        if 'include' not in line.lower():
+            continue
+        
         # Simple comment stripping - look for comment markers and check if in quotes
         # Skip if line starts with comment
         stripped = line.strip()
@@ -658,29 +960,19 @@ def _parse_asm_includes(content: str, file_path: Path) -> List[str]:
                     stripped_line = line[:i]
                     break
         
-        # Check gas .include
-        match = re.match(gas_include_pattern, stripped_line, re.IGNORECASE)
-        if match:
-            includes.append(match.group(1))
-            continue
-        
-        # Check NASM %include
-        match = re.match(nasm_include_pattern, stripped_line, re.IGNORECASE)
-        if match:
-            includes.append(match.group(1))
-            continue
-        
-        # Check MASM include (try both quoted and unquoted groups)
-        match = re.match(masm_include_pattern, stripped_line, re.IGNORECASE)
+        # One match covers gas, NASM and MASM; exactly one group is set
+        match = _ASM_INCLUDE_PATTERN.match(stripped_line)
         if match:
-            # Group 1 is quoted, group 2 is unquoted
-            include_file = match.group(1) if match.group(1) else match.group(2)
-            if include_file:
-                includes.append(include_file)
+            includes.append(match.group(match.lastindex))
     
     return includes
 
 
+def _blank_sql_comment(match: re.Match) -> str:
+    """Replace an SQL comment with its line breaks, or a single space."""
+    return '\n' * match.group().count('\n') or ' '
+
+
 def _parse_sql_includes(content: str, file_path: Path) -> List[str]:
     """
     Parse SQL for include/import statements and schema references.
@@ -694,36 +986,21 @@ def _parse_sql_includes(content: str, file_path: Path) -> List[str]:
     """
     includes = []
     
-    # Remove SQL comments
-    content = _remove_sql_comments(content)
-    
-    # Match various SQL include patterns (vendor-specific)
-    # PostgreSQL: \i filename or \include filename
-    psql_include_pattern = r'^\s*\\(?:i|include)\s+([^\s;]+)'
+    # Fast path: psql/MySQL directives start with a backslash or SOURCE, and
+    # only EXEC/EXECUTE can reference a script otherwise
+    if '\\' not in content:
+        lowered = content.lower()
+        if 'source' not in lowered and 'exec' not in lowered:
+            return includes
     
-    # MySQL: SOURCE filename or \. filename
-    mysql_include_pattern = r'^\s*(?:SOURCE|\\\.)\s+([^\s;]+)'
+    # Blank out comments but keep their line breaks, so a statement after a
+    # comment still starts its line
+    if '/*' in content or '--' in content:
+        content = _SQL_COMMENT_PATTERN.sub(_blank_sql_comment, content)
     
-    # Generic: EXEC or EXECUTE with file path (SQL Server)
-    exec_pattern = r'^\s*(?:EXEC|EXECUTE)\s+.*["\']([^"\']+\.sql)["\']'
-    
-    for line in content.split('\n'):
-        # Check PostgreSQL includes
-        match = re.match(psql_include_pattern, line, re.IGNORECASE)
-        if match:
-            includes.append(match.group(1))
-            continue
-        
-        # Check MySQL includes
-        match = re.match(mysql_include_pattern, line, re.IGNORECASE)
-        if match:
-            includes.append(match.group(1))
-            continue
-        
-        # Check SQL Server exec patterns
-        match = re.match(exec_pattern, line, re.IGNORECASE)
-        if match:
-            includes.append(match.group(1))
+    for match in _SQL_INCLUDE_PATTERN.finditer(content):
+        # Exactly one of the vendor-specific groups participates in a match
+        includes.append(match.group(match.lastindex))
     
     return includes
 
@@ -783,22 +1060,32 @@ def _resolve_python_import(
         else:
             # Just dots, no module name - this is a wildcard import like "from . import *"
             # Resolve to the package's __init__.py
-            if (current / '__init__.py').exists():
+            if _dir_has(current, '__init__.py'):
                 return current / '__init__.py'
             return None
         
-        # Try to resolve to a file or __init__.py
-        target = current
-        for part in parts:
-            target = target / part
+        # Try to resolve to a file or __init__.py. The last part may name a
+        # symbol rather than a module ("from .mod import func" is parsed as
+        # '.mod.func'), so a module file met on the way is the target.
+        parent = current
+        for part in parts[:-1]:
+            if _dir_has(parent, part + '.py'):
+                return parent / (part + '.py')
+            parent = parent / part
+        last = parts[-1]
         
         # Try as a module file (.py)
-        if (target.with_suffix('.py')).exists():
-            return target.with_suffix('.py')
+        if _dir_has(parent, last + '.py'):
+            return parent / (last + '.py')
         
         # Try as a package (__init__.py)
-        if (target / '__init__.py').exists():
-            return target / '__init__.py'
+        if _dir_has(parent / last, '__init__.py'):
+            return parent / last / '__init__.py'
+        
+        # A symbol of a named package ("from .pkg import symbol"), like the
+        # package fallback for absolute imports below
+        if parent != current and _dir_has(parent, '__init__.py'):
+            return parent / '__init__.py'
         
         return None
     
@@ -810,20 +1097,14 @@ def _resolve_python_import(
     # 2. Under src/ directory (common Python layout)
     # 3. Under lib/ directory (less common but used)
     target = None
-    search_paths = [
-        repo_root / parts[0],
-        repo_root / 'src' / parts[0],
-        repo_root / 'lib' / parts[0],
-    ]
-    
-    for potential_target in search_paths:
+    for base in _py_search_bases(repo_root):
         # Check if it's a file at this location (e.g., util.py)
-        if potential_target.with_suffix('.py').exists():
-            target = potential_target
+        if _dir_has(base, parts[0] + '.py'):
+            target = base / parts[0]
             break
         # Check if it's a directory (package) at this location
-        if potential_target.exists() and potential_target.is_dir():
-            target = potential_target
+        if _dir_has_subdir(base, parts[0]):
+            target = base / parts[0]
             break
     
     # If we didn't find the target in any common location, return None
@@ -831,33 +1112,28 @@ def _resolve_python_import(
         return None
     
     # For single-part imports that are files, return the file
-    if len(parts) == 1 and target.with_suffix('.py').exists():
+    if len(parts) == 1 and _dir_has(target.parent, parts[0] + '.py'):
         return target.with_suffix('.py')
     
     # Navigate through the parts
     current = target
-    for i, part in enumerate(parts[1:], 1):
-        next_path = current / part
-        
+    for part in parts[1:]:
         # Check if it's a file
-        if next_path.with_suffix('.py').exists():
-            return next_path.with_suffix('.py')
+        if _dir_has(current, part + '.py'):
+            return current / (part + '.py')
         
         # Check if it's a directory with __init__.py
-        if (next_path / '__init__.py').exists():
-            current = next_path
+        if _dir_has_subdir(current, part) and _dir_has(current / part, '__init__.py'):
+            current = current / part
         else:
-            # Try as file at this level
-            if (current / part).with_suffix('.py').exists():
-                return (current / part).with_suffix('.py')
             # If we can't find the submodule, fall back to the package's __init__.py
             # This handles cases like "from pkg import symbol" where symbol is in pkg/__init__.py
-            if (current / '__init__.py').exists():
+            if _dir_has(current, '__init__.py'):
                 return current / '__init__.py'
             return None
     
     # If we've navigated through all parts, check for __init__.py
-    if (current / '__init__.py').exists():
+    if _dir_has(current, '__init__.py'):
         return current / '__init__.py'
     
     return None
@@ -895,34 +1171,65 @@ def _resolve_js_import(
         target = (repo_root / import_path.lstrip('/')).resolve()
     
     # Check if target is within repository
-    try:
-        target.relative_to(repo_root)
-    except ValueError:
+    if not _is_within(target, repo_root):
         # Outside repository
         return None
     
-    # Try various extensions
-    extensions = ['.js', '.ts', '.jsx', '.tsx', '.mjs', '.cjs']
-    
     # Try as direct file
-    if target.exists() and target.is_file():
+    if _is_regular_file(target):
         return target
     
     # Try with extensions
-    for ext in extensions:
-        if target.with_suffix(ext).exists():
+    for ext in _JS_EXTS:
+        if _path_exists(target.with_suffix(ext)):
             return target.with_suffix(ext)
     
     # Try as directory with index file
-    if target.is_dir():
-        for ext in extensions:
+    if _dir_has_subdir(target.parent, target.name):
+        for ext in _JS_EXTS:
             index_file = target / f'index{ext}'
-            if index_file.exists():
+            if _path_exists(index_file):
                 return index_file
     
     return None
 
 
+def _resolve_from_search_dirs(
+    include_path: str,
+    source_file: Path,
+    repo_root: Path,
+    search_dirs: Tuple[str, ...]
+) -> Optional[Path]:
+    """
+    Resolve an include against the source directory, repo root and search dirs.
+    
+    Candidates are tried in priority order: next to the source file, at the
+    repository root, then under each of search_dirs at the root. A match next
+    to the source file that lies outside the repository ends the search.
+    
+    Args:
+        include_path: Include string (e.g., 'header.h', 'schema.sql')
+        source_file: Path to the file containing the include
+        repo_root: Repository root directory
+        search_dirs: Root-level directories to try, in order
+    
+    Returns:
+        Resolved Path or None if not found/external
+    """
+    relative_path = source_file.parent / include_path
+    if _is_regular_file(relative_path):
+        return relative_path if _is_within(relative_path, repo_root) else None
+    
+    candidates = (repo_root / include_path,) + tuple(
+        repo_root / search_dir / include_path for search_dir in search_dirs
+    )
+    for candidate in candidates:
+        if _is_regular_file(candidate):
+            return candidate
+    
+    return None
+
+
 def _resolve_c_cpp_include(
     include_path: str,
     source_file: Path,
@@ -943,30 +1250,9 @@ def _resolve_c_cpp_include(
     # but we only have the path here, not the bracket type)
     # System headers are typically in standard locations and won't resolve in repo
     
-    # Get the directory containing the source file
-    source_dir = source_file.parent
-    
-    # Try relative to source file directory first (most common for quoted includes)
-    relative_path = source_dir / include_path
-    if relative_path.exists() and relative_path.is_file():
-        try:
-            relative_path.relative_to(repo_root)
-            return relative_path
-        except ValueError:
-            return None
-    
-    # Try relative to repo root (for project-wide includes)
-    repo_path = repo_root / include_path
-    if repo_path.exists() and repo_path.is_file():
-        return repo_path
-    
-    # Try common include directories
-    for include_dir in ['include', 'src', 'lib', 'inc']:
-        candidate = repo_root / include_dir / include_path
-        if candidate.exists() and candidate.is_file():
-            return candidate
-    
-    return None
+    # Relative to the source file first (most common for quoted includes),
+    # then the repo root (project-wide includes), then common include dirs
+    return _resolve_from_search_dirs(include_path, source_file, repo_root, _C_SEARCH_DIRS)
 
 
 def _resolve_rust_import(
@@ -995,22 +1281,25 @@ def _resolve_rust_import(
         module_path = import_path[7:]  # Remove 'crate::'
         parts = module_path.split('::')
         
-        # Try src/lib.rs location
-        for root_file in ['src/lib.rs', 'src/main.rs']:
-            root_path = repo_root / root_file
-            if root_path.exists():
-                # Navigate through module hierarchy
-                current = repo_root / 'src'
-                for part in parts:
-                    # Try as file
-                    candidate = current / f'{part}.rs'
-                    if candidate.exists():
-                        return candidate
-                    # Try as directory with mod.rs
-                    candidate = current / part / 'mod.rs'
-                    if candidate.exists():
-                        return candidate
-                    current = current / part
+        # Only crates rooted at src/lib.rs or src/main.rs are resolved
+        current = repo_root / 'src'
+        if not (_path_exists(current / 'lib.rs') or _path_exists(current / 'main.rs')):
+            return None
+        
+        # Navigate through module hierarchy
+        for part in parts:
+            # Try as file
+            candidate = current / f'{part}.rs'
+            if _path_exists(candidate):
+                return candidate
+            # Try as directory with mod.rs
+            candidate = current / part / 'mod.rs'
+            if _path_exists(candidate):
+                return candidate
+            # Nothing deeper can exist without the directory
+            if not _dir_has_subdir(current, part):
+                return None
+            current = current / part
         
         return None
     
@@ -1023,11 +1312,11 @@ def _resolve_rust_import(
         source_dir = source_file.parent
         # Try as sibling file
         candidate = source_dir / f'{import_path}.rs'
-        if candidate.exists():
+        if _path_exists(candidate):
             return candidate
         # Try as subdirectory with mod.rs
         candidate = source_dir / import_path / 'mod.rs'
-        if candidate.exists():
+        if _path_exists(candidate):
             return candidate
     
     return None
@@ -1069,30 +1358,27 @@ def _resolve_html_css_reference(
         try:
             resolved = (source_dir / ref_path).resolve(strict=False)
             # SECURITY: Ensure resolved path is within repository
-            resolved.relative_to(repo_root)
-            if resolved.exists() and resolved.is_file():
+            if _is_within(resolved, repo_root) and _is_regular_file(resolved):
                 return resolved
-        except (ValueError, OSError):
+        except OSError:
             return None
     elif not ref_path.startswith('/'):
         # Relative path without ./ prefix
         try:
             resolved = (source_dir / ref_path).resolve(strict=False)
             # SECURITY: Ensure resolved path is within repository
-            resolved.relative_to(repo_root)
-            if resolved.exists() and resolved.is_file():
+            if _is_within(resolved, repo_root) and _is_regular_file(resolved):
                 return resolved
-        except (ValueError, OSError):
+        except OSError:
             return None
     elif ref_path.startswith('/'):
         # Absolute path from repo root
         try:
             resolved = (repo_root / ref_path.lstrip('/')).resolve(strict=False)
             # SECURITY: Ensure resolved path is within repository
-            resolved.relative_to(repo_root)
-            if resolved.exists() and resolved.is_file():
+            if _is_within(resolved, repo_root) and _is_regular_file(resolved):
                 return resolved
-        except (ValueError, OSError):
+        except OSError:
             return None
     
     return None
@@ -1128,31 +1414,28 @@ def _resolve_asm_include(
     try:
         relative_path = (source_dir / include_path).resolve(strict=False)
         # SECURITY: Ensure resolved path is within repository
-        relative_path.relative_to(repo_root)
-        if relative_path.exists() and relative_path.is_file():
+        if _is_within(relative_path, repo_root) and _is_regular_file(relative_path):
             return relative_path
-    except (ValueError, OSError):
+    except OSError:
         pass
     
     # Try relative to repo root
     try:
         repo_path = (repo_root / include_path).resolve(strict=False)
         # SECURITY: Ensure resolved path is within repository
-        repo_path.relative_to(repo_root)
-        if repo_path.exists() and repo_path.is_file():
+        if _is_within(repo_path, repo_root) and _is_regular_file(repo_path):
             return repo_path
-    except (ValueError, OSError):
+    except OSError:
         pass
     
     # Try common assembly include directories
-    for asm_dir in ['include', 'inc', 'asm', 'src']:
+    for asm_dir in _ASM_SEARCH_DIRS:
         try:
             candidate = (repo_root / asm_dir / include_path).resolve(strict=False)
             # SECURITY: Ensure resolved path is within repository
-            candidate.relative_to(repo_root)
-            if candidate.exists() and candidate.is_file():
+            if _is_within(candidate, repo_root) and _is_regular_file(candidate):
                 return candidate
-        except (ValueError, OSError):
+        except OSError:
             continue
     
     return None
@@ -1174,30 +1457,8 @@ def _resolve_sql_include(
     Returns:
         Resolved Path or None if not found/external
     """
-    # Get the directory containing the source file
-    source_dir = source_file.parent
-    
-    # Try relative to source file directory
-    relative_path = source_dir / include_path
-    if relative_path.exists() and relative_path.is_file():
-        try:
-            relative_path.relative_to(repo_root)
-            return relative_path
-        except ValueError:
-            return None
-    
-    # Try relative to repo root
-    repo_path = repo_root / include_path
-    if repo_path.exists() and repo_path.is_file():
-        return repo_path
-    
-    # Try common SQL directories
-    for sql_dir in ['sql', 'migrations', 'schemas', 'db']:
-        candidate = repo_root / sql_dir / include_path
-        if candidate.exists() and candidate.is_file():
-            return candidate
-    
-    return None
+    # Relative to the source file, then the repo root, then common SQL dirs
+    return _resolve_from_search_dirs(include_path, source_file, repo_root, _SQL_SEARCH_DIRS)
 
 
 def _scan_file_dependencies(
@@ -1221,10 +1482,251 @@ def _scan_file_dependencies(
     return dependencies
 
 
+def _read_source(file_path: Path) -> str:
+    """
+    Read a source file as text for the import parsers.
+    
+    The raw bytes are read in one call and decoded once, which avoids the
+    chunked decoding of a text-mode file object. Files of _MMAP_THRESHOLD
+    bytes or more are memory-mapped and decoded straight from the mapping,
+    so no intermediate bytes copy is held alongside the decoded text.
+    Newlines are normalized the way text mode would, so the parsers still
+    see only '\n'.
+    
+    At most _MAX_IMPORT_SCAN_BYTES are decoded; a truncated file is cut back
+    to its last complete line so no partial statement reaches the parsers.
+    
+    Args:
+        file_path: Path to the file to read
+    
+    Returns:
+        Decoded file content (undecodable bytes are dropped)
+    
+    Raises:
+        IOError/OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _decode_source(mapped, size)
+        return _decode_source(f.read(_MAX_IMPORT_SCAN_BYTES), size)
+
+
+def _decode_source(data: Any, size: int) -> str:
+    """
+    Decode a source file's bytes for the import parsers as _read_source does.
+    
+    Only the first _MAX_IMPORT_SCAN_BYTES of data are decoded, through a
+    memoryview so no copy of them is made.
+    
+    Args:
+        data: The file's bytes from the start, as bytes or any buffer (such
+            as an mmap); anything past _MAX_IMPORT_SCAN_BYTES is ignored
+        size: Size of the whole file in bytes
+    
+    Returns:
+        Decoded content (undecodable bytes are dropped)
+    """
+    with memoryview(data) as view:
+        with view[:_MAX_IMPORT_SCAN_BYTES] as head:
+            content = str(head, 'utf-8', 'ignore')
+    if size > _MAX_IMPORT_SCAN_BYTES:
+        content = content[:content.rfind('\n') + 1]
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _parse_perl_dependencies(content: str, file_path: Path) -> List[str]:
+    """Parse Perl use/require statements via parser_adapters."""
+    # Import parser_adapters locally to avoid circular dependency
+    from repo_analyzer.parser_adapters import parse_perl_dependencies
+    
+    # Fast path: every dependency comes from a use or require statement
+    if 'use' not in content and 'require' not in content:
+        return []
+    return parse_perl_dependencies(content, file_path)
+
+
+def _classify_and_add(
+    import_paths: List[str],
+    language: str,
+    external_deps: Dict[str, Set[str]]
+) -> None:
+    """
+    Classify a file's unresolved imports and record them by dependency type.
+    
+    Imports not yet in _CLASSIFY_CACHE are classified in one batch. The
+    full import path is recorded even when the cache is keyed on a prefix.
+    
+    Args:
+        import_paths: Imports that did not resolve within the repository
+        language: Language of the importing file
+        external_deps: Dict with 'stdlib' and 'third-party' sets to update
+    """
+    key_func = _CLASSIFY_KEY_FUNCS.get(language)
+    keys = [key_func(path) for path in import_paths] if key_func else import_paths
+    
+    misses = [key for key in keys if (key, language) not in _CLASSIFY_CACHE]
+    if misses:
+        for key, dep_type in classify_imports_batch(misses, language).items():
+            _CLASSIFY_CACHE[(key, language)] = dep_type
+    
+    for path, key in zip(import_paths, keys):
+        dep_type = _CLASSIFY_CACHE[(key, language)]
+        if dep_type in ('stdlib', 'third-party'):
+            external_deps[dep_type].add(path)
+
+
+# Resolvers whose results are memoized across the files of one build
+_resolve_c_cpp_cached = functools.partial(_memoized_resolve, _resolve_c_cpp_include)
+_resolve_rust_cached = functools.partial(_memoized_resolve, _resolve_rust_import)
+_resolve_html_css_cached = functools.partial(_memoized_resolve, _resolve_html_css_reference)
+_resolve_sql_cached = functools.partial(_memoized_resolve, _resolve_sql_include)
+_resolve_asm_cached = functools.partial(_memoized_resolve, _resolve_asm_include)
+
+# Per-suffix scanning: (language, parser, resolver, skip_prefixes).
+# resolver is None for languages whose imports are package or namespace
+# names rather than file paths. Unresolved imports are classified as
+# external unless skip_prefixes is None (HTML/CSS and ASM references are
+# never classified) or the import starts with one of skip_prefixes
+# (relative references that failed to resolve are still internal).
+_PY_HANDLER = ('Python', _parse_python_imports, _resolve_python_import, ('.',))
+_JS_HANDLER = ('JavaScript', _parse_js_imports, _resolve_js_import, ('.', '/'))
+_TS_HANDLER = ('TypeScript', _parse_js_imports, _resolve_js_import, ('.', '/'))
+_C_HANDLER = ('C', _parse_c_cpp_includes, _resolve_c_cpp_cached, ())
+_CPP_HANDLER = ('C++', _parse_c_cpp_includes, _resolve_c_cpp_cached, ())
+_RUST_HANDLER = ('Rust', _parse_rust_imports, _resolve_rust_cached, ('crate::', 'self::', 'super::'))
+_HTML_HANDLER = ('HTML', _parse_html_css_references, _resolve_html_css_cached, None)
+_CSS_HANDLER = ('CSS', _parse_html_css_references, _resolve_html_css_cached, None)
+_SQL_HANDLER = ('SQL', _parse_sql_includes, _resolve_sql_cached, ())
+_PERL_HANDLER = ('Perl', _parse_perl_dependencies, None, ())
+_ASM_HANDLER = ('ASM', _parse_asm_includes, _resolve_asm_cached, None)
+
+_SUFFIX_HANDLERS: Dict[str, Tuple[str, Any, Any, Optional[Tuple[str, ...]]]] = {
+    '.py': _PY_HANDLER,
+    '.js': _JS_HANDLER,
+    '.jsx': _JS_HANDLER,
+    '.mjs': _JS_HANDLER,
+    '.cjs': _JS_HANDLER,
+    '.ts': _TS_HANDLER,
+    '.tsx': _TS_HANDLER,
+    '.c': _C_HANDLER,
+    '.h': _C_HANDLER,
+    '.cpp': _CPP_HANDLER,
+    '.cc': _CPP_HANDLER,
+    '.cxx': _CPP_HANDLER,
+    '.hpp': _CPP_HANDLER,
+    '.hh': _CPP_HANDLER,
+    '.hxx': _CPP_HANDLER,
+    '.rs': _RUST_HANDLER,
+    # Go, Java, C# and Swift imports name packages, classes, namespaces or
+    # modules; intra-repo resolution would need build context, so all are
+    # classified as external
+    '.go': ('Go', _parse_go_imports, None, ()),
+    '.java': ('Java', _parse_java_imports, None, ()),
+    '.cs': ('C#', _parse_csharp_imports, None, ()),
+    '.swift': ('Swift', _parse_swift_imports, None, ()),
+    '.html': _HTML_HANDLER,
+    '.htm': _HTML_HANDLER,
+    '.css': _CSS_HANDLER,
+    '.sql': _SQL_HANDLER,
+    '.pl': _PERL_HANDLER,
+    '.pm': _PERL_HANDLER,
+    '.perl': _PERL_HANDLER,
+    '.s': _ASM_HANDLER,
+    '.asm': _ASM_HANDLER,
+    '.sx': _ASM_HANDLER,
+}
+
+
+def _parse_file_imports(
+    file_path: Path,
+    content: Optional[str] = None
+) -> List[str]:
+    """
+    Read a file and parse the import paths it names, in source order.
+    
+    Args:
+        file_path: Path to the file to scan
+        content: The file's content exactly as _read_source returns it, when
+            the caller has already read it; otherwise the file is read
+    
+    Returns:
+        Import paths as written in the file (empty for unsupported file types)
+        
+    Raises:
+        IOError/OSError: If the file cannot be read
+    """
+    if content is None:
+        try:
+            content = _read_source(file_path)
+        except (IOError, OSError) as e:
+            # Re-raise the error so it can be caught and recorded in build_dependency_graph
+            raise IOError(f"Cannot read file: {e}")
+    
+    handler = _SUFFIX_HANDLERS.get(file_path.suffix.lower())
+    if handler is None:
+        return []
+    return handler[1](content, file_path)
+
+
+def _resolve_file_imports(
+    file_path: Path,
+    repo_root: Path,
+    imports: List[str]
+) -> Tuple[List[Path], Dict[str, Set[str]]]:
+    """
+    Resolve a file's parsed import paths to file paths within the repository.
+    Imports that don't resolve are categorized as stdlib or third-party.
+    
+    The file itself is not read, so import paths parsed earlier (see
+    _parse_file_imports) can be resolved again against the current tree.
+    
+    Args:
+        file_path: Path to the file the imports were parsed from
+        repo_root: Repository root directory
+        imports: Import paths from _parse_file_imports
+    
+    Returns:
+        Tuple of (resolved_dependencies, external_dependencies) as returned
+        by _scan_file_dependencies_with_external
+    """
+    dependencies = []
+    
+    handler = _SUFFIX_HANDLERS.get(file_path.suffix.lower())
+    if handler is None:
+        return dependencies, _EMPTY_EXTERNAL_DEPS
+    language, _, resolve, skip_prefixes = handler
+    
+    unresolved = []
+    for import_path in imports:
+        resolved = resolve(import_path, file_path, repo_root) if resolve else None
+        if resolved:
+            # This is an intra-repo dependency
+            dependencies.append(resolved)
+        elif skip_prefixes is not None and not import_path.startswith(skip_prefixes):
+            # This is an external dependency - classify it
+            unresolved.append(import_path)
+    
+    if not unresolved:
+        return dependencies, _EMPTY_EXTERNAL_DEPS
+    
+    external_deps: Dict[str, Set[str]] = {
+        'stdlib': set(),
+        'third-party': set()
+    }
+    _classify_and_add(unresolved, language, external_deps)
+    
+    return dependencies, external_deps
+
+
 def _scan_file_dependencies_with_external(
     file_path: Path,
-    repo_root: Path
-) -> Tuple[List[Path], Dict[str, List[str]]]:
+    repo_root: Path,
+    content: Optional[str] = None
+) -> Tuple[List[Path], Dict[str, Set[str]]]:
     """
     Scan a single file for dependencies and resolve them to file paths.
     Also categorize external (non-repo) imports as stdlib or third-party.
@@ -1232,258 +1734,87 @@ def _scan_file_dependencies_with_external(
     Args:
         file_path: Path to the file to scan
         repo_root: Repository root directory
+        content: The file's content exactly as _read_source returns it, when
+            the caller has already read it; otherwise the file is read
     
     Returns:
         Tuple of (resolved_dependencies, external_dependencies) where:
         - resolved_dependencies: List of resolved dependency file paths within the repo
-        - external_dependencies: Dict with keys 'stdlib' and 'third-party', values are lists of module names
+        - external_dependencies: Dict with keys 'stdlib' and 'third-party', values are sets of module names
+          (the shared read-only _EMPTY_EXTERNAL_DEPS when there is nothing to classify)
         
     Raises:
         IOError/OSError: If the file cannot be read
     """
-    dependencies = []
-    external_deps: Dict[str, List[str]] = {
-        'stdlib': [],
-        'third-party': []
-    }
+    imports = _parse_file_imports(file_path, content)
+    return _resolve_file_imports(file_path, repo_root, imports)
+
+
+def _scan_one(
+    args: Tuple[Path, Path]
+) -> Tuple[List[Path], Dict[str, Set[str]], Optional[str]]:
+    """
+    Scan a single file, capturing any failure instead of raising.
+    
+    Module-level so it can be sent to worker processes.
     
+    Args:
+        args: Tuple of (absolute_file_path, repo_root)
+    
+    Returns:
+        Tuple of (dependencies, external_dependencies, error) where error is
+        None on success
+    """
+    file_path, repo_root = args
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-    except (IOError, OSError) as e:
-        # Re-raise the error so it can be caught and recorded in build_dependency_graph
-        raise IOError(f"Cannot read file: {e}")
-    
-    # Determine file type and parse accordingly
-    suffix = file_path.suffix.lower()
-    language = None
-    
-    if suffix == '.py':
-        language = 'Python'
-        imports = _parse_python_imports(content, file_path)
-        for import_path in imports:
-            resolved = _resolve_python_import(import_path, file_path, repo_root)
-            if resolved:
-                # This is an intra-repo dependency
-                dependencies.append(resolved)
-            else:
-                # This is an external dependency - classify it
-                # Skip relative imports (they failed to resolve, but are internal references)
-                if not import_path.startswith('.'):
-                    dep_type = classify_import(import_path, language)
-                    if dep_type == 'stdlib':
-                        # Only add if not already present
-                        if import_path not in external_deps['stdlib']:
-                            external_deps['stdlib'].append(import_path)
-                    elif dep_type == 'third-party':
-                        if import_path not in external_deps['third-party']:
-                            external_deps['third-party'].append(import_path)
-    
-    elif suffix in ['.js', '.ts', '.jsx', '.tsx', '.mjs', '.cjs']:
-        # Determine language more precisely
-        if suffix in ['.ts', '.tsx']:
-            language = 'TypeScript'
-        else:
-            language = 'JavaScript'
-        
-        imports = _parse_js_imports(content, file_path)
-        for import_path in imports:
-            resolved = _resolve_js_import(import_path, file_path, repo_root)
-            if resolved:
-                # This is an intra-repo dependency
-                dependencies.append(resolved)
-            else:
-                # This is an external dependency - classify it
-                # Skip relative/absolute imports (they failed to resolve, but are file paths)
-                if not import_path.startswith('.') and not import_path.startswith('/'):
-                    dep_type = classify_import(import_path, language)
-                    if dep_type == 'stdlib':
-                        if import_path not in external_deps['stdlib']:
-                            external_deps['stdlib'].append(import_path)
-                    elif dep_type == 'third-party':
-                        if import_path not in external_deps['third-party']:
-                            external_deps['third-party'].append(import_path)
-    
-    elif suffix in ['.c', '.h']:
-        language = 'C'
-        includes = _parse_c_cpp_includes(content, file_path)
-        for include_path in includes:
-            resolved = _resolve_c_cpp_include(include_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            else:
-                # Classify as external
-                dep_type = classify_import(include_path, language)
-                if dep_type == 'stdlib':
-                    if include_path not in external_deps['stdlib']:
-                        external_deps['stdlib'].append(include_path)
-                elif dep_type == 'third-party':
-                    if include_path not in external_deps['third-party']:
-                        external_deps['third-party'].append(include_path)
-    
-    elif suffix in ['.cpp', '.cc', '.cxx', '.hpp', '.hh', '.hxx']:
-        language = 'C++'
-        includes = _parse_c_cpp_includes(content, file_path)
-        for include_path in includes:
-            resolved = _resolve_c_cpp_include(include_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            else:
-                # Classify as external
-                dep_type = classify_import(include_path, language)
-                if dep_type == 'stdlib':
-                    if include_path not in external_deps['stdlib']:
-                        external_deps['stdlib'].append(include_path)
-                elif dep_type == 'third-party':
-                    if include_path not in external_deps['third-party']:
-                        external_deps['third-party'].append(include_path)
-    
-    elif suffix == '.rs':
-        language = 'Rust'
-        imports = _parse_rust_imports(content, file_path)
-        for import_path in imports:
-            resolved = _resolve_rust_import(import_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            else:
-                # Classify as external (skip crate-relative imports)
-                if not import_path.startswith('crate::') and not import_path.startswith('self::') and not import_path.startswith('super::'):
-                    dep_type = classify_import(import_path, language)
-                    if dep_type == 'stdlib':
-                        if import_path not in external_deps['stdlib']:
-                            external_deps['stdlib'].append(import_path)
-                    elif dep_type == 'third-party':
-                        if import_path not in external_deps['third-party']:
-                            external_deps['third-party'].append(import_path)
-    
-    elif suffix == '.go':
-        language = 'Go'
-        imports = _parse_go_imports(content, file_path)
-        for import_path in imports:
-            # Go imports are package paths, not file paths
-            # Intra-repo resolution is not straightforward without build context
-            # For now, classify all as external
-            dep_type = classify_import(import_path, language)
-            if dep_type == 'stdlib':
-                if import_path not in external_deps['stdlib']:
-                    external_deps['stdlib'].append(import_path)
-            elif dep_type == 'third-party':
-                if import_path not in external_deps['third-party']:
-                    external_deps['third-party'].append(import_path)
-    
-    elif suffix == '.java':
-        language = 'Java'
-        imports = _parse_java_imports(content, file_path)
-        for import_path in imports:
-            # Java imports are class paths, not file paths
-            # Intra-repo resolution would require mapping packages to directories
-            # For now, classify all as external
-            dep_type = classify_import(import_path, language)
-            if dep_type == 'stdlib':
-                if import_path not in external_deps['stdlib']:
-                    external_deps['stdlib'].append(import_path)
-            elif dep_type == 'third-party':
-                if import_path not in external_deps['third-party']:
-                    external_deps['third-party'].append(import_path)
-    
-    elif suffix == '.cs':
-        language = 'C#'
-        imports = _parse_csharp_imports(content, file_path)
-        for import_path in imports:
-            # C# using statements reference namespaces, not file paths
-            # Intra-repo resolution is not straightforward
-            # For now, classify all as external
-            dep_type = classify_import(import_path, language)
-            if dep_type == 'stdlib':
-                if import_path not in external_deps['stdlib']:
-                    external_deps['stdlib'].append(import_path)
-            elif dep_type == 'third-party':
-                if import_path not in external_deps['third-party']:
-                    external_deps['third-party'].append(import_path)
-    
-    elif suffix == '.swift':
-        language = 'Swift'
-        imports = _parse_swift_imports(content, file_path)
-        for import_path in imports:
-            # Swift imports are module names, not file paths
-            # Intra-repo resolution would require understanding module structure
-            # For now, classify all as external
-            dep_type = classify_import(import_path, language)
-            if dep_type == 'stdlib':
-                if import_path not in external_deps['stdlib']:
-                    external_deps['stdlib'].append(import_path)
-            elif dep_type == 'third-party':
-                if import_path not in external_deps['third-party']:
-                    external_deps['third-party'].append(import_path)
-    
-    elif suffix in ['.html', '.htm']:
-        language = 'HTML'
-        references = _parse_html_css_references(content, file_path)
-        for ref_path in references:
-            resolved = _resolve_html_css_reference(ref_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            # HTML/CSS references don't have external package dependencies to classify
-    
-    elif suffix == '.css':
-        language = 'CSS'
-        references = _parse_html_css_references(content, file_path)
-        for ref_path in references:
-            resolved = _resolve_html_css_reference(ref_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            # CSS references don't have external package dependencies to classify
-    
-    elif suffix == '.sql':
-        language = 'SQL'
-        includes = _parse_sql_includes(content, file_path)
-        for include_path in includes:
-            resolved = _resolve_sql_include(include_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            else:
-                # Classify schema references
-                dep_type = classify_import(include_path, language)
-                if dep_type == 'stdlib':
-                    if include_path not in external_deps['stdlib']:
-                        external_deps['stdlib'].append(include_path)
-                elif dep_type == 'third-party':
-                    if include_path not in external_deps['third-party']:
-                        external_deps['third-party'].append(include_path)
-    
-    elif suffix in ['.pl', '.pm', '.perl']:
-        language = 'Perl'
-        # Import parser_adapters locally to avoid circular dependency
-        from repo_analyzer.parser_adapters import parse_perl_dependencies
-        perl_deps = parse_perl_dependencies(content, file_path)
-        for module in perl_deps:
-            # Perl modules don't typically resolve to files in the same way
-            # Classify all as external
-            dep_type = classify_import(module, language)
-            if dep_type == 'stdlib':
-                if module not in external_deps['stdlib']:
-                    external_deps['stdlib'].append(module)
-            elif dep_type == 'third-party':
-                if module not in external_deps['third-party']:
-                    external_deps['third-party'].append(module)
-    
-    elif suffix in ['.s', '.S', '.asm', '.sx']:
-        language = 'ASM'
-        includes = _parse_asm_includes(content, file_path)
-        for include_path in includes:
-            resolved = _resolve_asm_include(include_path, file_path, repo_root)
-            if resolved:
-                dependencies.append(resolved)
-            # Assembly includes are typically project-specific, no external classification
+        deps, external_deps = _scan_file_dependencies_with_external(file_path, repo_root)
+        return deps, external_deps, None
+    except Exception as e:
+        return [], _EMPTY_EXTERNAL_DEPS, str(e)
+
+
+def _scan_all_files(
+    files: List[Path],
+    repo_root: Path,
+    max_workers: Optional[int] = None
+) -> List[Tuple[List[Path], Dict[str, Set[str]], Optional[str]]]:
+    """
+    Scan every file for dependencies, in parallel for large file sets.
     
-    return dependencies, external_deps
+    Files are independent of each other, so once there are at least
+    _PARALLEL_SCAN_THRESHOLD of them they are spread across a process pool.
+    Smaller sets, a single worker and environments where a pool cannot be
+    started are scanned serially in this process.
+    
+    Args:
+        files: Absolute paths of the files to scan
+        repo_root: Repository root directory (absolute)
+        max_workers: Maximum number of worker processes (default: the number
+            of CPUs; 1 scans serially)
+    
+    Returns:
+        List of _scan_one() results in the same order as files
+    """
+    tasks = [(file_path, repo_root) for file_path in files]
+    workers = max_workers or os.cpu_count() or 1
+    
+    if len(tasks) >= _PARALLEL_SCAN_THRESHOLD and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_scan_one, tasks, chunksize=_SCAN_CHUNKSIZE))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool here - fall back to a serial scan
+            pass
+    
+    return [_scan_one(task) for task in tasks]
 
 
 def build_dependency_graph(
     root_path: Path,
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
-    exclude_dirs: Optional[Set[str]] = None
+    exclude_dirs: Optional[Set[str]] = None,
+    max_workers: Optional[int] = None
 ) -> Tuple[Dict[str, Any], List[str]]:
     """
     Build a dependency graph for files in the repository.
@@ -1493,13 +1824,21 @@ def build_dependency_graph(
         include_patterns: List of patterns to include (e.g., ['*.py', '*.js'])
         exclude_patterns: List of patterns to exclude
         exclude_dirs: Set of directory names to skip
+        max_workers: Maximum number of worker processes used to scan files
+            (default: the number of CPUs; 1 scans serially)
     
     Returns:
         Tuple of (graph_data, errors) where graph_data contains nodes, edges,
         and external dependencies, and errors is a list of error messages
+    
+    Raises:
+        DependencyGraphError: If max_workers is below 1 or files can't be scanned
     """
     from repo_analyzer.file_summary import scan_files, _get_language
     
+    if max_workers is not None and max_workers < 1:
+        raise DependencyGraphError(f"max_workers must be at least 1, got {max_workers}")
+    
     errors = []
     
     # Scan for files
@@ -1509,30 +1848,42 @@ def build_dependency_graph(
         raise DependencyGraphError(f"Failed to scan files: {e}")
     
     # Normalize root_path to absolute for consistent comparisons
+    scan_root = root_path
     root_path = root_path.resolve()
     
-    # Build dependency map - normalize all file paths to absolute
-    dependency_map: Dict[Path, List[Path]] = {}
-    # Track external dependencies per file
-    external_deps_map: Dict[Path, Dict[str, List[str]]] = {}
-    # Normalize all files to absolute paths for consistent comparisons
-    all_files: Set[Path] = {f.resolve() for f in files}
+    # Directory listings and resolver results from a previous run may be stale
+    _clear_resolution_caches()
     
+    # Build dependency map keyed by repository-relative posix path
+    dependency_map: Dict[str, List[str]] = {}
+    # Track external dependencies per file
+    external_deps_map: Dict[str, Dict[str, Set[str]]] = {}
+    # Normalize all files to absolute paths for consistent comparisons.
+    # scan_files skips symlinked files and directories, so below the root
+    # every path is already canonical and can be rebased onto the resolved
+    # root instead of paying for a realpath walk per file
+    resolved_files: List[Path] = []
     for file_path in files:
         try:
-            # Normalize file_path to absolute
-            file_path_abs = file_path.resolve()
-            deps, external_deps = _scan_file_dependencies_with_external(file_path_abs, root_path)
-            dependency_map[file_path_abs] = deps
-            external_deps_map[file_path_abs] = external_deps
-        except Exception as e:
+            resolved_files.append(root_path / file_path.relative_to(scan_root))
+        except ValueError:
+            resolved_files.append(file_path.resolve())
+    
+    for file_path, file_path_abs, (deps, external_deps, error) in zip(
+        files, resolved_files, _scan_all_files(resolved_files, root_path, max_workers)
+    ):
+        if error is not None:
             try:
                 rel = file_path.relative_to(root_path)
             except ValueError:
                 rel = file_path
-            errors.append(f"Error scanning {rel}: {e}")
-            dependency_map[file_path.resolve()] = []
-            external_deps_map[file_path.resolve()] = {'stdlib': [], 'third-party': []}
+            errors.append(f"Error scanning {rel}: {error}")
+        rel_path = _relative_posix(file_path_abs, root_path)
+        dependency_map[rel_path] = [_relative_posix(dep, root_path) for dep in deps]
+        external_deps_map[rel_path] = external_deps
+    
+    # Every scanned file has an entry, so the keys are the scanned files
+    all_files_posix: Set[str] = set(dependency_map)
     
     # Build graph structure
     nodes = []
@@ -1542,18 +1893,16 @@ def build_dependency_graph(
     all_stdlib_deps: Set[str] = set()
     all_third_party_deps: Set[str] = set()
     
-    for file_path in sorted(all_files):
-        try:
-            rel_path = file_path.relative_to(root_path).as_posix()
-        except ValueError:
-            rel_path = str(file_path)
-        
+    # Sort by path components, the same order Path comparison gives
+    for rel_path in sorted(all_files_posix, key=_posix_sort_key):
         # Get external dependencies for this file
-        ext_deps = external_deps_map.get(file_path, {'stdlib': [], 'third-party': []})
+        ext_deps = external_deps_map[rel_path]
         
         # Aggregate for summary stats
-        all_stdlib_deps.update(ext_deps['stdlib'])
-        all_third_party_deps.update(ext_deps['third-party'])
+        if ext_deps['stdlib']:
+            all_stdlib_deps.update(ext_deps['stdlib'])
+        if ext_deps['third-party']:
+            all_third_party_deps.update(ext_deps['third-party'])
         
         # Add node with external dependency info
         node = {
@@ -1569,20 +1918,10 @@ def build_dependency_graph(
     
     # Create edges (deduplicate by source-target pair)
     edge_set = set()  # Track unique (source, target) pairs
-    for source_file, dependencies in dependency_map.items():
-        try:
-            source_rel = source_file.relative_to(root_path).as_posix()
-        except ValueError:
-            source_rel = str(source_file)
-        
-        for dep_file in dependencies:
-            try:
-                target_rel = dep_file.relative_to(root_path).as_posix()
-            except ValueError:
-                target_rel = str(dep_file)
-            
+    for source_rel, dependencies in dependency_map.items():
+        for target_rel in dependencies:
             # Only create edge if target is in our scanned files
-            if dep_file in all_files:
+            if target_rel in all_files_posix:
                 edge_pair = (source_rel, target_rel)
                 if edge_pair not in edge_set:
                     edge_set.add(edge_pair)
@@ -1595,8 +1934,8 @@ def build_dependency_graph(
         'nodes': nodes,
         'edges': edges,
         'external_dependencies_summary': {
-            'stdlib': sorted(list(all_stdlib_deps)),
-            'third-party': sorted(list(all_third_party_deps)),
+            'stdlib': sorted(all_stdlib_deps),
+            'third-party': sorted(all_third_party_deps),
             'stdlib_count': len(all_stdlib_deps),
             'third-party_count': len(all_third_party_deps)
         }
@@ -1611,7 +1950,8 @@ def generate_dependency_report(
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
     exclude_dirs: Optional[Set[str]] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: Optional[int] = None
 ) -> None:
     """
     Generate dependency graph report in JSON and Markdown formats.
@@ -1623,6 +1963,8 @@ def generate_dependency_report(
         exclude_patterns: List of patterns to exclude
         exclude_dirs: Set of directory names to skip
         dry_run: If True, only log intent without writing files
+        max_workers: Maximum number of worker processes used to scan files
+            (default: the number of CPUs; 1 scans serially)
     
     Raises:
         DependencyGraphError: If dependency graph generation fails
@@ -1630,12 +1972,12 @@ def generate_dependency_report(
     try:
         # Build dependency graph
         graph_data, errors = build_dependency_graph(
-            root_path, include_patterns, exclude_patterns, exclude_dirs
+            root_path, include_patterns, exclude_patterns, exclude_dirs,
+            max_workers
         )
         
         # Generate JSON output
         json_path = output_dir / "dependencies.json"
-        json_content = json.dumps(graph_data, indent=2)
         
         if dry_run:
             print(f"[DRY RUN] Would write dependencies.json to: {json_path}")
@@ -1643,8 +1985,9 @@ def generate_dependency_report(
             if errors:
                 print(f"[DRY RUN] Errors: {len(errors)}")
         else:
+            # Stream to the file rather than building the whole document first
             with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(json_content)
+                json.dump(graph_data, f, indent=2)
             print(f"Dependency graph JSON written: {json_path}")
         
         # Generate Markdown output
@@ -1692,39 +2035,21 @@ def generate_dependency_report(
                 markdown_lines.append("")
         
         # Calculate some interesting metrics
-        dependents_count: Dict[str, int] = {}
-        dependencies_count: Dict[str, int] = {}
-        
-        for edge in graph_data['edges']:
-            source = edge['source']
-            target = edge['target']
-            
-            dependencies_count[source] = dependencies_count.get(source, 0) + 1
-            dependents_count[target] = dependents_count.get(target, 0) + 1
+        edges = graph_data['edges']
+        dependencies_count = Counter(edge['source'] for edge in edges)
+        dependents_count = Counter(edge['target'] for edge in edges)
         
         # Most depended upon files
         if dependents_count:
             markdown_lines.append("## Most Depended Upon Files (Intra-Repo)\n")
-            sorted_dependents = sorted(
-                dependents_count.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            for file_path, count in sorted_dependents:
+            for file_path, count in dependents_count.most_common(10):
                 markdown_lines.append(f"- `{file_path}` ({count} dependents)")
             markdown_lines.append("")
         
         # Files with most dependencies
         if dependencies_count:
             markdown_lines.append("## Files with Most Dependencies (Intra-Repo)\n")
-            sorted_dependencies = sorted(
-                dependencies_count.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            for file_path, count in sorted_dependencies:
+            for file_path, count in dependencies_count.most_common(10):
                 markdown_lines.append(f"- `{file_path}` ({count} dependencies)")
             markdown_lines.append("")
         
@@ -1736,15 +2061,16 @@ def generate_dependency_report(
                 markdown_lines.append(f"- {error}")
             markdown_lines.append("")
         
-        markdown_content = "\n".join(markdown_lines)
         markdown_path = output_dir / "dependencies.md"
         
         if dry_run:
+            # Length of the newline-joined lines, without materializing the join
+            content_length = sum(map(len, markdown_lines)) + len(markdown_lines) - 1
             print(f"[DRY RUN] Would write dependencies.md to: {markdown_path}")
-            print(f"[DRY RUN] Content length: {len(markdown_content)} bytes")
+            print(f"[DRY RUN] Content length: {content_length} bytes")
         else:
             with open(markdown_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                f.write('\n'.join(markdown_lines))
             print(f"Dependency graph Markdown written: {markdown_path}")
         
         # Report errors to console and raise exception if any errors occurred
@@ -15,13 +15,37 @@ Schema Version: 2.0
 """
 
 import ast
+import fnmatch
+import functools
+import hashlib
 import json
 import os
 import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Literal, Tuple
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Set, Literal, Tuple
 
-from repo_analyzer.language_registry import get_global_registry
+from repo_analyzer.dependency_graph import (
+    _MAX_IMPORT_SCAN_BYTES,
+    _clear_resolution_caches,
+    _decode_source,
+    _parse_file_imports,
+    _resolve_file_imports,
+)
+from repo_analyzer import __version__, language_registry
+from repo_analyzer.language_registry import LanguageRegistry, get_global_registry
+from repo_analyzer.parser_adapters import extract_symbols
+
+# orjson is optional: when installed it serializes file-summaries.json
+# several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Schema version for structured summaries
 SCHEMA_VERSION = "2.0"
@@ -90,6 +114,80 @@ LANGUAGE_MAP = {
 # Compiled regex patterns for performance
 _TODO_PATTERN = re.compile(r'\b(TODO|FIXME)\b', re.IGNORECASE)
 
+# Every case-insensitive TODO/FIXME match lowercases to text containing one of
+# these. Only 'i' has non-ASCII case variants ('\u0130', '\u0131'), so FIXME
+# is tested by its suffix.
+_TODO_HINTS = ('todo', 'xme')
+
+# JavaScript/TypeScript export patterns used by _parse_js_ts_exports
+
+# Pattern for: export default function/class Name
+_JS_DEFAULT_NAMED_PATTERN = re.compile(
+    r'export\s+default\s+(?:async\s+)?(?:function|class)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)',
+    re.MULTILINE
+)
+
+# Pattern for: export default Identifier (with optional semicolon)
+# Captures: export default MyComponent; or export default MyComponent
+# Use negative lookahead to avoid matching keywords (function, class, etc.)
+_JS_DEFAULT_IDENT_PATTERN = re.compile(
+    r'export\s+default\s+(?!(?:async|function|class|interface|type|const|let|var)\b)([a-zA-Z_$][a-zA-Z0-9_$]*)',
+    re.MULTILINE
+)
+
+# Pattern for: export function name() or export const name = or export class Name
+# Also handles TypeScript: export interface Name, export type Name
+# Use negative lookahead to avoid matching "export default function/class Name"
+_JS_EXPORT_PATTERN = re.compile(
+    r'export\s+(?!default\s)(?:async\s+)?(?:function|const|let|var|class|interface|type)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)',
+    re.MULTILINE
+)
+
+# Pattern for: export default (without a name)
+_JS_DEFAULT_PATTERN = re.compile(r'export\s+default\s+', re.MULTILINE)
+
+# Pattern for: export { a, b, c }
+_JS_EXPORT_LIST_PATTERN = re.compile(r'export\s+\{([^}]+)\}', re.MULTILINE)
+
+# One item of an export list: a name, optionally followed by "as alias"
+# (the "as" is case-insensitive). Blank items don't match.
+_JS_EXPORT_ITEM_PATTERN = re.compile(r'\s*(\S+)(?:\s+[Aa][Ss]\s+(\S+))?')
+
+# A line of code: optional whitespace, then anything but a line comment
+# (# or //). Lines after the first are found by their leading newline, which
+# the regex engine can search for directly; an anchored ^ in MULTILINE mode
+# is retried at every position and is slower than a Python loop. Only the
+# newline is consumed, so findall() returns the cached '\n' string for every
+# line instead of allocating a copy of each line's start.
+_CODE_LINE = r'[^\S\n]*(?:[^#/\s]|/(?!/))'
+_FIRST_CODE_LINE_PATTERN = re.compile(_CODE_LINE)
+_NEXT_CODE_LINE_PATTERN = re.compile(r'\n(?=' + _CODE_LINE + ')')
+
+# Repositories with at least this many files are summarized in a process
+# pool; below it, starting the workers costs more than it saves
+_PARALLEL_SUMMARY_THRESHOLD = 64
+
+# Files sent to a worker per task, amortizing the inter-process round trip
+_SUMMARY_CHUNKSIZE = 16
+
+# Tasks kept in flight per worker. A new task is submitted as each finished
+# one is written, which keeps the workers busy while bounding how many
+# finished summaries can be waiting to be written.
+_SUMMARY_TASKS_PER_WORKER = 4
+
+# Read size used after the first read of a file, which asks for the whole file
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Markdown blocks joined into each write to file-summaries.md. Every text
+# file write() has a fixed cost well above the encoding of a short block.
+_MARKDOWN_WRITE_BATCH = 256
+
+# When enabled, summaries of unchanged files are reused across runs from this
+# file in the output directory (see _load_summary_cache). Bump the version
+# whenever the cache layout or the summaries it holds change meaning.
+_SUMMARY_CACHE_NAME = ".file-summary-cache.json"
+_SUMMARY_CACHE_VERSION = 3
+
 
 class FileSummaryError(Exception):
     """Raised when file summary generation fails."""
@@ -111,13 +209,10 @@ def _count_lines_of_code(content: str) -> int:
     Returns:
         Number of lines of code
     """
-    lines = content.split('\n')
-    loc = 0
-    for line in lines:
-        stripped = line.strip()
-        # Skip empty lines and pure comment lines (basic heuristic)
-        if stripped and not stripped.startswith('#') and not stripped.startswith('//'):
-            loc += 1
+    # Empty and pure comment lines do not match (basic heuristic)
+    loc = len(_NEXT_CODE_LINE_PATTERN.findall(content))
+    if _FIRST_CODE_LINE_PATTERN.match(content):
+        loc += 1
     return loc
 
 
@@ -131,15 +226,192 @@ def _count_todos(content: str) -> int:
     Returns:
         Number of TODO/FIXME comments
     """
-    # Use pre-compiled pattern for performance
+    # Most files have no markers: a substring check on the lowercased text
+    # is far cheaper than the case-insensitive word-boundary regex
+    lowered = content.lower()
+    if not any(hint in lowered for hint in _TODO_HINTS):
+        return 0
     return len(_TODO_PATTERN.findall(content))
 
 
+def _scan_ascii_metrics(buf) -> Tuple[int, int]:
+    """
+    Count lines of code and TODO/FIXME markers in one pass over ASCII bytes.
+    
+    Gives the same counts as _count_lines_of_code and _count_todos on the
+    decoded content (see _decode_content) of ASCII files, where whitespace
+    and word characters are plain byte classes. A lone \\r ends a line, as
+    universal newlines do, so raw file bytes can be scanned directly.
+    Written in the subset of Python numba compiles; without numba it is not
+    used, as the regex scans are faster than a Python byte loop (see
+    _ascii_metrics_kernel).
+    
+    Args:
+        buf: ASCII file bytes as a sequence of byte values (bytes or a numpy
+            uint8 array)
+    
+    Returns:
+        Tuple of (lines of code, TODO/FIXME count)
+    """
+    n = len(buf)
+    loc = 0
+    todos = 0
+    line_start = True
+    for i in range(n):
+        c = buf[i]
+        if c == 10 or c == 13:
+            line_start = True
+            continue
+        if line_start and not (c == 32 or 9 <= c <= 13 or 28 <= c <= 31):
+            # First non-whitespace byte of the line decides whether it counts
+            line_start = False
+            if c != 35 and not (c == 47 and i + 1 < n and buf[i + 1] == 47):
+                loc += 1
+        
+        # TODO/FIXME as a whole word, case-insensitively (c | 32 lowercases
+        # the letters compared here)
+        lower = c | 32
+        if lower != 116 and lower != 102:
+            continue
+        if i > 0:
+            p = buf[i - 1]
+            if 48 <= p <= 57 or 65 <= p <= 90 or 97 <= p <= 122 or p == 95:
+                continue
+        if (lower == 116 and i + 3 < n and buf[i + 1] | 32 == 111 and
+                buf[i + 2] | 32 == 100 and buf[i + 3] | 32 == 111):
+            end = i + 4
+        elif (lower == 102 and i + 4 < n and buf[i + 1] | 32 == 105 and
+                buf[i + 2] | 32 == 120 and buf[i + 3] | 32 == 109 and
+                buf[i + 4] | 32 == 101):
+            end = i + 5
+        else:
+            continue
+        if end < n:
+            q = buf[end]
+            if 48 <= q <= 57 or 65 <= q <= 90 or 97 <= q <= 122 or q == 95:
+                continue
+        todos += 1
+    return loc, todos
+
+
+@functools.lru_cache(maxsize=None)
+def _ascii_metrics_kernel() -> Optional[Callable[[bytes], Tuple[int, int]]]:
+    """
+    Compile _scan_ascii_metrics with numba, if it is installed.
+    
+    numba is optional, and importing it (with numpy) costs far more than a
+    typical run spends scanning, so it is only imported the first time an
+    ASCII file is scanned, never at module import.
+    
+    Returns:
+        Function scanning ASCII bytes like _scan_ascii_metrics, or None
+        when numba is not installed
+    """
+    try:
+        import numpy
+        from numba import njit
+    except ImportError:
+        return None
+    
+    compiled = njit(cache=True)(_scan_ascii_metrics)
+    
+    def scan(data: bytes) -> Tuple[int, int]:
+        loc, todos = compiled(numpy.frombuffer(data, dtype=numpy.uint8))
+        return int(loc), int(todos)
+    
+    return scan
+
+
+def _read_file(file_path: Path) -> Tuple[int, bytes]:
+    """
+    Read a file's size and content with as few system calls as possible.
+    
+    open() plus read() adds isatty, lseek and repeated fstat calls for its
+    buffering setup; this opens a raw descriptor, takes the size from a
+    single fstat and reads until EOF.
+    
+    Args:
+        file_path: Path to the file
+    
+    Returns:
+        Tuple of (size in bytes from fstat, file content)
+    
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        # Asking for one byte more than the size normally reads the whole
+        # file at once, leaving a single empty read to confirm EOF
+        chunk = os.read(fd, size + 1)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+    finally:
+        os.close(fd)
+    return size, b''.join(chunks)
+
+
+def _decode_content(data: bytes) -> str:
+    """
+    Decode file bytes as a text-mode read with errors='ignore' would.
+    
+    Decodes UTF-8 in one call, dropping invalid bytes, and translates \\r\\n
+    and lone \\r line endings to \\n like universal newlines.
+    
+    Args:
+        data: Raw file content
+    
+    Returns:
+        Decoded file content
+    """
+    content = data.decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _scan_content(data: bytes, content: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Count lines of code and TODO/FIXME markers in file content.
+    
+    Uses the numba-compiled single-pass scan directly on the bytes of ASCII
+    files when numba is installed, otherwise _count_lines_of_code and
+    _count_todos on the decoded content.
+    
+    Args:
+        data: Raw file content
+        content: Content already decoded with _decode_content, if available
+    
+    Returns:
+        Tuple of (lines of code, TODO/FIXME count)
+    """
+    if data.isascii():
+        kernel = _ascii_metrics_kernel()
+        if kernel is not None:
+            return kernel(data)
+    if content is None:
+        content = _decode_content(data)
+    return _count_lines_of_code(content), _count_todos(content)
+
+
+# Declaration prefix for each top-level node type that is reported
+_PYTHON_DECLARATION_PREFIXES = {
+    ast.FunctionDef: "function ",
+    ast.AsyncFunctionDef: "async function ",
+    ast.ClassDef: "class ",
+}
+
+
 def _parse_python_declarations(content: str) -> Tuple[List[str], Optional[str]]:
     """
     Parse Python file to extract top-level function and class declarations.
     
     Uses Python's ast module for safe static analysis without code execution.
+    A full parse is kept (rather than a token scan) so that syntax errors
+    are still reported.
     
     Args:
         content: Python source code as string
@@ -147,16 +419,15 @@ def _parse_python_declarations(content: str) -> Tuple[List[str], Optional[str]]:
     Returns:
         Tuple of (list of declaration names, error message if parsing failed)
     """
-    declarations = []
     try:
         tree = ast.parse(content)
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.FunctionDef):
-                declarations.append(f"function {node.name}")
-            elif isinstance(node, ast.AsyncFunctionDef):
-                declarations.append(f"async function {node.name}")
-            elif isinstance(node, ast.ClassDef):
-                declarations.append(f"class {node.name}")
+        # Top-level statements are exactly the module body
+        prefixes = _PYTHON_DECLARATION_PREFIXES
+        declarations = [
+            prefixes[type(node)] + node.name
+            for node in tree.body
+            if type(node) in prefixes
+        ]
         return declarations, None
     except SyntaxError as e:
         return [], f"Syntax error at line {e.lineno}: {e.msg}"
@@ -177,132 +448,446 @@ def _parse_js_ts_exports(content: str) -> Tuple[List[str], Optional[str]]:
     Returns:
         Tuple of (list of export declarations, warning message if any)
     """
-    exports = []
-    
-    # Pattern for: export default function/class Name
-    default_named_pattern = re.compile(
-        r'export\s+default\s+(?:async\s+)?(?:function|class)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)',
-        re.MULTILINE
-    )
+    # Every pattern below (and the missed-exports warning) needs the word
+    # "export", so files without it skip the regex scans entirely
+    if 'export' not in content:
+        return [], None
     
-    # Pattern for: export default Identifier (with optional semicolon)
-    # Captures: export default MyComponent; or export default MyComponent
-    # Use negative lookahead to avoid matching keywords (function, class, etc.)
-    default_identifier_pattern = re.compile(
-        r'export\s+default\s+(?!(?:async|function|class|interface|type|const|let|var)\b)([a-zA-Z_$][a-zA-Z0-9_$]*)',
-        re.MULTILINE
-    )
-    
-    # Pattern for: export function name() or export const name = or export class Name
-    # Also handles TypeScript: export interface Name, export type Name
-    # Use negative lookbehind to avoid matching "export default function/class Name"
-    export_pattern = re.compile(
-        r'export\s+(?!default\s)(?:async\s+)?(?:function|const|let|var|class|interface|type)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)',
-        re.MULTILINE
-    )
-    
-    # Pattern for: export default (without a name)
-    default_export_pattern = re.compile(r'export\s+default\s+', re.MULTILINE)
-    
-    # Pattern for: export { a, b, c }
-    export_list_pattern = re.compile(r'export\s+\{([^}]+)\}', re.MULTILINE)
+    exports = []
+    # Names already exported, for the export-list deduplication below, and
+    # the subset exported as default
+    existing_names = set()
+    default_names = set()
     
-    # Find default exports with names (e.g., export default function Foo)
-    for match in default_named_pattern.finditer(content):
-        name = match.group(1)
-        exports.append(f"export default {name}")
+    # The default-export patterns all need the word "default", so the same
+    # substring check lets files with only named exports skip them
+    has_default_keyword = 'default' in content
     
-    # Find default identifier exports (e.g., export default MyComponent;)
-    for match in default_identifier_pattern.finditer(content):
-        name = match.group(1)
-        # Only add if we haven't already captured this as a named function/class default
-        if f"export default {name}" not in exports:
+    if has_default_keyword:
+        # Find default exports with names (e.g., export default function Foo)
+        for match in _JS_DEFAULT_NAMED_PATTERN.finditer(content):
+            name = match.group(1)
             exports.append(f"export default {name}")
+            default_names.add(name)
+        
+        # Find default identifier exports (e.g., export default MyComponent;)
+        for match in _JS_DEFAULT_IDENT_PATTERN.finditer(content):
+            name = match.group(1)
+            # Only add if we haven't already captured this as a named function/class default
+            if name not in default_names:
+                exports.append(f"export default {name}")
+                default_names.add(name)
     
     # Find named exports (including TypeScript interface/type)
-    for match in export_pattern.finditer(content):
+    for match in _JS_EXPORT_PATTERN.finditer(content):
         name = match.group(1)
         exports.append(f"export {name}")
-    
-    # Check for anonymous default export (only if no named default found)
-    # Named default exports have the format "export default Name" (3 parts)
-    has_default = default_export_pattern.search(content)
-    has_named_default = any(
-        len(e.split()) == 3 and e.split()[0] == 'export' and e.split()[1] == 'default'
-        for e in exports
+        # "export default" entries never contribute a name
+        if name != 'default':
+            existing_names.add(name)
+    
+    # Check for anonymous default export (only if no named default found).
+    # A named default already implies "export default", so the scan is
+    # only needed without one.
+    has_named_default = bool(default_names)
+    has_default = has_named_default or (
+        has_default_keyword and _JS_DEFAULT_PATTERN.search(content) is not None
     )
     if has_default and not has_named_default:
         exports.append("export default")
     
-    # Find export lists - build set of existing names for efficient lookup
-    # Extract just the name part from exports (skip "export default" pattern)
-    existing_names = set()
-    for e in exports:
-        parts = e.split()
-        if len(parts) > 1 and parts[1] != 'default':
-            existing_names.add(parts[1])
-        elif len(parts) > 2:  # "export default Name"
-            existing_names.add(parts[2])
+    existing_names |= default_names
     if has_default or has_named_default:
         existing_names.add('default')
     
-    for match in export_list_pattern.finditer(content):
+    for match in _JS_EXPORT_LIST_PATTERN.finditer(content):
         export_list = match.group(1)
-        # Split by comma and clean up
+        # Split by comma; each item is matched once for its name and alias
         for item in export_list.split(','):
-            stripped = item.strip()
-            if not stripped:
+            item_match = _JS_EXPORT_ITEM_PATTERN.match(item)
+            if item_match is None:
                 continue
             # Handle "name as alias" exports - use the alias (what's exported)
-            parts = stripped.split()
-            if parts:
-                # If "as" is present, take the name after it (the alias)
-                if len(parts) >= 3 and parts[1].lower() == 'as':
-                    name = parts[2]
-                else:
-                    # No alias, use the original name
-                    name = parts[0]
-                # Ensure name is valid identifier and not already exported
-                if name and name not in existing_names:
-                    exports.append(f"export {name}")
-                    existing_names.add(name)
-    
+            # if present, otherwise the original name
+            name = item_match.group(2) or item_match.group(1)
+            # Ensure name is not already exported
+            if name not in existing_names:
+                exports.append(f"export {name}")
+                existing_names.add(name)
+    
+    # Content without "export" (which "module.exports" also contains) has
+    # already returned above
     warning = None
-    if not exports and ('export' in content or 'module.exports' in content):
+    if not exports:
         warning = "File contains exports but pattern matching may have missed some"
     
     return exports, warning
 
 
+# Languages whose declarations _parse_declarations extracts
+_DECLARATION_LANGUAGES = frozenset((
+    'Python', 'JavaScript', 'TypeScript', 'C', 'C++', 'Rust', 'ASM', 'Perl'
+))
+
+# _file_declarations results keyed by (language, BLAKE2b digest of the file's
+# bytes). Vendored and generated copies of a file are parsed once. Cleared
+# when it reaches _DECLARATION_CACHE_SIZE entries.
+_DECLARATION_CACHE: Dict[Tuple[str, bytes], Tuple[Tuple[str, ...], Optional[str]]] = {}
+_DECLARATION_CACHE_SIZE = 4096
+
+
+def _parse_declarations(
+    language: str,
+    content: str,
+    file_path: Path
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Extract top-level declarations for the detailed structure field.
+    
+    Args:
+        language: Detected language of the file
+        content: Decoded file content
+        file_path: Path to the file (only used as context by the parsers)
+    
+    Returns:
+        Tuple of (declarations, structure warning or None)
+    """
+    declarations = []
+    structure_warning = None
+    
+    # Parse declarations based on language
+    if language == "Python":
+        declarations, error = _parse_python_declarations(content)
+        if error:
+            structure_warning = error
+    elif language in ["JavaScript", "TypeScript"]:
+        declarations, warning = _parse_js_ts_exports(content)
+        if warning:
+            structure_warning = warning
+    elif language in ["C", "C++", "Rust", "ASM", "Perl"]:
+        # Use parser_adapters for low-level languages
+        try:
+            parsed = extract_symbols(language, content, file_path)
+            # Combine all symbols into declarations list
+            declarations.extend(parsed.functions)
+            declarations.extend(parsed.classes)
+            declarations.extend(parsed.variables)
+            declarations.extend(parsed.asm_labels)
+            # Add any warnings
+            if parsed.warnings:
+                structure_warning = "; ".join(parsed.warnings)
+        except (ValueError, AttributeError, KeyError) as e:
+            # Specific exceptions from parsing issues
+            structure_warning = f"Symbol extraction failed: {str(e)}"
+        except Exception as e:
+            # Unexpected errors - log for debugging
+            import traceback
+            structure_warning = f"Unexpected error in symbol extraction: {str(e)}"
+            # In a production setting, this would log the full traceback
+            # traceback.print_exc()
+    else:
+        structure_warning = f"No parser available for {language}"
+    
+    return declarations, structure_warning
+
+
+def _file_declarations(
+    language: str,
+    data: bytes,
+    content: str,
+    file_path: Path
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Extract declarations like _parse_declarations, reusing the result for
+    files with identical bytes.
+    
+    Declarations depend only on the language and the content, so copies of
+    a file share one parse. Hashing the bytes costs far less than parsing
+    them.
+    
+    Args:
+        language: Detected language of the file
+        data: Raw file content
+        content: data decoded with _decode_content
+        file_path: Path to the file (only used as context by the parsers)
+    
+    Returns:
+        Tuple of (declarations, structure warning or None); the list is the
+        caller's own
+    """
+    if language not in _DECLARATION_LANGUAGES:
+        return _parse_declarations(language, content, file_path)
+    
+    key = (language, hashlib.blake2b(data, digest_size=16).digest())
+    cached = _DECLARATION_CACHE.get(key)
+    if cached is None:
+        declarations, structure_warning = _parse_declarations(language, content, file_path)
+        if len(_DECLARATION_CACHE) >= _DECLARATION_CACHE_SIZE:
+            _DECLARATION_CACHE.clear()
+        _DECLARATION_CACHE[key] = (tuple(declarations), structure_warning)
+        return declarations, structure_warning
+    return list(cached[0]), cached[1]
+
+
+# Characters that make a glob component more than a literal
+_GLOB_MAGIC = re.compile(r'[*?[]')
+
+# A compiled glob: (root, component matchers). root is '' for relative
+# patterns, which are matched against the trailing components of a path.
+_CompiledGlob = Tuple[str, Tuple[Callable[[str], Any], ...]]
+
+
+def _split_posix(path: str) -> Tuple[str, List[str]]:
+    """
+    Split a posix path into its root and components the way PurePosixPath does.
+    
+    Empty and '.' components are dropped. The root is '//' for exactly two
+    leading slashes, '/' for any other absolute path and '' otherwise.
+    
+    Args:
+        path: Posix path or glob pattern
+    
+    Returns:
+        Tuple of (root, components)
+    """
+    if path.startswith('/'):
+        root = '//' if path.startswith('//') and not path.startswith('///') else '/'
+    else:
+        root = ''
+    return root, [part for part in path.split('/') if part and part != '.']
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_glob(pattern: str) -> _CompiledGlob:
+    """
+    Compile a glob pattern into one regex matcher per path component.
+    
+    Args:
+        pattern: Glob-style pattern (e.g., '*.py', 'src/**/*.py')
+    
+    Returns:
+        Compiled glob for _matches_any
+    
+    Raises:
+        ValueError: If the pattern is empty
+    """
+    root, parts = _split_posix(pattern)
+    if not root and not parts:
+        raise ValueError("empty pattern")
+    return root, tuple(_compile_component(part) for part in parts)
+
+
+def _is_catch_all(pattern: str) -> bool:
+    """
+    Check whether a glob pattern matches every file path.
+    
+    Only a relative single-component pattern made of '*' (such as '*' or
+    '**') does: '**/*' still needs two components under PurePath.match.
+    
+    Args:
+        pattern: Glob-style pattern
+    
+    Returns:
+        True if the pattern matches any relative file path
+    """
+    root, parts = _split_posix(pattern)
+    return not root and len(parts) == 1 and not parts[0].strip('*')
+
+
+def _compile_component(part: str) -> Callable[[str], Any]:
+    """
+    Compile one glob component, specializing the most common shapes.
+    
+    A literal component becomes an equality test and '*<literal>' (e.g.
+    '*.py') a suffix test; anything else goes through fnmatch's regex.
+    
+    Args:
+        part: Single path component of a glob pattern
+    
+    Returns:
+        Callable returning a truthy value if a path component matches
+    """
+    if not _GLOB_MAGIC.search(part):
+        return part.__eq__
+    if part.startswith('*') and not _GLOB_MAGIC.search(part, 1):
+        return functools.partial(_endswith, suffix=part[1:])
+    return re.compile(fnmatch.translate(part)).match
+
+
+def _endswith(name: str, suffix: str) -> bool:
+    """Return whether name ends with suffix (for partial application)."""
+    return name.endswith(suffix)
+
+
+def _matches_any(root: str, parts: List[str], globs: List[_CompiledGlob]) -> bool:
+    """
+    Check a split path against compiled globs with PurePath.match semantics.
+    
+    An anchored pattern must match every component; a relative pattern
+    matches the trailing components, one pattern component per path
+    component (so ** behaves like *).
+    
+    Args:
+        root: Root of the path, as returned by _split_posix
+        parts: Components of the path, as returned by _split_posix
+        globs: Patterns compiled with _compile_glob
+    
+    Returns:
+        True if the path matches any of the globs, False otherwise
+    """
+    for glob_root, matchers in globs:
+        if glob_root:
+            if glob_root != root or len(matchers) != len(parts):
+                continue
+            candidates = parts
+        else:
+            # PurePath.match also lets relative patterns match the root itself
+            candidates = [root] + parts if root else parts
+            if len(matchers) > len(candidates):
+                continue
+            candidates = candidates[len(candidates) - len(matchers):]
+        if all(match(part) for match, part in zip(matchers, candidates)):
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class _GlobSet:
+    """
+    A list of glob patterns compiled for matching together.
+    
+    Relative single-component patterns (the usual '*.py', 'Makefile' or
+    'test_*') only ever test a path's last component, so they are merged:
+    '*<literal>' patterns into one str.endswith tuple, literal names into a
+    set and the rest into one regex alternation. Anchored and
+    multi-component patterns are kept as separate compiled globs.
+    
+    PurePath.match tries patterns in order and only raises for an empty
+    pattern (such as '' or '.') once it reaches it. So only the patterns
+    before the first empty one are compiled, and a path none of them
+    matches raises ValueError if the list goes on to an empty pattern.
+    """
+    suffixes: Tuple[str, ...]
+    names: FrozenSet[str]
+    regex: Optional[Callable[[str], Any]]
+    globs: Tuple[_CompiledGlob, ...]
+    # A catch-all pattern (see _is_catch_all) is among the compiled ones
+    matches_all: bool
+    # The compiled patterns are followed by an empty pattern
+    empty_follows: bool
+    
+    def matches(self, root: str, parts: List[str]) -> bool:
+        """
+        Check a split path against the patterns with PurePath.match semantics.
+        
+        Args:
+            root: Root of the path, as returned by _split_posix
+            parts: Components of the path, as returned by _split_posix
+        
+        Returns:
+            True if the path matches any of the patterns, False otherwise
+        
+        Raises:
+            ValueError: If no pattern matches before an empty one
+        """
+        last = parts[-1] if parts else root
+        if last and (last in self.names or
+                     (self.suffixes and last.endswith(self.suffixes)) or
+                     (self.regex is not None and self.regex(last))):
+            return True
+        if self.globs and _matches_any(root, parts, self.globs):
+            return True
+        if self.empty_follows:
+            raise ValueError("empty pattern")
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_globs(patterns: Tuple[str, ...]) -> _GlobSet:
+    """
+    Compile glob patterns into a _GlobSet.
+    
+    Args:
+        patterns: Glob-style patterns (e.g., ('*.py', 'src/**/*.js'))
+    
+    Returns:
+        Compiled patterns; an empty pattern only raises once it is reached
+        (see _GlobSet)
+    """
+    suffixes = []
+    names = set()
+    regexes = []
+    globs = []
+    matches_all = False
+    empty_follows = False
+    for pattern in patterns:
+        root, parts = _split_posix(pattern)
+        if not root and not parts:
+            empty_follows = True
+            break
+        matches_all = matches_all or _is_catch_all(pattern)
+        if not root and len(parts) == 1:
+            part = parts[0]
+            if not _GLOB_MAGIC.search(part):
+                names.add(part)
+            elif part.startswith('*') and not _GLOB_MAGIC.search(part, 1):
+                suffixes.append(part[1:])
+            else:
+                regexes.append(fnmatch.translate(part))
+        else:
+            globs.append(_compile_glob(pattern))
+    regex = re.compile('|'.join(regexes)).match if regexes else None
+    return _GlobSet(
+        tuple(suffixes), frozenset(names), regex, tuple(globs),
+        matches_all, empty_follows
+    )
+
+
 def _matches_pattern(path: str, patterns: List[str]) -> bool:
     """
     Check if a path matches any of the given glob patterns.
     
-    Uses Path.match for proper glob semantics, supporting wildcards like:
+    Follows Path.match glob semantics, supporting wildcards like:
     - *.py (files ending in .py)
     - test_* (files starting with test_)
     - tests/*.py (Python files in tests directory)
     - tests/**/*.py (Python files anywhere under tests)
     - foo?.js (single-character wildcard)
     
+    Pattern lists are compiled once and cached, so repeated checks only
+    split the path and run the merged matchers.
+    
     Args:
         path: File path (relative or just filename) to check
         patterns: List of glob-style patterns
     
     Returns:
         True if path matches any pattern, False otherwise
+    
+    Raises:
+        ValueError: If no pattern matches before an empty one, as Path.match
+            raises for an empty pattern
+    """
+    root, parts = _split_posix(path)
+    return _compile_globs(tuple(patterns)).matches(root, parts)
+
+
+def _split_name(name: str) -> Tuple[str, str]:
     """
-    from pathlib import PurePosixPath
+    Split a file name into (stem, suffix) exactly as PurePath.stem/.suffix do.
     
-    # Convert to PurePosixPath for consistent matching across platforms
-    path_obj = PurePosixPath(path)
+    A leading dot (e.g., '.bashrc') or a trailing one doesn't start a suffix.
     
-    for pattern in patterns:
-        # Use Path.match for proper glob semantics including ** support
-        if path_obj.match(pattern):
-            return True
+    Args:
+        name: Final path component
     
-    return False
+    Returns:
+        Tuple of (stem, suffix), where suffix includes the dot or is ''
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ''
 
 
 def _get_language(file_path: Path) -> str:
@@ -317,8 +902,19 @@ def _get_language(file_path: Path) -> str:
     Returns:
         Language name or 'Unknown'
     """
-    extension = file_path.suffix.lower()
+    return _language_for_extension(_split_name(file_path.name)[1].lower())
+
+
+def _language_for_extension(extension: str) -> str:
+    """
+    Detect language from an already lowercased file extension.
+    
+    Args:
+        extension: Lowercased extension including the dot (e.g., '.py'), or ''
     
+    Returns:
+        Language name or 'Unknown'
+    """
     # Try registry first
     registry = get_global_registry()
     language = registry.get_language_by_extension(extension)
@@ -358,6 +954,36 @@ def _is_interface_name(name: str) -> bool:
             name[1].isupper() and name[2].islower())
 
 
+# Name and extension sets used by _apply_language_specific_heuristics
+_C_FAMILY_LANGUAGES = frozenset(('C', 'C++', 'C/C++'))
+_C_HEADER_EXTENSIONS = frozenset(('.h', '.hpp', '.hh', '.hxx'))
+_C_SOURCE_EXTENSIONS = frozenset(('.c', '.cpp', '.cc', '.cxx'))
+_C_TEMPLATE_EXTENSIONS = frozenset(('.tpp', '.tcc'))
+_C_DEFINITION_HEADER_NAMES = frozenset(('config', 'types', 'defs', 'definitions'))
+_HTML_MAIN_PAGE_NAMES = frozenset(('index', 'home', 'main'))
+_CSS_MAIN_STYLESHEET_NAMES = frozenset(('style', 'styles', 'main', 'app'))
+_SQL_SCHEMA_NAMES = frozenset(('ddl', 'create'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _language_summary(language: str, description: str) -> str:
+    """
+    Return the summary "<language> <description>".
+    
+    Most summaries are one of a few dozen such pairs, so results are cached
+    and files of the same kind share one string instead of each formatting
+    a new copy.
+    
+    Args:
+        language: Detected language name
+        description: Language-independent description of the file
+    
+    Returns:
+        Summary string
+    """
+    return f"{language} {description}"
+
+
 def _apply_language_specific_heuristics(
     language: str,
     name: str,
@@ -384,31 +1010,31 @@ def _apply_language_specific_heuristics(
     """
     
     # C/C++ specific heuristics
-    if language in ['C', 'C++', 'C/C++']:
+    if language in _C_FAMILY_LANGUAGES:
         # C/C++ headers - check for interface patterns
-        if extension in ['.h', '.hpp', '.hh', '.hxx']:
+        if extension in _C_HEADER_EXTENSIONS:
             if name_lower.endswith('_internal') or 'internal' in path_parts:
-                return f"{language} internal header (implementation details)"
-            elif name_lower in ['config', 'types', 'defs', 'definitions']:
-                return f"{language} header defining types and constants"
+                return _language_summary(language, "internal header (implementation details)")
+            elif name_lower in _C_DEFINITION_HEADER_NAMES:
+                return _language_summary(language, "header defining types and constants")
             # Check for interface naming: starts with 'I' followed by uppercase (IFoo, not image.h)
             elif _is_interface_name(name) or 'interface' in name_lower:
-                return f"{language} interface header"
+                return _language_summary(language, "interface header")
             else:
-                return f"{language} header file (declarations and interfaces)"
+                return _language_summary(language, "header file (declarations and interfaces)")
         
         # Implementation files
-        elif extension in ['.c', '.cpp', '.cc', '.cxx']:
+        elif extension in _C_SOURCE_EXTENSIONS:
             if name_lower == 'main':
-                return f"{language} program entry point"
+                return _language_summary(language, "program entry point")
             elif name_lower.endswith('_test') or name_lower.startswith('test_'):
-                return f"{language} test implementation"
+                return _language_summary(language, "test implementation")
             else:
-                return f"{language} implementation file"
+                return _language_summary(language, "implementation file")
         
         # Template files
-        elif extension in ['.tpp', '.tcc']:
-            return f"{language} template implementation"
+        elif extension in _C_TEMPLATE_EXTENSIONS:
+            return _language_summary(language, "template implementation")
     
     # Rust specific heuristics
     elif language == 'Rust':
@@ -479,7 +1105,7 @@ def _apply_language_specific_heuristics(
             return "Java data model/entity class"
         elif name.endswith('Util') or name.endswith('Utils') or name.endswith('Helper'):
             return "Java utility class (helper functions)"
-        elif path_parts and 'test' in [p.lower() for p in path_parts]:
+        elif any(p.lower() == 'test' for p in path_parts):
             return "Java test class"
         else:
             return "Java class implementation"
@@ -540,17 +1166,19 @@ def _apply_language_specific_heuristics(
     
     # HTML specific heuristics
     elif language == 'HTML':
-        if name_lower in ['index', 'home', 'main']:
+        # Lowercase the directory names once for the checks below
+        dirs_lower = {p.lower() for p in path_parts}
+        if name_lower in _HTML_MAIN_PAGE_NAMES:
             return "HTML main page (entry point)"
-        elif 'template' in name_lower or path_parts and 'templates' in [p.lower() for p in path_parts]:
+        elif 'template' in name_lower or 'templates' in dirs_lower:
             return "HTML template file"
-        elif 'component' in name_lower or path_parts and 'components' in [p.lower() for p in path_parts]:
+        elif 'component' in name_lower or 'components' in dirs_lower:
             return "HTML component template"
-        elif 'partial' in name_lower or path_parts and 'partials' in [p.lower() for p in path_parts]:
+        elif 'partial' in name_lower or 'partials' in dirs_lower:
             return "HTML partial template (reusable fragment)"
         elif 'layout' in name_lower:
             return "HTML layout template"
-        elif 'email' in name_lower or path_parts and 'email' in [p.lower() for p in path_parts]:
+        elif 'email' in name_lower or 'email' in dirs_lower:
             return "HTML email template"
         else:
             return "HTML page"
@@ -558,9 +1186,9 @@ def _apply_language_specific_heuristics(
     # CSS specific heuristics
     elif language == 'CSS':
         # Check component styles first (more specific)
-        if 'component' in name_lower or path_parts and 'components' in [p.lower() for p in path_parts]:
+        if 'component' in name_lower or any(p.lower() == 'components' for p in path_parts):
             return "CSS component styles"
-        elif name_lower in ['style', 'styles', 'main', 'app']:
+        elif name_lower in _CSS_MAIN_STYLESHEET_NAMES:
             return "CSS main stylesheet"
         elif 'theme' in name_lower or 'themes' in name_lower:
             return "CSS theme definitions"
@@ -583,9 +1211,9 @@ def _apply_language_specific_heuristics(
     
     # SQL specific heuristics
     elif language == 'SQL':
-        if 'migration' in name_lower or path_parts and 'migrations' in [p.lower() for p in path_parts]:
+        if 'migration' in name_lower or any(p.lower() == 'migrations' for p in path_parts):
             return "SQL database migration script"
-        elif 'schema' in name_lower or name_lower in ['ddl', 'create']:
+        elif 'schema' in name_lower or name_lower in _SQL_SCHEMA_NAMES:
             return "SQL schema definition (DDL)"
         elif 'seed' in name_lower or 'fixture' in name_lower:
             return "SQL seed data (test/initial data)"
@@ -608,121 +1236,243 @@ def _apply_language_specific_heuristics(
     return None
 
 
-def _detect_file_role(file_path: Path, root_path: Path) -> Tuple[str, str]:
+# Exact (lowercased) file stems mapped to (role, justification prefix).
+# Entry point and configuration names take precedence over a configuration
+# file extension; the remaining layer names do not.
+_ENTRY_CONFIG_NAME_ROLES: Dict[str, Tuple[str, str]] = {
+    **dict.fromkeys(('main', 'index', 'app', '__main__'), ("entry-point", "common entry point name")),
+    **dict.fromkeys(('config', 'configuration', 'settings'), ("configuration", "configuration file name")),
+}
+_LAYER_NAME_ROLES: Dict[str, Tuple[str, str]] = {
+    **dict.fromkeys(('cli', 'command', 'commands'), ("cli", "CLI-related name")),
+    **dict.fromkeys(('utils', 'util', 'utilities', 'helpers', 'helper'), ("utility", "utility/helper name")),
+    **dict.fromkeys(('model', 'models', 'schema', 'schemas'), ("model", "model/schema name")),
+    **dict.fromkeys(('controller', 'controllers', 'handler', 'handlers'), ("controller", "controller/handler name")),
+    **dict.fromkeys(('view', 'views', 'template', 'templates'), ("view", "view/template name")),
+    **dict.fromkeys(('service', 'services'), ("service", "service layer name")),
+    **dict.fromkeys(('repository', 'repositories', 'dao'), ("data-access", "data access name")),
+}
+
+# Substrings of the file stem mapped to the category they imply, in
+# priority order
+_NAME_TERMS: Tuple[Tuple[str, str], ...] = (
+    ('api', 'api'),
+    ('db', 'database'),
+    ('database', 'database'),
+    ('router', 'router'),
+    ('routes', 'router'),
+    ('middleware', 'middleware'),
+)
+
+# Name-term categories mapped to (role, justification)
+_NAME_TERM_ROLES: Dict[str, Tuple[str, str]] = {
+    'api': ("api", "filename contains 'api'"),
+    'database': ("database", "filename contains database-related term"),
+    'router': ("router", "filename contains routing term"),
+    'middleware': ("middleware", "filename contains 'middleware'"),
+}
+
+_CONFIG_EXTENSIONS = frozenset(('.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf'))
+_COMPONENT_EXTENSIONS = frozenset(('.jsx', '.tsx', '.vue'))
+
+# Top-level directories (lowercased) that determine a role late in detection
+_TOP_DIR_ROLES: Dict[str, str] = {
+    **dict.fromkeys(('docs', 'documentation'), "documentation"),
+    **dict.fromkeys(('scripts', 'bin'), "script"),
+    **dict.fromkeys(('examples', 'demos', 'samples'), "example"),
+}
+
+
+def _relative_parts(file_path: Path, root_path: Path) -> Optional[List[str]]:
     """
-    Detect the role/purpose of a file based on its name and path.
+    Split a file's path relative to the root into components.
+    
+    Gives the same components as file_path.relative_to(root_path).parts.
+    Paths from scan_files start with the root's own string, so they are
+    split as strings without building an intermediate Path; anything else
+    falls back to relative_to.
     
     Args:
         file_path: Path to the file
         root_path: Root path of the repository
     
     Returns:
-        Tuple of (role string, justification string)
+        Relative path components ending with the file name, or None if
+        file_path is not under root_path
     """
-    name = file_path.stem
-    name_lower = name.lower()
-    extension = file_path.suffix.lower()
-    
-    # Get relative path for context
+    path = os.fspath(file_path)
+    prefix = os.fspath(root_path)
+    if not prefix.endswith(os.sep):
+        prefix += os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):].split(os.sep)
     try:
-        rel_path = file_path.relative_to(root_path)
-        path_parts = list(rel_path.parent.parts)
+        return list(file_path.relative_to(root_path).parts)
     except ValueError:
-        path_parts = []
+        return None
+
+
+def _name_facts(file_path: Path, root_path: Path) -> Tuple[str, str, str, List[str], str]:
+    """
+    Extract the name and path facts that role and summary heuristics use.
     
-    # Test files
-    if name_lower.startswith('test_'):
-        return "test", f"filename starts with 'test_'"
-    if name_lower.endswith('_test'):
-        return "test", f"filename ends with '_test'"
-    # Only match "test" as exact name, not as prefix to avoid false positives like "testament.py"
-    if name_lower == 'test':
-        return "test", f"filename is 'test'"
-    if path_parts and path_parts[0].lower() in ['tests', 'test']:
-        return "test", f"located in '{path_parts[0]}' directory"
+    Args:
+        file_path: Path to the file
+        root_path: Root path of the repository
     
-    # Entry point files
-    if name_lower in ['main', 'index', 'app', '__main__']:
-        return "entry-point", f"common entry point name '{name_lower}'"
+    Returns:
+        Tuple of (stem, lowercased stem, lowercased extension, directory
+        components relative to root_path, lowercased top-level directory or
+        '' for files at the root)
+    """
+    name, suffix = _split_name(file_path.name)
     
-    # Configuration files
-    if name_lower in ['config', 'configuration', 'settings']:
-        return "configuration", f"configuration file name '{name_lower}'"
-    if extension in ['.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf']:
-        return "configuration", f"configuration file extension '{extension}'"
+    # Get relative path for context
+    rel_parts = _relative_parts(file_path, root_path)
+    path_parts = rel_parts[:-1] if rel_parts is not None else []
     
-    # CLI files
-    if name_lower in ['cli', 'command', 'commands']:
-        return "cli", f"CLI-related name '{name_lower}'"
+    top_dir = path_parts[0].lower() if path_parts else ''
+    return name, name.lower(), suffix.lower(), path_parts, top_dir
+
+
+@functools.lru_cache(maxsize=4096)
+def _name_term(name_lower: str) -> Optional[str]:
+    """
+    Return the category of the highest-priority term in a file stem.
     
-    # Utility files
-    if name_lower in ['utils', 'util', 'utilities', 'helpers', 'helper']:
-        return "utility", f"utility/helper name '{name_lower}'"
+    Role detection and summary generation both ask for this, and stems
+    repeat across a repository, so results are cached.
     
-    # Model/schema files
-    if name_lower in ['model', 'models', 'schema', 'schemas']:
-        return "model", f"model/schema name '{name_lower}'"
+    Args:
+        name_lower: Lowercased file stem
     
-    # Controller/handler files
-    if name_lower in ['controller', 'controllers', 'handler', 'handlers']:
-        return "controller", f"controller/handler name '{name_lower}'"
+    Returns:
+        Category from _NAME_TERMS, or None if no term occurs in the stem
+    """
+    for term, category in _NAME_TERMS:
+        if term in name_lower:
+            return category
+    return None
+
+
+def _detect_file_role(file_path: Path, root_path: Path) -> Tuple[str, str]:
+    """
+    Detect the role/purpose of a file based on its name and path.
     
-    # View/template files
-    if name_lower in ['view', 'views', 'template', 'templates']:
-        return "view", f"view/template name '{name_lower}'"
+    Args:
+        file_path: Path to the file
+        root_path: Root path of the repository
     
-    # Service layer files
-    if name_lower in ['service', 'services']:
-        return "service", f"service layer name '{name_lower}'"
+    Returns:
+        Tuple of (role string, justification string)
+    """
+    _, name_lower, extension, path_parts, _ = _name_facts(file_path, root_path)
+    return _role_from_facts(name_lower, extension, path_parts[0] if path_parts else '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _role_from_facts(name_lower: str, extension: str, first_dir: str) -> Tuple[str, str]:
+    """
+    Detect a file's role from facts already extracted by _name_facts.
     
-    # Data access layer
-    if name_lower in ['repository', 'repositories', 'dao']:
-        return "data-access", f"data access name '{name_lower}'"
+    The role depends only on these three facts, which repeat across a
+    repository (__init__.py files, common stems under src/ or tests/), so
+    results are cached.
     
-    # API files
-    if 'api' in name_lower:
-        return "api", f"filename contains 'api'"
+    Args:
+        name_lower: Lowercased file stem
+        extension: Lowercased file extension
+        first_dir: Top-level directory relative to the repository root, as
+            written ('' for files at the root)
     
-    # Database files
-    if 'db' in name_lower or 'database' in name_lower:
-        return "database", f"filename contains database-related term"
+    Returns:
+        Tuple of (role string, justification string)
+    """
+    # Test files
+    if name_lower.startswith('test_'):
+        return "test", f"filename starts with 'test_'"
+    if name_lower.endswith('_test'):
+        return "test", f"filename ends with '_test'"
+    # Only match "test" as exact name, not as prefix to avoid false positives like "testament.py"
+    if name_lower == 'test':
+        return "test", f"filename is 'test'"
+    top_dir = first_dir.lower()
+    if top_dir in ('tests', 'test'):
+        return "test", f"located in '{first_dir}' directory"
+    
+    # Entry point and configuration names
+    named_role = _ENTRY_CONFIG_NAME_ROLES.get(name_lower)
+    if named_role:
+        return named_role[0], f"{named_role[1]} '{name_lower}'"
+    
+    # Configuration files
+    if extension in _CONFIG_EXTENSIONS:
+        return "configuration", f"configuration file extension '{extension}'"
     
-    # Router files
-    if 'router' in name_lower or 'routes' in name_lower:
-        return "router", f"filename contains routing term"
+    # CLI, utility, model, controller, view, service and data access names
+    named_role = _LAYER_NAME_ROLES.get(name_lower)
+    if named_role:
+        return named_role[0], f"{named_role[1]} '{name_lower}'"
     
-    # Middleware files
-    if 'middleware' in name_lower:
-        return "middleware", f"filename contains 'middleware'"
+    # API, database, router and middleware files
+    name_term = _name_term(name_lower)
+    if name_term:
+        return _NAME_TERM_ROLES[name_term]
     
     # Component files (for JS/TS frameworks)
-    if extension in ['.jsx', '.tsx', '.vue']:
+    if extension in _COMPONENT_EXTENSIONS:
         return "component", f"component file extension '{extension}'"
     if 'component' in name_lower:
         return "component", f"filename contains 'component'"
     
     # Module initialization
-    if name_lower in ['__init__', 'mod']:
+    if name_lower in ('__init__', 'mod'):
         return "module-init", f"module initialization file '{name_lower}'"
     
     # Documentation
-    if extension in ['.md', '.rst']:
+    if extension in ('.md', '.rst'):
         return "documentation", f"documentation file extension '{extension}'"
-    if path_parts and path_parts[0].lower() in ['docs', 'documentation']:
-        return "documentation", f"located in '{path_parts[0]}' directory"
-    
-    # Scripts
-    if path_parts and path_parts[0].lower() in ['scripts', 'bin']:
-        return "script", f"located in '{path_parts[0]}' directory"
     
-    # Examples
-    if path_parts and path_parts[0].lower() in ['examples', 'demos', 'samples']:
-        return "example", f"located in '{path_parts[0]}' directory"
+    # Documentation, scripts and examples by top-level directory
+    dir_role = _TOP_DIR_ROLES.get(top_dir)
+    if dir_role:
+        return dir_role, f"located in '{first_dir}' directory"
     
     # Default to "implementation"
     return "implementation", "general implementation file (default classification)"
 
 
+# Exact (lowercased) file stems mapped to the summary after the language name
+_NAME_SUMMARIES: Dict[str, str] = {
+    **dict.fromkeys(('config', 'configuration', 'settings'), "configuration file"),
+    **dict.fromkeys(('main', 'index', 'app', '__main__'), "main entry point"),
+    **dict.fromkeys(('cli', 'command', 'commands'), "command-line interface"),
+    **dict.fromkeys(('utils', 'util', 'utilities', 'helpers', 'helper'), "utility functions"),
+    **dict.fromkeys(('model', 'models', 'schema', 'schemas'), "data models"),
+    **dict.fromkeys(('controller', 'controllers', 'handler', 'handlers'), "request handlers"),
+    **dict.fromkeys(('view', 'views', 'template', 'templates'), "view templates"),
+    **dict.fromkeys(('service', 'services'), "service layer"),
+    **dict.fromkeys(('repository', 'repositories', 'dao'), "data access layer"),
+}
+
+# Name-term categories mapped to the summary after the language name
+_NAME_TERM_SUMMARIES: Dict[str, str] = {
+    'api': "API implementation",
+    'database': "database operations",
+    'router': "routing configuration",
+    'middleware': "middleware component",
+}
+
+# Top-level directories (lowercased) mapped to a path-based summary
+_TOP_DIR_SUMMARIES: Dict[str, str] = {
+    **dict.fromkeys(('tests', 'test'), "test implementation"),
+    **dict.fromkeys(('src', 'lib', 'core'), "core implementation"),
+    **dict.fromkeys(('scripts', 'bin'), "utility script"),
+    **dict.fromkeys(('docs', 'documentation'), "documentation file"),
+    **dict.fromkeys(('examples', 'demos', 'samples'), "example code"),
+}
+
+
 def _generate_heuristic_summary(file_path: Path, root_path: Path) -> str:
     """
     Generate a deterministic summary based on filename, path, and extension.
@@ -734,20 +1484,36 @@ def _generate_heuristic_summary(file_path: Path, root_path: Path) -> str:
     Returns:
         Summary string
     """
-    name = file_path.stem
-    extension = file_path.suffix.lower()
-    language = _get_language(file_path)
-    
-    # Get relative path for context
-    try:
-        rel_path = file_path.relative_to(root_path)
-        path_parts = list(rel_path.parent.parts)
-    except ValueError:
-        path_parts = []
+    name, name_lower, extension, path_parts, top_dir = _name_facts(file_path, root_path)
+    return _summary_from_facts(
+        _get_language(file_path), name, name_lower, extension, path_parts, top_dir, file_path
+    )
+
+
+def _summary_from_facts(
+    language: str,
+    name: str,
+    name_lower: str,
+    extension: str,
+    path_parts: List[str],
+    top_dir: str,
+    file_path: Path
+) -> str:
+    """
+    Generate a heuristic summary from facts already extracted by _name_facts.
     
-    # Heuristics based on filename patterns
-    name_lower = name.lower()
+    Args:
+        language: Detected language name
+        name: File stem
+        name_lower: Lowercased file stem
+        extension: Lowercased file extension
+        path_parts: Directory components relative to the repository root
+        top_dir: Lowercased top-level directory ('' at the root)
+        file_path: Full path to the file
     
+    Returns:
+        Summary string
+    """
     # Language-specific heuristics (applied first for better specificity)
     language_summary = _apply_language_specific_heuristics(
         language, name, name_lower, extension, path_parts, file_path
@@ -755,89 +1521,38 @@ def _generate_heuristic_summary(file_path: Path, root_path: Path) -> str:
     if language_summary:
         return language_summary
     
-    # Configuration files
-    if name_lower in ['config', 'configuration', 'settings']:
-        return f"{language} configuration file"
-    
     # Test files
     if name_lower.startswith('test_') or name_lower.endswith('_test'):
-        return f"{language} test file"
+        return _language_summary(language, "test file")
     # Only match "test" as exact name to avoid false positives
     if name_lower == 'test':
-        return f"{language} test file"
-    
-    # Main/entry point files
-    if name_lower in ['main', 'index', 'app', '__main__']:
-        return f"{language} main entry point"
-    
-    # CLI files
-    if name_lower in ['cli', 'command', 'commands']:
-        return f"{language} command-line interface"
-    
-    # Utility/helper files
-    if name_lower in ['utils', 'util', 'utilities', 'helpers', 'helper']:
-        return f"{language} utility functions"
-    
-    # Model files
-    if name_lower in ['model', 'models', 'schema', 'schemas']:
-        return f"{language} data models"
-    
-    # Controller/handler files
-    if name_lower in ['controller', 'controllers', 'handler', 'handlers']:
-        return f"{language} request handlers"
-    
-    # View/template files
-    if name_lower in ['view', 'views', 'template', 'templates']:
-        return f"{language} view templates"
-    
-    # Service files
-    if name_lower in ['service', 'services']:
-        return f"{language} service layer"
-    
-    # Repository/DAO files
-    if name_lower in ['repository', 'repositories', 'dao']:
-        return f"{language} data access layer"
-    
-    # API files
-    if 'api' in name_lower:
-        return f"{language} API implementation"
+        return _language_summary(language, "test file")
     
-    # Database files
-    if 'db' in name_lower or 'database' in name_lower:
-        return f"{language} database operations"
+    # Configuration, entry point and layer names (none of which look like
+    # test files, so checking them after the test rules is equivalent)
+    named_summary = _NAME_SUMMARIES.get(name_lower)
+    if named_summary:
+        return _language_summary(language, named_summary)
     
-    # Router files
-    if 'router' in name_lower or 'routes' in name_lower:
-        return f"{language} routing configuration"
-    
-    # Middleware files
-    if 'middleware' in name_lower:
-        return f"{language} middleware component"
+    # API, database, router and middleware files
+    name_term = _name_term(name_lower)
+    if name_term:
+        return _language_summary(language, _NAME_TERM_SUMMARIES[name_term])
     
     # Component files (for JS/TS frameworks)
-    if extension in ['.jsx', '.tsx', '.vue'] or 'component' in name_lower:
-        return f"{language} UI component"
+    if extension in _COMPONENT_EXTENSIONS or 'component' in name_lower:
+        return _language_summary(language, "UI component")
     
-    # Package/module initialization
-    if name_lower in ['__init__', 'index', 'mod']:
+    # Package/module initialization ('index' is already an entry point)
+    if name_lower in ('__init__', 'mod'):
         if 'tests' in path_parts or 'test' in path_parts:
-            return f"{language} test module initialization"
-        return f"{language} module initialization"
+            return _language_summary(language, "test module initialization")
+        return _language_summary(language, "module initialization")
     
     # Path-based heuristics
-    if path_parts:
-        top_dir = path_parts[0].lower()
-        
-        if top_dir in ['tests', 'test']:
-            return f"{language} test implementation"
-        elif top_dir in ['src', 'lib', 'core']:
-            return f"{language} core implementation"
-        elif top_dir in ['scripts', 'bin']:
-            return f"{language} utility script"
-        elif top_dir in ['docs', 'documentation']:
-            return f"{language} documentation file"
-        elif top_dir in ['examples', 'demos', 'samples']:
-            return f"{language} example code"
+    dir_summary = _TOP_DIR_SUMMARIES.get(top_dir)
+    if dir_summary:
+        return _language_summary(language, dir_summary)
     
     # Default: descriptive summary based on language and name
     # Convert snake_case or kebab-case to words
@@ -849,12 +1564,51 @@ def _generate_heuristic_summary(file_path: Path, root_path: Path) -> str:
         return f"Source file for {words}"
 
 
+def _analyze_file(
+    file_path: Path,
+    root_path: Path,
+    include_summary: bool = True
+) -> Tuple[str, str, str, Optional[str]]:
+    """
+    Detect a file's language, role and heuristic summary in one pass.
+    
+    Equivalent to calling _get_language, _detect_file_role and
+    _generate_heuristic_summary, but the name and path facts are extracted
+    and the language looked up only once.
+    
+    Args:
+        file_path: Path to the file
+        root_path: Root path of the repository
+        include_summary: Whether to generate the heuristic summary
+    
+    Returns:
+        Tuple of (language, role, role justification, summary), where summary
+        is None if include_summary is False
+    """
+    name, name_lower, extension, path_parts, top_dir = _name_facts(file_path, root_path)
+    language = _language_for_extension(extension)
+    role, role_justification = _role_from_facts(
+        name_lower, extension, path_parts[0] if path_parts else ''
+    )
+    # Language and role are shared registry/table constants, but formatted
+    # justifications would otherwise be a fresh copy of one of a few dozen
+    # distinct strings per file
+    role_justification = sys.intern(role_justification)
+    summary = None
+    if include_summary:
+        summary = _summary_from_facts(
+            language, name, name_lower, extension, path_parts, top_dir, file_path
+        )
+    return language, role, role_justification, summary
+
+
 def _create_structured_summary(
     file_path: Path,
     root_path: Path,
     detail_level: DetailLevel = "standard",
     include_legacy: bool = True,
-    max_file_size_kb: int = 1024
+    max_file_size_kb: int = 1024,
+    include_summary_text: bool = False
 ) -> Dict[str, Any]:
     """
     Create a structured summary for a file with metadata.
@@ -865,105 +1619,108 @@ def _create_structured_summary(
         detail_level: Level of detail ("minimal", "standard", "detailed")
         include_legacy: Whether to include legacy summary field
         max_file_size_kb: Maximum file size in KB for expensive parsing (default 1024)
+        include_summary_text: Whether to repeat the legacy summary under the
+            summary_text key (only applies when include_legacy is True)
     
     Returns:
         Dictionary with structured summary data
     """
-    try:
-        rel_path = file_path.relative_to(root_path)
-    except ValueError:
-        rel_path = file_path
+    return _summarize_file(
+        file_path, root_path, detail_level, include_legacy,
+        max_file_size_kb, include_summary_text
+    )[0]
+
+
+def _summarize_file(
+    file_path: Path,
+    root_path: Path,
+    detail_level: DetailLevel = "standard",
+    include_legacy: bool = True,
+    max_file_size_kb: int = 1024,
+    include_summary_text: bool = False
+) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+    """
+    Create a structured summary for a file, along with the imports its
+    external dependencies were classified from.
+    
+    The summary cache keeps the imports, so the external dependencies of an
+    unchanged file can be classified again without reading it.
+    
+    Args:
+        file_path: Path to the file
+        root_path: Root path of the repository
+        detail_level: Level of detail ("minimal", "standard", "detailed")
+        include_legacy: Whether to include legacy summary field
+        max_file_size_kb: Maximum file size in KB for expensive parsing (default 1024)
+        include_summary_text: Whether to repeat the legacy summary under the
+            summary_text key (only applies when include_legacy is True)
+    
+    Returns:
+        Tuple of (summary, imports) where imports is None for summaries
+        without external dependencies
+    """
+    rel_parts = _relative_parts(file_path, root_path)
+    rel_path = '/'.join(rel_parts) if rel_parts is not None else file_path.as_posix()
     
-    language = _get_language(file_path)
-    role, role_justification = _detect_file_role(file_path, root_path)
+    language, role, role_justification, base_summary = _analyze_file(
+        file_path, root_path, include_legacy
+    )
     
     # Build the structured summary with deterministic key ordering
     summary = {
         "schema_version": SCHEMA_VERSION,
-        "path": str(rel_path.as_posix()),
+        "path": rel_path,
         "language": language,
         "role": role,
         "role_justification": role_justification,
     }
     
-    # Read file content for analysis (if needed)
+    # Read file content for analysis (if needed). Files are read as bytes and
+    # decoded only for the steps that need text.
+    data = None
     content = None
     file_too_large = False
     parse_error = None
     
-    try:
-        file_size = file_path.stat().st_size
-        file_size_kb = file_size / 1024
-        
-        # Skip expensive parsing for large files, but still read for basic metrics
-        if file_size_kb > max_file_size_kb:
-            file_too_large = True
-            # For large files, still read content for LOC/TODO if at standard/detailed level
-            # but skip declaration parsing
-            if detail_level in ["standard", "detailed"]:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                except (OSError, IOError) as e:
-                    parse_error = f"Failed to read file: {str(e)}"
-        else:
+    file_size = 0
+    
+    # Size and content only feed metrics and structure, which minimal
+    # summaries don't include, so skip the file I/O entirely for them
+    if detail_level in ["standard", "detailed"]:
+        try:
+            file_size, data = _read_file(file_path)
+            # Large files are still read for LOC/TODO metrics, but skip
+            # expensive declaration parsing
+            file_too_large = file_size / 1024 > max_file_size_kb
+        except (OSError, IOError) as e:
+            # A file that exists but can't be read records a parse error;
+            # one that can't even be stat()ed just reports size 0
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-            except (OSError, IOError) as e:
+                file_size = file_path.stat().st_size
+            except (OSError, IOError):
+                file_size = 0
+            else:
+                file_too_large = file_size / 1024 > max_file_size_kb
                 parse_error = f"Failed to read file: {str(e)}"
-    except (OSError, IOError):
-        file_size = 0
     
     # Parse structure first if at detailed level (needed for enhanced summaries)
     declarations = []
     structure_warning = None
     
     if detail_level == "detailed":
+        if data is not None and not file_too_large:
+            content = _decode_content(data)
         if file_too_large:
             structure_warning = f"File exceeds {max_file_size_kb}KB limit, skipping expensive parsing"
         elif parse_error:
             structure_warning = parse_error
         elif content is not None:
-            # Parse declarations based on language
-            if language == "Python":
-                declarations, error = _parse_python_declarations(content)
-                if error:
-                    structure_warning = error
-            elif language in ["JavaScript", "TypeScript"]:
-                declarations, warning = _parse_js_ts_exports(content)
-                if warning:
-                    structure_warning = warning
-            elif language in ["C", "C++", "Rust", "ASM", "Perl"]:
-                # Use parser_adapters for low-level languages
-                from repo_analyzer.parser_adapters import extract_symbols
-                try:
-                    parsed = extract_symbols(language, content, file_path)
-                    # Combine all symbols into declarations list
-                    declarations.extend(parsed.functions)
-                    declarations.extend(parsed.classes)
-                    declarations.extend(parsed.variables)
-                    declarations.extend(parsed.asm_labels)
-                    # Add any warnings
-                    if parsed.warnings:
-                        structure_warning = "; ".join(parsed.warnings)
-                except (ValueError, AttributeError, KeyError) as e:
-                    # Specific exceptions from parsing issues
-                    structure_warning = f"Symbol extraction failed: {str(e)}"
-                except Exception as e:
-                    # Unexpected errors - log for debugging
-                    import traceback
-                    structure_warning = f"Unexpected error in symbol extraction: {str(e)}"
-                    # In a production setting, this would log the full traceback
-                    # traceback.print_exc()
-            else:
-                structure_warning = f"No parser available for {language}"
+            declarations, structure_warning = _file_declarations(
+                language, data, content, file_path
+            )
     
     # Add legacy summary field for backward compatibility
     if include_legacy:
-        # Generate enhanced summary that includes structure info when available
-        base_summary = _generate_heuristic_summary(file_path, root_path)
-        
         # Enhance summary with role and structure information
         summary_parts = [base_summary]
         
@@ -981,8 +1738,9 @@ def _create_structured_summary(
             summary_parts.append(f"[{decl_summary}]")
         
         summary["summary"] = " ".join(summary_parts)
-        # Also add as summary_text for additional compatibility
-        summary["summary_text"] = summary["summary"]
+        # summary_text is an exact copy of summary, only emitted on request
+        if include_summary_text:
+            summary["summary_text"] = summary["summary"]
     
     # Add metrics based on detail level
     if detail_level in ["standard", "detailed"]:
@@ -991,9 +1749,8 @@ def _create_structured_summary(
         }
         
         # Add LOC and TODO counts if we have content
-        if content is not None:
-            metrics["loc"] = _count_lines_of_code(content)
-            metrics["todo_count"] = _count_todos(content)
+        if data is not None:
+            metrics["loc"], metrics["todo_count"] = _scan_content(data, content)
         
         summary["metrics"] = metrics
     
@@ -1012,29 +1769,78 @@ def _create_structured_summary(
     
     # Add dependencies field for detailed level
     if detail_level == "detailed":
-        # Get external dependencies for this file
-        from repo_analyzer.dependency_graph import _scan_file_dependencies_with_external
-        
-        external_deps = {'stdlib': [], 'third-party': []}
-        
-        # Only scan supported file types
-        if language in ['Python', 'JavaScript', 'TypeScript']:
-            try:
-                _, external_deps = _scan_file_dependencies_with_external(file_path, root_path)
-            except (IOError, OSError):
-                # If we can't read the file, leave dependencies empty
-                pass
+        # The file isn't read again for its imports. The content decoded
+        # above is what the scanner would read, unless the file extends past
+        # the part it scans; files too large to have been decoded have their
+        # scanned part decoded from the bytes already read.
+        scan_content = None
+        if content is not None and len(data) <= _MAX_IMPORT_SCAN_BYTES:
+            scan_content = content
+        elif data is not None:
+            scan_content = _decode_source(data, len(data))
         
+        imports = _file_imports(language, file_path, scan_content)
         summary["dependencies"] = {
             "imports": [],  # Placeholder for future enhancement (would list all imports)
             "exports": [],  # Placeholder for future enhancement (would list all exports)
-            "external": {
-                "stdlib": sorted(external_deps.get('stdlib', [])),
-                "third-party": sorted(external_deps.get('third-party', []))
-            }
+            "external": _external_dependencies(file_path, root_path, imports)
         }
+        return summary, imports
+    
+    return summary, None
+
+
+def _file_imports(
+    language: str,
+    file_path: Path,
+    content: Optional[str] = None
+) -> List[str]:
+    """
+    Parse the imports of a file whose external dependencies are reported.
+    
+    Args:
+        language: Detected language of the file
+        file_path: Path to the file
+        content: Decoded source to scan, or None to read the file
+    
+    Returns:
+        Import paths in source order (empty for other languages, or if the
+        file can't be read)
+    """
+    # Only scan supported file types
+    if language in ['Python', 'JavaScript', 'TypeScript']:
+        try:
+            return _parse_file_imports(file_path, content)
+        except (IOError, OSError):
+            # If we can't read the file, leave dependencies empty
+            pass
+    return []
+
+
+def _external_dependencies(
+    file_path: Path,
+    root_path: Path,
+    imports: List[str]
+) -> Dict[str, List[str]]:
+    """
+    Classify a file's imports that don't resolve within the repository.
+    
+    Args:
+        file_path: Path to the file
+        root_path: Root path of the repository
+        imports: Import paths from _file_imports
     
-    return summary
+    Returns:
+        Sorted 'stdlib' and 'third-party' module names
+    """
+    external_deps = {'stdlib': [], 'third-party': []}
+    if imports:
+        _, external_deps = _resolve_file_imports(file_path, root_path, imports)
+    
+    return {
+        "stdlib": sorted(external_deps.get('stdlib', [])),
+        "third-party": sorted(external_deps.get('third-party', []))
+    }
 
 
 def scan_files(
@@ -1046,6 +1852,9 @@ def scan_files(
     """
     Scan directory for files matching include patterns and not matching exclude patterns.
     
+    Only regular files are returned: symlinks and special files (FIFOs,
+    sockets, devices) are skipped.
+    
     Args:
         root_path: Root directory to scan
         include_patterns: List of patterns to include (e.g., ['*.py', '*.js'])
@@ -1055,72 +1864,410 @@ def scan_files(
     Returns:
         List of file paths matching the criteria
     """
-    if include_patterns is None:
-        include_patterns = []
-    if exclude_patterns is None:
-        exclude_patterns = []
     if exclude_dirs is None:
         exclude_dirs = set()
     
+    # Compile each pattern list once for the whole walk. A catch-all include
+    # pattern admits every file, so include filtering is skipped entirely.
+    include_globs = None
+    if include_patterns:
+        include_globs = _compile_globs(tuple(include_patterns))
+        if include_globs.matches_all:
+            include_globs = None
+    exclude_globs = _compile_globs(tuple(exclude_patterns)) if exclude_patterns else None
+    
+    def is_excluded_dir(dir_parts: List[str]) -> bool:
+        # Check the directory path itself and with a trailing /* to catch
+        # directory-based patterns
+        return (exclude_globs.matches('', dir_parts) or
+                exclude_globs.matches('', dir_parts + ['*']))
+    
+    # (sort key, absolute path) pairs
     matching_files = []
     
-    for dirpath, dirnames, filenames in os.walk(root_path, followlinks=False):
-        # Get relative directory path for pattern matching
+    # The root directory itself is checked as '.', which has no components
+    if exclude_globs and is_excluded_dir([]):
+        return []
+    
+    # Depth-first walk over os.scandir, whose DirEntry objects answer the
+    # directory, file and symlink checks without a separate stat per entry.
+    # Relative paths are carried as component lists, the form the compiled
+    # globs match against, so they are extended per entry instead of being
+    # rebuilt and re-split from strings. Each directory also carries the
+    # sort-key prefix of its entries (see the sort below).
+    stack = [(os.fspath(root_path), [], '')]
+    while stack:
+        dirpath, dir_parts, dir_key = stack.pop()
         try:
-            rel_dirpath = Path(dirpath).relative_to(root_path).as_posix()
-        except ValueError:
-            rel_dirpath = ""
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
         
-        # Check if current directory should be excluded based on patterns
-        if rel_dirpath and exclude_patterns:
-            # Check if the directory path itself matches any exclude pattern
-            # Also check with trailing /* to catch directory-based patterns
-            if (_matches_pattern(rel_dirpath, exclude_patterns) or 
-                _matches_pattern(rel_dirpath + '/*', exclude_patterns)):
-                # Skip this entire directory tree
-                dirnames[:] = []
+        for entry in entries:
+            # Symlinked files and directories are both skipped. Checking that
+            # first lets is_dir() answer from the dirent type without
+            # following (and stat-ing) the link.
+            if entry.is_symlink():
                 continue
-        
-        # Filter out excluded directories (modifies dirnames in-place)
-        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
-        
-        # Filter out hidden directories (starting with .)
-        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
-        
-        # Also filter symlinked directories
-        dirnames[:] = [d for d in dirnames if not (Path(dirpath) / d).is_symlink()]
-        
-        for filename in sorted(filenames):
-            file_path = Path(dirpath) / filename
             
-            # Skip symlinks
-            if file_path.is_symlink():
+            name = entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            
+            parts = dir_parts + [name]
+            
+            if is_dir:
+                # Skip excluded and hidden directories
+                if name in exclude_dirs or name.startswith('.'):
+                    continue
+                # Skip the entire directory tree if it matches an exclude pattern
+                if exclude_globs and is_excluded_dir(parts):
+                    continue
+                stack.append((entry.path, parts, dir_key + name + '\0'))
                 continue
             
-            # Get relative path for pattern matching (use POSIX style for consistency)
+            # Special files are skipped; reading a FIFO would block
             try:
-                rel_path = file_path.relative_to(root_path).as_posix()
-            except ValueError:
-                # If file is not relative to root_path, use the filename
-                rel_path = filename
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            
+            # Matching the relative path covers matching just the filename
+            # too: only single-component relative patterns can match a bare
+            # filename, and they test the relative path's last component
             
             # Check include patterns (if any)
-            # Try matching both the relative path and just the filename for flexibility
-            if include_patterns:
-                matches = _matches_pattern(rel_path, include_patterns) or _matches_pattern(filename, include_patterns)
-                if not matches:
-                    continue
+            if include_globs and not include_globs.matches('', parts):
+                continue
             
             # Check exclude patterns
-            if exclude_patterns:
-                excludes = _matches_pattern(rel_path, exclude_patterns) or _matches_pattern(filename, exclude_patterns)
-                if excludes:
-                    continue
+            if exclude_globs and exclude_globs.matches('', parts):
+                continue
             
-            matching_files.append(file_path)
+            matching_files.append((dir_key + name, entry.path))
+    
+    # Sort once at the end for deterministic ordering. Every path shares the
+    # root prefix, so Path ordering is ordering by relative components. The
+    # key joins those components with NUL, which sorts below every character
+    # a file name can contain, so plain string comparison gives the same
+    # order without keeping a component list alive per matched file.
+    matching_files.sort()
+    return [Path(path) for _, path in matching_files]
+
+
+def _entry_json(entry: Dict[str, Any]) -> bytes:
+    """
+    Serialize one structured summary with two-space indentation.
     
-    # Sort for deterministic ordering
-    return sorted(matching_files)
+    Uses orjson when it is installed, otherwise the json module. Both keep
+    insertion key order and produce the same bytes: the same layout, with
+    non-ASCII characters written as UTF-8. The result is UTF-8 bytes, which
+    orjson produces directly, so they are written without a decode and
+    re-encode round trip.
+    
+    Strings that are not valid Unicode (such as undecodable file names) can't
+    be written as UTF-8; entries holding one are written with \\u escapes,
+    whichever serializer is used.
+    
+    Args:
+        entry: Structured summary from _create_structured_summary
+    
+    Returns:
+        UTF-8 encoded JSON for the entry
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    else:
+        try:
+            return json.dumps(entry, indent=2, ensure_ascii=False).encode('utf-8')
+        except UnicodeEncodeError:
+            pass
+    return json.dumps(entry, indent=2).encode('utf-8')
+
+
+def _summary_cache_context(
+    root_path: Path,
+    options: Tuple[Any, ...]
+) -> str:
+    """
+    Fingerprint everything besides a file's own contents that its cached
+    summary depends on.
+    
+    Covers the package and cache versions, the modification time and size of
+    the package's own modules (so an edited installation doesn't reuse
+    summaries made by different code under the same version), the root, the
+    summary options and the language registry configuration. The external
+    dependencies in detailed summaries also depend on which other files
+    exist, anywhere in the tree, so they are never taken from the cache; the
+    cache keeps each file's imports instead (see generate_file_summaries).
+    
+    Args:
+        root_path: Root directory being scanned
+        options: Summary options passed to _create_structured_summary
+    
+    Returns:
+        Hex digest identifying the context
+    """
+    package_files = []
+    with os.scandir(os.path.dirname(os.path.abspath(__file__))) as entries:
+        for entry in entries:
+            if entry.name.endswith('.py'):
+                stat = entry.stat()
+                package_files.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    package_files.sort()
+    
+    context = json.dumps([
+        __version__,
+        _SUMMARY_CACHE_VERSION,
+        package_files,
+        str(root_path),
+        list(options),
+        get_global_registry().to_dict(),
+    ])
+    return hashlib.sha256(context.encode('utf-8', 'surrogateescape')).hexdigest()
+
+
+def _load_summary_cache(cache_path: Path, context: str) -> Dict[str, list]:
+    """
+    Load cached summaries written by a previous run in the same context.
+    
+    A missing, unreadable or malformed cache, or one written in a different
+    context, is treated as empty.
+    
+    Args:
+        cache_path: Path of the cache file
+        context: Fingerprint from _summary_cache_context
+    
+    Returns:
+        Mapping of relative file path to [mtime_ns, size_bytes, summary, imports]
+    """
+    try:
+        data = cache_path.read_bytes()
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("context") != context:
+        return {}
+    entries = cache.get("files")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_summary_cache(
+    cache_path: Path,
+    context: str,
+    entries: Dict[str, list]
+) -> None:
+    """
+    Atomically replace the summary cache.
+    
+    The cache only saves work, so failing to write it is not an error.
+    
+    Args:
+        cache_path: Path of the cache file
+        context: Fingerprint from _summary_cache_context
+        entries: Mapping of relative file path to [mtime_ns, size_bytes, summary, imports]
+    """
+    cache = {"context": context, "files": entries}
+    if orjson is not None:
+        data = orjson.dumps(cache)
+    else:
+        data = json.dumps(cache, separators=(',', ':')).encode('utf-8')
+    
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+
+
+def _summarize_chunk(
+    summarize: Callable[[Path], Tuple[Dict[str, Any], Optional[List[str]]]],
+    chunk: List[Path]
+) -> List[Tuple[Dict[str, Any], Optional[List[str]]]]:
+    """
+    Summarize a chunk of files in a worker process.
+    
+    Args:
+        summarize: Picklable single-file summarizer
+        chunk: Files to summarize, in order
+    
+    Returns:
+        Summaries and imports (see _summarize_file) in the same order as chunk
+    """
+    return [summarize(file_path) for file_path in chunk]
+
+
+def _init_summary_worker(registry: LanguageRegistry) -> None:
+    """
+    Install the parent's language registry in a summary worker process.
+    
+    Language detection reads the global registry, which the CLI configures
+    (enabled and disabled languages, overrides); workers started without
+    fork would otherwise use the defaults.
+    
+    Args:
+        registry: The parent's global LanguageRegistry
+    """
+    language_registry._global_registry = registry
+
+
+def _summary_markdown(entry: Dict[str, Any]) -> str:
+    """
+    Render one structured summary as its Markdown block for file-summaries.md.
+    
+    Every line of the block is terminated by a newline; the blank line that
+    separates entries is written by the caller. The fields every entry has
+    are rendered by one format string, and the block is joined once.
+    
+    Args:
+        entry: Structured summary from _create_structured_summary
+    
+    Returns:
+        Markdown text for the entry
+    """
+    parts = [
+        f"## {entry['path']}\n"
+        f"**Language:** {entry['language']}  \n"
+        f"**Role:** {entry['role']}  \n"
+        f"**Role Justification:** {entry['role_justification']}  \n"
+    ]
+    
+    # Each optional section is fetched once; absent sections are None
+    summary = entry.get('summary')
+    metrics = entry.get('metrics')
+    structure = entry.get('structure')
+    dependencies = entry.get('dependencies')
+    
+    # Include legacy summary if present
+    if summary is not None:
+        parts.append(f"**Summary:** {summary}  \n")
+    
+    # Add metrics if present
+    if metrics is not None:
+        size_kb = metrics['size_bytes'] / 1024
+        parts.append(f"**Size:** {size_kb:.2f} KB  \n")
+        
+        loc = metrics.get('loc')
+        if loc is not None:
+            parts.append(f"**LOC:** {loc}  \n")
+        
+        todo_count = metrics.get('todo_count')
+        if todo_count is not None:
+            parts.append(f"**TODOs/FIXMEs:** {todo_count}  \n")
+        
+        declaration_count = metrics.get('declaration_count')
+        if declaration_count is not None:
+            parts.append(f"**Declarations:** {declaration_count}  \n")
+    
+    # Add structure information if present
+    if structure is not None:
+        # Show declarations if present
+        declarations = structure.get('declarations')
+        if declarations:
+            parts.append("**Top-level declarations:**\n")
+            for decl in declarations[:10]:  # Limit to 10
+                parts.append(f"  - {decl}\n")
+            more = len(declarations) - 10
+            if more > 0:
+                parts.append(f"  - ... and {more} more\n")
+        
+        # Always show warning if present, even without declarations
+        warning = structure.get('warning')
+        if warning is not None:
+            parts.append(f"**Warning:** {warning}  \n")
+    
+    # Add external dependencies if present
+    external = dependencies.get('external') if dependencies is not None else None
+    if external is not None:
+        stdlib_deps = external.get('stdlib', [])
+        third_party_deps = external.get('third-party', [])
+        
+        if stdlib_deps or third_party_deps:
+            parts.append("**External Dependencies:**\n")
+            
+            if stdlib_deps:
+                parts.append(f"  - **Stdlib:** {', '.join(f'`{d}`' for d in stdlib_deps[:5])}\n")
+                more = len(stdlib_deps) - 5
+                if more > 0:
+                    parts.append(f"    _(and {more} more)_\n")
+            
+            if third_party_deps:
+                parts.append(f"  - **Third-party:** {', '.join(f'`{d}`' for d in third_party_deps[:5])}\n")
+                more = len(third_party_deps) - 5
+                if more > 0:
+                    parts.append(f"    _(and {more} more)_\n")
+    
+    return "".join(parts)
+
+
+def _summary_markdown_renderer(
+    detail_level: DetailLevel,
+    include_legacy: bool
+) -> Callable[[Dict[str, Any]], str]:
+    """
+    Specialize _summary_markdown for the summaries of one run.
+    
+    The detail level and legacy flag fix which fields every summary has, so
+    minimal and standard blocks are rendered by a single f-string without
+    testing for each field per entry. Detailed blocks depend on each file's
+    declarations, warning and dependencies, and use _summary_markdown itself.
+    
+    Args:
+        detail_level: Detail level the summaries were created with
+        include_legacy: Whether the summaries include the legacy summary field
+    
+    Returns:
+        Function rendering a structured summary exactly as _summary_markdown
+    """
+    if detail_level == "detailed":
+        return _summary_markdown
+    
+    if include_legacy:
+        def render_head(entry: Dict[str, Any]) -> str:
+            return (
+                f"## {entry['path']}\n"
+                f"**Language:** {entry['language']}  \n"
+                f"**Role:** {entry['role']}  \n"
+                f"**Role Justification:** {entry['role_justification']}  \n"
+                f"**Summary:** {entry['summary']}  \n"
+            )
+    else:
+        def render_head(entry: Dict[str, Any]) -> str:
+            return (
+                f"## {entry['path']}\n"
+                f"**Language:** {entry['language']}  \n"
+                f"**Role:** {entry['role']}  \n"
+                f"**Role Justification:** {entry['role_justification']}  \n"
+            )
+    
+    if detail_level == "minimal":
+        return render_head
+    
+    def render(entry: Dict[str, Any]) -> str:
+        metrics = entry['metrics']
+        # LOC and TODO counts are both missing when the file couldn't be read
+        if 'loc' in metrics:
+            return (
+                f"{render_head(entry)}"
+                f"**Size:** {metrics['size_bytes'] / 1024:.2f} KB  \n"
+                f"**LOC:** {metrics['loc']}  \n"
+                f"**TODOs/FIXMEs:** {metrics['todo_count']}  \n"
+            )
+        return f"{render_head(entry)}**Size:** {metrics['size_bytes'] / 1024:.2f} KB  \n"
+    
+    return render
 
 
 def generate_file_summaries(
@@ -1132,11 +2279,20 @@ def generate_file_summaries(
     dry_run: bool = False,
     detail_level: DetailLevel = "standard",
     include_legacy_summary: bool = True,
-    max_file_size_kb: int = 1024
+    max_file_size_kb: int = 1024,
+    include_summary_text: bool = False,
+    max_workers: Optional[int] = None,
+    use_cache: bool = False
 ) -> None:
     """
     Generate file summaries in Markdown and JSON formats.
     
+    With use_cache, summaries are cached in the output directory, so a later
+    run with the same options reuses them for files whose modification time
+    and size are unchanged. External dependencies depend on the rest of the
+    tree, so they are classified again for every file, from the imports the
+    cache keeps; cached files are not read again.
+    
     Args:
         root_path: Root directory to scan
         output_dir: Directory to write output files
@@ -1147,10 +2303,17 @@ def generate_file_summaries(
         detail_level: Level of detail ("minimal", "standard", "detailed")
         include_legacy_summary: Whether to include legacy summary field for backward compatibility
         max_file_size_kb: Maximum file size in KB for expensive parsing (default 1024)
+        include_summary_text: Whether to also emit the summary_text alias of the legacy summary
+        max_workers: Maximum number of worker processes used to summarize files
+            (default: the number of CPUs; 1 summarizes serially)
+        use_cache: Whether to reuse and update the summary cache (default False)
     
     Raises:
         FileSummaryError: If file summary generation fails
     """
+    if max_workers is not None and max_workers < 1:
+        raise FileSummaryError(f"max_workers must be at least 1, got {max_workers}")
+    
     try:
         # Scan for matching files
         files = scan_files(root_path, include_patterns, exclude_patterns, exclude_dirs)
@@ -1162,112 +2325,191 @@ def generate_file_summaries(
                 print("No files found matching criteria")
             return
         
-        # Generate structured summaries for each file
-        summaries = []
-        for file_path in files:
-            structured_summary = _create_structured_summary(
-                file_path,
-                root_path,
-                detail_level=detail_level,
-                include_legacy=include_legacy_summary,
-                max_file_size_kb=max_file_size_kb
-            )
-            summaries.append(structured_summary)
+        # Directory listings and resolver results from a previous run may be
+        # stale (detailed summaries classify imports with them)
+        _clear_resolution_caches()
         
-        # Generate Markdown output
-        markdown_lines = ["# File Summaries\n"]
-        markdown_lines.append("Heuristic summaries of source files based on filenames, extensions, and paths.\n")
-        markdown_lines.append(f"Schema Version: {SCHEMA_VERSION}\n")
-        markdown_lines.append(f"Total files: {len(summaries)}\n")
+        markdown_path = output_dir / "file-summaries.md"
+        json_path = output_dir / "file-summaries.json"
         
-        for entry in summaries:
-            markdown_lines.append(f"## {entry['path']}")
-            markdown_lines.append(f"**Language:** {entry['language']}  ")
-            markdown_lines.append(f"**Role:** {entry['role']}  ")
-            markdown_lines.append(f"**Role Justification:** {entry['role_justification']}  ")
-            
-            # Include legacy summary if present
-            if 'summary' in entry:
-                markdown_lines.append(f"**Summary:** {entry['summary']}  ")
-            
-            # Add metrics if present
-            if 'metrics' in entry:
-                metrics = entry['metrics']
-                size_kb = metrics['size_bytes'] / 1024
-                markdown_lines.append(f"**Size:** {size_kb:.2f} KB  ")
-                
-                if 'loc' in metrics:
-                    markdown_lines.append(f"**LOC:** {metrics['loc']}  ")
-                
-                if 'todo_count' in metrics:
-                    markdown_lines.append(f"**TODOs/FIXMEs:** {metrics['todo_count']}  ")
-                
-                if 'declaration_count' in metrics:
-                    markdown_lines.append(f"**Declarations:** {metrics['declaration_count']}  ")
-            
-            # Add structure information if present
-            if 'structure' in entry:
-                # Show declarations if present
-                if entry['structure'].get('declarations'):
-                    markdown_lines.append(f"**Top-level declarations:**")
-                    for decl in entry['structure']['declarations'][:10]:  # Limit to 10
-                        markdown_lines.append(f"  - {decl}")
-                    if len(entry['structure']['declarations']) > 10:
-                        markdown_lines.append(f"  - ... and {len(entry['structure']['declarations']) - 10} more")
-                
-                # Always show warning if present, even without declarations
-                if 'warning' in entry['structure']:
-                    markdown_lines.append(f"**Warning:** {entry['structure']['warning']}  ")
+        # Markdown header; each entry is appended after a newline
+        markdown_header = (
+            "# File Summaries\n\n"
+            "Heuristic summaries of source files based on filenames, extensions, and paths.\n\n"
+            f"Schema Version: {SCHEMA_VERSION}\n\n"
+            f"Total files: {len(files)}\n"
+        )
+        
+        # Module-level callable, so it can be pickled for worker processes
+        summarize = functools.partial(
+            _summarize_file,
+            root_path=root_path,
+            detail_level=detail_level,
+            include_legacy=include_legacy_summary,
+            max_file_size_kb=max_file_size_kb,
+            include_summary_text=include_summary_text
+        )
+        
+        cache_path = output_dir / _SUMMARY_CACHE_NAME
+        cache_context = None
+        cached = {}
+        if use_cache:
+            cache_context = _summary_cache_context(root_path, (
+                detail_level, include_legacy_summary, max_file_size_kb,
+                include_summary_text
+            ))
+            cached = _load_summary_cache(cache_path, cache_context)
+        # Cache entries for this run's files, written once the outputs are
+        cache_entries = {}
+        
+        def summarize_files(files):
+            # Generate structured summaries in file order. Files are
+            # independent, so larger sets are spread across a process pool,
+            # since parsing holds the GIL. A single worker, and environments
+            # where a pool cannot be started (or breaks), are summarized
+            # serially from the first file not yet produced.
+            done = 0
+            workers = max_workers or os.cpu_count() or 1
+            if len(files) >= _PARALLEL_SUMMARY_THRESHOLD and workers > 1:
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_summary_worker,
+                        initargs=(get_global_registry(),)
+                    ) as executor:
+                        # Chunks in submission (file) order; the oldest is
+                        # always written first
+                        pending = deque()
+                        try:
+                            for start in range(0, len(files), _SUMMARY_CHUNKSIZE):
+                                pending.append(executor.submit(
+                                    _summarize_chunk, summarize,
+                                    files[start:start + _SUMMARY_CHUNKSIZE]
+                                ))
+                                if len(pending) < workers * _SUMMARY_TASKS_PER_WORKER:
+                                    continue
+                                for entry in pending.popleft().result():
+                                    yield entry
+                                    done += 1
+                            while pending:
+                                for entry in pending.popleft().result():
+                                    yield entry
+                                    done += 1
+                        finally:
+                            # Don't run queued chunks nobody will read (after
+                            # an error, or if the consumer stops early)
+                            for future in pending:
+                                future.cancel()
+                except (OSError, NotImplementedError, BrokenProcessPool):
+                    # No usable process pool here - continue serially
+                    pass
+            yield from map(summarize, files[done:])
+        
+        def summaries():
+            if not use_cache:
+                for entry, _ in summarize_files(files):
+                    yield entry
+                return
             
-            # Add external dependencies if present
-            if 'dependencies' in entry and 'external' in entry['dependencies']:
-                external = entry['dependencies']['external']
-                stdlib_deps = external.get('stdlib', [])
-                third_party_deps = external.get('third-party', [])
-                
-                if stdlib_deps or third_party_deps:
-                    markdown_lines.append(f"**External Dependencies:**")
-                    
-                    if stdlib_deps:
-                        markdown_lines.append(f"  - **Stdlib:** {', '.join(f'`{d}`' for d in stdlib_deps[:5])}")
-                        if len(stdlib_deps) > 5:
-                            markdown_lines.append(f"    _(and {len(stdlib_deps) - 5} more)_")
-                    
-                    if third_party_deps:
-                        markdown_lines.append(f"  - **Third-party:** {', '.join(f'`{d}`' for d in third_party_deps[:5])}")
-                        if len(third_party_deps) > 5:
-                            markdown_lines.append(f"    _(and {len(third_party_deps) - 5} more)_")
+            # Files are stat()ed before they are summarized, so a file
+            # changed meanwhile is summarized again next run. Files that
+            # can't be stat()ed are summarized but never cached. Entries
+            # are keyed by path relative to the root.
+            keys = []
+            stamps = {}
+            misses = []
+            for file_path in files:
+                rel_parts = _relative_parts(file_path, root_path)
+                key = '/'.join(rel_parts) if rel_parts is not None else file_path.as_posix()
+                keys.append(key)
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    misses.append(file_path)
+                    continue
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                hit = cached.get(key)
+                if hit is not None and hit[:2] == stamp:
+                    cache_entries[key] = hit
+                else:
+                    stamps[key] = stamp
+                    misses.append(file_path)
             
-            markdown_lines.append("")  # Empty line between entries
+            computed = summarize_files(misses)
+            try:
+                for file_path, key in zip(files, keys):
+                    hit = cache_entries.get(key)
+                    if hit is not None:
+                        entry, imports = hit[2], hit[3]
+                        # Whether an import resolves in the repository
+                        # depends on files that may have come or gone
+                        if imports is not None:
+                            entry["dependencies"]["external"] = _external_dependencies(
+                                file_path, root_path, imports
+                            )
+                        yield entry
+                        continue
+                    entry, imports = next(computed)
+                    stamp = stamps.get(key)
+                    if stamp is not None:
+                        cache_entries[key] = stamp + [entry, imports]
+                    yield entry
+            finally:
+                computed.close()
         
-        markdown_content = "\n".join(markdown_lines)
-        markdown_path = output_dir / "file-summaries.md"
+        render_markdown = _summary_markdown_renderer(detail_level, include_legacy_summary)
         
         if dry_run:
+            # Length of the Markdown that would be written, without building it
+            content_length = len(markdown_header)
+            for entry in summaries():
+                # Each block is written after a newline
+                content_length += 1 + len(render_markdown(entry))
+            
             print(f"[DRY RUN] Would write file-summaries.md to: {markdown_path}")
-            print(f"[DRY RUN] Content length: {len(markdown_content)} bytes")
-            print(f"[DRY RUN] Total files: {len(summaries)}")
-        else:
-            with open(markdown_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            print(f"File summaries written: {markdown_path}")
+            print(f"[DRY RUN] Content length: {content_length} bytes")
+            print(f"[DRY RUN] Total files: {len(files)}")
+            print(f"[DRY RUN] Would write file-summaries.json to: {json_path}")
+            print(f"[DRY RUN] JSON entries: {len(files)}")
+            return
         
-        # Generate JSON output with stable ordering
-        json_data = {
-            'schema_version': SCHEMA_VERSION,
-            'total_files': len(summaries),
-            'files': summaries
-        }
-        json_path = output_dir / "file-summaries.json"
+        # Stream both outputs as each file is summarized instead of holding
+        # every summary and the rendered Markdown in memory (Markdown blocks
+        # are buffered only up to _MARKDOWN_WRITE_BATCH). The JSON has the
+        # same layout json.dump(indent=2) gives the full document, with
+        # stable key ordering, and is written as the UTF-8 bytes the
+        # serializer produces.
+        with open(markdown_path, 'w', encoding='utf-8') as md_file, \
+                open(json_path, 'wb') as json_file:
+            md_file.write(markdown_header)
+            json_file.write((
+                '{\n'
+                f'  "schema_version": {json.dumps(SCHEMA_VERSION)},\n'
+                f'  "total_files": {len(files)},\n'
+                '  "files": [\n'
+            ).encode('utf-8'))
+            
+            markdown_blocks = []
+            for index, entry in enumerate(summaries()):
+                markdown_blocks.append(render_markdown(entry))
+                if len(markdown_blocks) == _MARKDOWN_WRITE_BATCH:
+                    md_file.write("\n" + "\n".join(markdown_blocks))
+                    markdown_blocks.clear()
+                
+                if index:
+                    json_file.write(b",\n")
+                # Entries sit two levels deep in the document
+                json_file.write(b"    " + _entry_json(entry).replace(b"\n", b"\n    "))
+            
+            json_file.write(b"\n  ]\n}")
+            if markdown_blocks:
+                md_file.write("\n" + "\n".join(markdown_blocks))
         
-        if dry_run:
-            print(f"[DRY RUN] Would write file-summaries.json to: {json_path}")
-            print(f"[DRY RUN] JSON entries: {len(summaries)}")
-        else:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                # Use indent=2 for readability and sort_keys=False to maintain insertion order
-                json.dump(json_data, f, indent=2, sort_keys=False)
-            print(f"File summaries JSON written: {json_path}")
+        if use_cache:
+            _write_summary_cache(cache_path, cache_context, cache_entries)
+        
+        print(f"File summaries written: {markdown_path}")
+        print(f"File summaries JSON written: {json_path}")
     
     except Exception as e:
         raise FileSummaryError(f"Failed to generate file summaries: {e}")
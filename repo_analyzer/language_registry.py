@@ -10,18 +10,25 @@ their file extensions, and analyzer capabilities. It enables deterministic
 language detection and allows for future extension without modifying core files.
 """
 
+import sys
+from operator import attrgetter
 from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field, asdict
 
+# dataclass(slots=True) needs Python 3.10; earlier versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class LanguageCapability:
     """
     Defines capabilities and metadata for a programming language.
     
     Attributes:
         name: Human-readable language name (e.g., "Python", "JavaScript")
-        extensions: Set of file extensions (e.g., {".py", ".pyw"})
+        extensions: Set of file extensions (e.g., {".py", ".pyw"}); frozen
+            into a frozenset when the language is registered, since the
+            registry's extension maps are built from it
         has_structure_parser: Whether the language has a structure parser
         has_dependency_scanner: Whether the language has a dependency scanner
         enabled: Whether analysis is enabled for this language
@@ -66,13 +73,18 @@ class LanguageRegistry:
     def __init__(self):
         self._languages: Dict[str, LanguageCapability] = {}
         self._extension_map: Dict[str, str] = {}
+        # Owning language of each extension as passed to
+        # get_language_by_extension(), enabled or not. Rebuilt from
+        # _extension_map whenever that changes; other spellings and unknown
+        # extensions are added as they are looked up.
+        self._extension_lookup: Dict[str, Optional[str]] = {}
         self._initialize_default_languages()
     
     def _initialize_default_languages(self) -> None:
         """Initialize the registry with default language definitions."""
         
         # Python - full support with AST parser
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Python",
             extensions={".py", ".pyw"},
             has_structure_parser=True,
@@ -81,7 +93,7 @@ class LanguageRegistry:
         ))
         
         # JavaScript - full support with regex parser
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="JavaScript",
             extensions={".js", ".jsx", ".mjs", ".cjs"},
             has_structure_parser=True,
@@ -90,7 +102,7 @@ class LanguageRegistry:
         ))
         
         # TypeScript - full support with regex parser
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="TypeScript",
             extensions={".ts", ".tsx"},
             has_structure_parser=True,
@@ -99,7 +111,7 @@ class LanguageRegistry:
         ))
         
         # C - enhanced with parser capability flags
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="C",
             extensions={".c"},
             has_structure_parser=False,  # Will be True with tree-sitter/libclang
@@ -114,7 +126,7 @@ class LanguageRegistry:
         ))
         
         # C++ - enhanced with parser capability flags, higher priority than C for .h files
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="C++",
             extensions={".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx", ".h"},
             has_structure_parser=False,  # Will be True with tree-sitter/libclang
@@ -129,7 +141,7 @@ class LanguageRegistry:
         ))
         
         # C# - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="C#",
             extensions={".cs"},
             has_structure_parser=False,
@@ -138,7 +150,7 @@ class LanguageRegistry:
         ))
         
         # Rust - enhanced with parser capability flags
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Rust",
             extensions={".rs"},
             has_structure_parser=False,  # Will be True with tree-sitter
@@ -153,7 +165,7 @@ class LanguageRegistry:
         ))
         
         # Go - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Go",
             extensions={".go"},
             has_structure_parser=False,
@@ -164,7 +176,7 @@ class LanguageRegistry:
         # Assembly - support for multiple assembly syntaxes with label extraction
         # Includes GNU assembler (gas), NASM, MASM
         # Handles .globl/.global directives and label definitions
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="ASM",
             extensions={".s", ".S", ".asm", ".sx"},
             has_structure_parser=True,  # Can extract symbols via regex
@@ -180,7 +192,7 @@ class LanguageRegistry:
         ))
         
         # Perl - support for Perl scripts and modules
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Perl",
             extensions={".pl", ".pm", ".perl"},
             has_structure_parser=False,  # Will be True with tree-sitter
@@ -195,7 +207,7 @@ class LanguageRegistry:
         ))
         
         # Java - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Java",
             extensions={".java"},
             has_structure_parser=False,
@@ -204,7 +216,7 @@ class LanguageRegistry:
         ))
         
         # Swift - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Swift",
             extensions={".swift"},
             has_structure_parser=False,
@@ -213,7 +225,7 @@ class LanguageRegistry:
         ))
         
         # HTML - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="HTML",
             extensions={".html", ".htm"},
             has_structure_parser=False,
@@ -222,7 +234,7 @@ class LanguageRegistry:
         ))
         
         # CSS - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="CSS",
             extensions={".css"},
             has_structure_parser=False,
@@ -231,7 +243,7 @@ class LanguageRegistry:
         ))
         
         # SQL - basic support with dependency scanning
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="SQL",
             extensions={".sql"},
             has_structure_parser=False,
@@ -241,7 +253,7 @@ class LanguageRegistry:
         
         # Additional languages with lower priority (existing in LANGUAGE_MAP)
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Ruby",
             extensions={".rb"},
             has_structure_parser=False,
@@ -249,7 +261,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="PHP",
             extensions={".php"},
             has_structure_parser=False,
@@ -257,7 +269,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Kotlin",
             extensions={".kt"},
             has_structure_parser=False,
@@ -265,7 +277,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Scala",
             extensions={".scala"},
             has_structure_parser=False,
@@ -273,7 +285,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Shell",
             extensions={".sh"},
             has_structure_parser=False,
@@ -281,7 +293,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Bash",
             extensions={".bash"},
             has_structure_parser=False,
@@ -289,7 +301,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Zsh",
             extensions={".zsh"},
             has_structure_parser=False,
@@ -297,7 +309,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="PowerShell",
             extensions={".ps1"},
             has_structure_parser=False,
@@ -305,7 +317,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="R",
             extensions={".r", ".R"},
             has_structure_parser=False,
@@ -313,7 +325,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Objective-C",
             extensions={".m"},
             has_structure_parser=False,
@@ -321,7 +333,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="SCSS",
             extensions={".scss"},
             has_structure_parser=False,
@@ -329,7 +341,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Sass",
             extensions={".sass"},
             has_structure_parser=False,
@@ -337,7 +349,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Less",
             extensions={".less"},
             has_structure_parser=False,
@@ -345,7 +357,7 @@ class LanguageRegistry:
             priority=5
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Vue",
             extensions={".vue"},
             has_structure_parser=False,
@@ -355,7 +367,7 @@ class LanguageRegistry:
         
         # Markup and config languages
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Markdown",
             extensions={".md"},
             has_structure_parser=False,
@@ -363,7 +375,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="reStructuredText",
             extensions={".rst"},
             has_structure_parser=False,
@@ -371,7 +383,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="YAML",
             extensions={".yml", ".yaml"},
             has_structure_parser=False,
@@ -379,7 +391,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="JSON",
             extensions={".json"},
             has_structure_parser=False,
@@ -387,7 +399,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="XML",
             extensions={".xml"},
             has_structure_parser=False,
@@ -395,7 +407,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="TOML",
             extensions={".toml"},
             has_structure_parser=False,
@@ -403,7 +415,7 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="INI",
             extensions={".ini"},
             has_structure_parser=False,
@@ -411,13 +423,15 @@ class LanguageRegistry:
             priority=3
         ))
         
-        self.register(LanguageCapability(
+        self._register_no_rebuild(LanguageCapability(
             name="Config",
             extensions={".cfg", ".conf"},
             has_structure_parser=False,
             has_dependency_scanner=False,
             priority=2
         ))
+        
+        self._rebuild_extension_map()
     
     def register(self, language: LanguageCapability) -> None:
         """
@@ -430,9 +444,21 @@ class LanguageRegistry:
         Args:
             language: Language capability to register
         """
-        self._languages[language.name] = language
+        self._register_no_rebuild(language)
         self._rebuild_extension_map()
     
+    def _register_no_rebuild(self, language: LanguageCapability) -> None:
+        """
+        Add a language without rebuilding the extension maps.
+        
+        Callers registering several languages rebuild once afterwards.
+        
+        Args:
+            language: Language capability to register
+        """
+        language.extensions = frozenset(language.extensions)
+        self._languages[language.name] = language
+    
     def get_language_by_extension(self, extension: str) -> Optional[str]:
         """
         Get language name for a file extension if the language is enabled.
@@ -443,8 +469,16 @@ class LanguageRegistry:
         Returns:
             Language name if found and enabled, or None otherwise
         """
-        lang_name = self._extension_map.get(extension.lower())
-        if lang_name and self.is_language_enabled(lang_name):
+        try:
+            lang_name = self._extension_lookup[extension]
+        except KeyError:
+            # Not a lowercase registered extension: look up its lowercase form
+            lang_name = self._extension_map.get(extension.lower())
+            self._extension_lookup[extension] = lang_name
+        
+        # The enabled flag is read on every lookup rather than memoized, as
+        # it can also be set directly on the LanguageCapability
+        if lang_name is not None and self._languages[lang_name].enabled:
             return lang_name
         return None
     
@@ -461,7 +495,12 @@ class LanguageRegistry:
         Returns:
             Language name if found, or None otherwise (regardless of enabled status)
         """
-        return self._extension_map.get(extension.lower())
+        # Registered extensions are stored lowercase, which is how they are
+        # usually spelled, so only other spellings pay for lower()
+        return (
+            self._extension_map.get(extension)
+            or self._extension_map.get(extension.lower())
+        )
     
     def get_language(self, name: str) -> Optional[LanguageCapability]:
         """
@@ -586,9 +625,9 @@ class LanguageRegistry:
             for name in enabled_languages:
                 if not isinstance(name, str):
                     raise ValueError(f"Language name must be a string, got {type(name)}")
-                if not self.enable_language(name):
-                    # Language not found - log but don't fail
-                    pass
+                if name in self._languages:
+                    self._languages[name].enabled = True
+                # Language not found - ignored rather than failing
         
         disabled_languages = config.get("disabled_languages", [])
         if not isinstance(disabled_languages, list):
@@ -596,7 +635,8 @@ class LanguageRegistry:
         for name in disabled_languages:
             if not isinstance(name, str):
                 raise ValueError(f"Language name must be a string, got {type(name)}")
-            self.disable_language(name)
+            if name in self._languages:
+                self._languages[name].enabled = False
         
         # Apply language-specific overrides
         priority_changed = False
@@ -620,8 +660,10 @@ class LanguageRegistry:
                     priority = settings["priority"]
                     if not isinstance(priority, (int, float)):
                         raise ValueError(f"priority setting must be a number, got {type(priority)}")
-                    lang.priority = int(priority)
-                    priority_changed = True
+                    # Restating the current priority needs no re-sort
+                    if int(priority) != lang.priority:
+                        lang.priority = int(priority)
+                        priority_changed = True
         
         # Rebuild extension map if any priority changed
         if priority_changed:
@@ -633,7 +675,7 @@ class LanguageRegistry:
         # Sort by priority (descending) to process higher priority first
         sorted_langs = sorted(
             self._languages.values(),
-            key=lambda x: x.priority,
+            key=attrgetter('priority'),
             reverse=True
         )
         for lang in sorted_langs:
@@ -641,6 +683,7 @@ class LanguageRegistry:
                 ext_lower = ext.lower()
                 if ext_lower not in self._extension_map:
                     self._extension_map[ext_lower] = lang.name
+        self._extension_lookup = dict(self._extension_map)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -232,6 +232,14 @@ def get_parser_capability(language: str) -> ParserCapability:
     return capability
 
 
+# Patterns for assembly symbol directives (gas, NASM, MASM) and labels
+_ASM_GLOBL_RE = re.compile(r'^\s*\.glob(?:al|l)\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+_ASM_TYPE_RE = re.compile(r'^\s*\.type\s+([A-Za-z_][A-Za-z0-9_]*)\s*,\s*[@%](function|object)', re.MULTILINE)
+_ASM_NASM_GLOBAL_RE = re.compile(r'^\s*global\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE | re.IGNORECASE)
+_ASM_MASM_PUBLIC_RE = re.compile(r'^\s*PUBLIC\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE | re.IGNORECASE)
+_ASM_LABEL_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*):(?:\s|$)', re.MULTILINE)
+
+
 def parse_asm_symbols(content: str, file_path: Path) -> ParsedSymbols:
     """
     Parse assembly source to extract symbols (.globl directives, labels).
@@ -250,23 +258,16 @@ def parse_asm_symbols(content: str, file_path: Path) -> ParsedSymbols:
     """
     result = ParsedSymbols(parser_used=ParserType.REGEX_FALLBACK)
     
-    # Regex patterns
-    globl_pattern = re.compile(r'^\s*\.glob(?:al|l)\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
-    type_pattern = re.compile(r'^\s*\.type\s+([A-Za-z_][A-Za-z0-9_]*)\s*,\s*[@%](function|object)', re.MULTILINE)
-    nasm_global_pattern = re.compile(r'^\s*global\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE | re.IGNORECASE)
-    masm_public_pattern = re.compile(r'^\s*PUBLIC\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE | re.IGNORECASE)
-    label_pattern = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*):(?:\s|$)', re.MULTILINE)
-    
     # Pass 1: Extract type annotations
-    type_annotations: Dict[str, str] = {m.group(1): m.group(2) for m in type_pattern.finditer(content)}
+    type_annotations: Dict[str, str] = {m.group(1): m.group(2) for m in _ASM_TYPE_RE.finditer(content)}
     
     # Pass 2: Extract all global/public symbols from all syntaxes
     global_symbols: Dict[str, str] = {}
-    for match in globl_pattern.finditer(content):
+    for match in _ASM_GLOBL_RE.finditer(content):
         global_symbols.setdefault(match.group(1), ".globl")
-    for match in nasm_global_pattern.finditer(content):
+    for match in _ASM_NASM_GLOBAL_RE.finditer(content):
         global_symbols.setdefault(match.group(1), "global")
-    for match in masm_public_pattern.finditer(content):
+    for match in _ASM_MASM_PUBLIC_RE.finditer(content):
         global_symbols.setdefault(match.group(1), "PUBLIC")
 
     # Pass 3: Categorize global symbols and add to results
@@ -280,7 +281,7 @@ def parse_asm_symbols(content: str, file_path: Path) -> ParsedSymbols:
 
     # Pass 4: Extract standalone labels that are not already global
     seen_labels = set(global_symbols.keys())
-    for match in label_pattern.finditer(content):
+    for match in _ASM_LABEL_RE.finditer(content):
         label = match.group(1)
         if label not in seen_labels:
             seen_labels.add(label)
@@ -295,6 +296,15 @@ def parse_asm_symbols(content: str, file_path: Path) -> ParsedSymbols:
     return result
 
 
+# Pattern for sub declarations
+# Matches: sub name { ... } or sub name;
+_PERL_SUB_RE = re.compile(r'^\s*sub\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+
+# Pattern for package declarations
+# Matches: package Package::Name;
+_PERL_PACKAGE_RE = re.compile(r'^\s*package\s+([\w:]+)\s*;', re.MULTILINE)
+
+
 def parse_perl_symbols(content: str, file_path: Path) -> ParsedSymbols:
     """
     Parse Perl source to extract subroutines and package declarations.
@@ -310,27 +320,28 @@ def parse_perl_symbols(content: str, file_path: Path) -> ParsedSymbols:
     """
     result = ParsedSymbols(parser_used=ParserType.REGEX_FALLBACK)
     
-    # Pattern for sub declarations
-    # Matches: sub name { ... } or sub name;
-    sub_pattern = re.compile(r'^\s*sub\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
-    
-    # Pattern for package declarations
-    # Matches: package Package::Name;
-    package_pattern = re.compile(r'^\s*package\s+([\w:]+)\s*;', re.MULTILINE)
-    
     # Extract subroutines
-    for match in sub_pattern.finditer(content):
+    for match in _PERL_SUB_RE.finditer(content):
         sub_name = match.group(1)
         result.functions.append(f"sub {sub_name}")
     
     # Extract packages (treat as classes)
-    for match in package_pattern.finditer(content):
+    for match in _PERL_PACKAGE_RE.finditer(content):
         package_name = match.group(1)
         result.classes.append(f"package {package_name}")
     
     return result
 
 
+# Pattern for use statements
+# Matches: use Module::Name; or use Module::Name qw(...);
+_PERL_USE_RE = re.compile(r'^\s*use\s+([\w:]+)', re.MULTILINE)
+
+# Pattern for require statements
+# Matches: require Module::Name; or require "path/to/module.pm";
+_PERL_REQUIRE_RE = re.compile(r'^\s*require\s+(?:([\w:]+)|["\']([^"\']+)["\'])', re.MULTILINE)
+
+
 def parse_perl_dependencies(content: str, file_path: Path) -> List[str]:
     """
     Parse Perl use/require statements to extract dependencies.
@@ -347,23 +358,15 @@ def parse_perl_dependencies(content: str, file_path: Path) -> List[str]:
     # Import pragma list from stdlib_classification to avoid duplication
     from repo_analyzer.stdlib_classification import PERL_PRAGMAS
     
-    # Pattern for use statements
-    # Matches: use Module::Name; or use Module::Name qw(...);
-    use_pattern = re.compile(r'^\s*use\s+([\w:]+)', re.MULTILINE)
-    
-    # Pattern for require statements
-    # Matches: require Module::Name; or require "path/to/module.pm";
-    require_pattern = re.compile(r'^\s*require\s+(?:([\w:]+)|["\']([^"\']+)["\'])', re.MULTILINE)
-    
     # Extract use statements
-    for match in use_pattern.finditer(content):
+    for match in _PERL_USE_RE.finditer(content):
         module = match.group(1)
         # Skip pragmas and version declarations
         if module not in PERL_PRAGMAS and not module.startswith('v'):
             dependencies.append(module)
     
     # Extract require statements
-    for match in require_pattern.finditer(content):
+    for match in _PERL_REQUIRE_RE.finditer(content):
         # require can use either Module::Name or "path/to/file"
         module = match.group(1) if match.group(1) else match.group(2)
         if module:
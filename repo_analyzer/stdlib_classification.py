@@ -9,7 +9,7 @@ This module provides offline classification without network calls or package man
 Classification tables are maintained in code for Python and JavaScript/TypeScript ecosystems.
 """
 
-from typing import Literal
+from typing import Callable, Dict, Iterable, Literal
 
 DependencyType = Literal["stdlib", "third-party", "unknown"]
 
@@ -711,6 +711,30 @@ def classify_perl_import(module_name: str) -> DependencyType:
     return "third-party"
 
 
+def _classify_no_external(module_name: str) -> DependencyType:
+    """Classifier for languages without external dependencies (assembly)."""
+    return "unknown"
+
+
+# Per-language classifiers, looked up once per call or batch
+_LANGUAGE_CLASSIFIERS: Dict[str, Callable[[str], DependencyType]] = {
+    "Python": classify_python_import,
+    "JavaScript": classify_js_import,
+    "TypeScript": classify_js_import,
+    "C": classify_c_cpp_import,
+    "C++": classify_c_cpp_import,
+    "Rust": classify_rust_import,
+    "Go": classify_go_import,
+    "Java": classify_java_import,
+    "C#": classify_csharp_import,
+    "Swift": classify_swift_import,
+    "SQL": classify_sql_import,
+    "Perl": classify_perl_import,
+    # Assembly doesn't have external dependencies in the traditional sense
+    "ASM": _classify_no_external,
+}
+
+
 def classify_import(module_name: str, language: str) -> DependencyType:
     """
     Classify an import based on the source file's language.
@@ -722,29 +746,27 @@ def classify_import(module_name: str, language: str) -> DependencyType:
     Returns:
         Classification as 'stdlib', 'third-party', or 'unknown'
     """
-    if language == "Python":
-        return classify_python_import(module_name)
-    elif language in ["JavaScript", "TypeScript"]:
-        return classify_js_import(module_name)
-    elif language in ["C", "C++"]:
-        return classify_c_cpp_import(module_name)
-    elif language == "Rust":
-        return classify_rust_import(module_name)
-    elif language == "Go":
-        return classify_go_import(module_name)
-    elif language == "Java":
-        return classify_java_import(module_name)
-    elif language == "C#":
-        return classify_csharp_import(module_name)
-    elif language == "Swift":
-        return classify_swift_import(module_name)
-    elif language == "SQL":
-        return classify_sql_import(module_name)
-    elif language == "Perl":
-        return classify_perl_import(module_name)
-    elif language == "ASM":
-        # Assembly doesn't have external dependencies in the traditional sense
-        return "unknown"
-    else:
-        # For unsupported languages, return unknown
-        return "unknown"
+    # For unsupported languages, return unknown
+    classifier = _LANGUAGE_CLASSIFIERS.get(language, _classify_no_external)
+    return classifier(module_name)
+
+
+def classify_imports_batch(
+    module_names: Iterable[str],
+    language: str
+) -> Dict[str, DependencyType]:
+    """
+    Classify several imports from files of the same language at once.
+    
+    The language dispatch happens once for the whole batch, and repeated
+    names are classified only once.
+    
+    Args:
+        module_names: The module/package names to classify
+        language: The programming language ('Python', 'JavaScript', 'TypeScript', etc.)
+    
+    Returns:
+        Mapping of each distinct module name to 'stdlib', 'third-party', or 'unknown'
+    """
+    classifier = _LANGUAGE_CLASSIFIERS.get(language, _classify_no_external)
+    return {name: classifier(name) for name in dict.fromkeys(module_names)}
@@ -13,7 +13,7 @@ respecting configured exclude patterns.
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set
 
 
 # Default directories to exclude (noise directories)
@@ -32,40 +32,46 @@ class TreeReportError(Exception):
     pass
 
 
-def _should_exclude(name: str, exclude_patterns: Set[str]) -> bool:
+def _compile_excludes(exclude_patterns: Set[str]) -> Callable[[str], bool]:
     """
-    Check if a file or directory should be excluded.
+    Build a predicate that checks names against a set of exclude patterns.
+    
+    Walkers test every directory and file name against the same patterns, so
+    the wildcard patterns are sorted into suffix and prefix tuples once and
+    each name is then checked with a set lookup and at most one endswith()
+    and one startswith() call, instead of looping over every pattern.
     
     Args:
-        name: File or directory name
         exclude_patterns: Set of patterns to exclude
     
     Returns:
-        True if should be excluded, False otherwise
+        Function returning True if a file or directory name should be excluded
     """
-    # Exact name match
-    if name in exclude_patterns:
-        return True
-    
-    # Wildcard pattern matching (simple glob-style)
+    names = frozenset(exclude_patterns)
+    suffixes = []
+    prefixes = []
     for pattern in exclude_patterns:
         if '*' in pattern:
             # Simple glob matching (e.g., *.pyc)
             if pattern.startswith('*'):
-                suffix = pattern[1:]
-                if name.endswith(suffix):
-                    return True
+                suffixes.append(pattern[1:])
             elif pattern.endswith('*'):
-                prefix = pattern[:-1]
-                if name.startswith(prefix):
-                    return True
+                prefixes.append(pattern[:-1])
+    suffixes = tuple(suffixes)
+    prefixes = tuple(prefixes)
     
-    return False
+    def is_excluded(name: str) -> bool:
+        # Exact name match, then wildcard pattern matching
+        return (name in names or
+                name.endswith(suffixes) or
+                name.startswith(prefixes))
+    
+    return is_excluded
 
 
 def _build_tree_structure(
     root_path: Path,
-    exclude_patterns: Set[str],
+    is_excluded: Callable[[str], bool],
     max_depth: Optional[int] = None,
     current_depth: int = 0
 ) -> Dict[str, Any]:
@@ -74,7 +80,7 @@ def _build_tree_structure(
     
     Args:
         root_path: Root directory to scan
-        exclude_patterns: Set of patterns to exclude
+        is_excluded: Exclude predicate from _compile_excludes
         max_depth: Maximum depth to traverse (None for unlimited)
         current_depth: Current recursion depth
     
@@ -100,7 +106,7 @@ def _build_tree_structure(
         
         for entry in entries:
             # Skip excluded items
-            if _should_exclude(entry.name, exclude_patterns):
+            if is_excluded(entry.name):
                 continue
             
             # Skip symlinks to avoid escaping the repository
@@ -112,7 +118,7 @@ def _build_tree_structure(
                 try:
                     subtree = _build_tree_structure(
                         entry,
-                        exclude_patterns,
+                        is_excluded,
                         max_depth,
                         current_depth + 1
                     )
@@ -198,9 +204,9 @@ def generate_tree_report(
     if exclude_patterns:
         all_excludes.update(exclude_patterns)
     
-    # Build tree structure
+    # Build tree structure, compiling the patterns once for the whole walk
     try:
-        tree = _build_tree_structure(root_path, all_excludes, max_depth)
+        tree = _build_tree_structure(root_path, _compile_excludes(all_excludes), max_depth)
     except Exception as e:
         raise TreeReportError(f"Failed to build tree structure: {e}")
     
@@ -12,6 +12,7 @@ Tests verify that:
 4. Configuration is properly applied
 """
 
+import argparse
 import os
 from pathlib import Path
 import pytest
@@ -19,7 +20,9 @@ import pytest
 from repo_analyzer.cli import (
     detect_repository_languages,
     auto_enable_detected_languages,
+    merge_config,
     run_scan,
+    _positive_int,
 )
 
 
@@ -299,3 +302,57 @@ class TestConfigurationValidation:
             assert result == 0
         finally:
             os.chdir(original_cwd)
+
+
+class TestJobsOption:
+    """Test the --jobs option for file summary and dependency scan workers."""
+    
+    def test_jobs_overrides_file_config(self):
+        """Test that --jobs sets max_workers without mutating the file config."""
+        file_config = {"file_summary_config": {"detail_level": "minimal", "max_workers": 8}}
+        args = argparse.Namespace(output_dir=None, dry_run=False, jobs=2)
+        
+        config = merge_config(file_config, args)
+        
+        assert config["file_summary_config"] == {"detail_level": "minimal", "max_workers": 2}
+        assert file_config["file_summary_config"]["max_workers"] == 8
+    
+    def test_jobs_not_given_keeps_file_config(self):
+        """Test that the file config worker count is kept without --jobs."""
+        file_config = {"file_summary_config": {"max_workers": 3}}
+        args = argparse.Namespace(output_dir=None, dry_run=False, jobs=None)
+        
+        config = merge_config(file_config, args)
+        
+        assert config["file_summary_config"]["max_workers"] == 3
+    
+    def test_jobs_must_be_positive(self):
+        """Test that non-positive and non-integer job counts are rejected."""
+        assert _positive_int("4") == 4
+        for value in ("0", "-1", "many"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                _positive_int(value)
+    
+    def test_jobs_applies_to_both_stages(self, tmp_path, monkeypatch):
+        """Test that the worker count reaches file summaries and the dependency graph."""
+        from repo_analyzer import cli
+        
+        (tmp_path / "main.py").write_text("print('hello')")
+        config = {
+            "output_dir": str(tmp_path / "output"),
+            "dry_run": True,
+            "file_summary_config": {"max_workers": 3},
+        }
+        seen = {}
+        
+        def record(stage):
+            def generate(**kwargs):
+                seen[stage] = kwargs["max_workers"]
+            return generate
+        
+        monkeypatch.setattr(cli, "generate_file_summaries", record("summaries"))
+        monkeypatch.setattr(cli, "generate_dependency_report", record("dependencies"))
+        monkeypatch.chdir(tmp_path)
+        
+        assert run_scan(config) == 0
+        assert seen == {"summaries": 3, "dependencies": 3}
@@ -208,6 +208,52 @@ from typing import List
         assert 'os' not in imports
         assert 'pathlib.Path' not in imports
         assert 'sys' not in imports
+    
+    def test_quote_characters_inside_strings(self, tmp_path):
+        """Test that triple quotes nested in other strings do not hide imports."""
+        content = '''
+QUOTE = '"""'
+import json
+def main():
+    import argparse
+'''
+        file_path = tmp_path / "test.py"
+        imports = _parse_python_imports(content, file_path)
+        
+        assert imports == ['json', 'argparse']
+    
+    def test_trailing_comma_in_parenthesized_import(self, tmp_path):
+        """Test that a trailing comma does not produce an empty name."""
+        content = """
+from pathlib import (
+    Path,
+    PurePath,
+)
+"""
+        file_path = tmp_path / "test.py"
+        imports = _parse_python_imports(content, file_path)
+        
+        assert imports == ['pathlib.Path', 'pathlib.PurePath']
+    
+    def test_statement_boundaries(self, tmp_path):
+        """Test semicolons, continuations and comments within statements."""
+        content = '''
+import os; import sys
+x = "; import hidden"; from json import loads
+from collections import (  # comment with ) and "quote"
+    OrderedDict,  # first
+    deque as dq,
+)
+from typing \\
+    import Any
+'''
+        file_path = tmp_path / "test.py"
+        imports = _parse_python_imports(content, file_path)
+        
+        assert imports == [
+            'os', 'sys', 'json.loads', 'collections.OrderedDict',
+            'collections.deque', 'typing.Any',
+        ]
 
 
 class TestParseJSImports:
@@ -387,6 +433,20 @@ class TestResolvePythonImport:
         assert resolved is not None
         assert resolved == tmp_path / "module.py"
     
+    def test_relative_import_of_symbol(self, tmp_path):
+        """Test that names imported from a relative module resolve to it."""
+        package = tmp_path / "pkg"
+        (package / "sub").mkdir(parents=True)
+        (package / "_common.py").touch()
+        (package / "sub" / "__init__.py").touch()
+        source_file = package / "main.py"
+        source_file.touch()
+        
+        # "from ._common import (a, b,)" and "from .sub import symbol"
+        assert _resolve_python_import('._common.a', source_file, tmp_path) == package / "_common.py"
+        assert _resolve_python_import('.sub.symbol', source_file, tmp_path) == package / "sub" / "__init__.py"
+        assert _resolve_python_import('.missing', source_file, tmp_path) is None
+    
     def test_relative_wildcard_import_resolves_to_init(self, tmp_path):
         """Test that relative wildcard imports resolve to package __init__.py."""
         # Create package structure
@@ -656,6 +716,46 @@ import React from 'react';
         with pytest.raises(IOError, match="Cannot read file"):
             _scan_file_dependencies(file_path, tmp_path)
     
+    def test_crlf_line_endings(self, tmp_path):
+        """Test that files with Windows line endings are parsed."""
+        (tmp_path / "utils.py").write_text("# Utils")
+        (tmp_path / "config.py").write_text("# Config")
+        main_file = tmp_path / "main.py"
+        main_file.write_bytes(b"from . import utils\r\nfrom . import config\r\n")
+        
+        deps = _scan_file_dependencies(main_file, tmp_path)
+        
+        assert tmp_path / "utils.py" in deps
+        assert tmp_path / "config.py" in deps
+    
+    def test_memory_mapped_large_file(self, tmp_path, monkeypatch):
+        """Test that files above the mmap threshold are parsed the same way."""
+        from repo_analyzer import dependency_graph
+        
+        monkeypatch.setattr(dependency_graph, "_MMAP_THRESHOLD", 16)
+        (tmp_path / "utils.py").write_text("# Utils")
+        main_file = tmp_path / "main.py"
+        main_file.write_bytes("# café\r\nfrom . import utils\r\n".encode("utf-8"))
+        
+        deps = _scan_file_dependencies(main_file, tmp_path)
+        
+        assert deps == [tmp_path / "utils.py"]
+    
+    def test_scan_capped_at_complete_lines(self, tmp_path, monkeypatch):
+        """Test that only the head of an oversized file is scanned, by whole lines."""
+        from repo_analyzer import dependency_graph
+        
+        (tmp_path / "first.py").write_text("# First")
+        (tmp_path / "second.py").write_text("# Second")
+        main_file = tmp_path / "main.py"
+        main_file.write_text("from . import first\nfrom . import second\n")
+        monkeypatch.setattr(dependency_graph, "_MAX_IMPORT_SCAN_BYTES", 30)
+        
+        deps = _scan_file_dependencies(main_file, tmp_path)
+        
+        # The cap falls inside the second line, which must not be half-parsed
+        assert deps == [tmp_path / "first.py"]
+    
     def test_unsupported_file_type_returns_empty(self, tmp_path):
         """Test that unsupported file types return empty dependencies."""
         file_path = tmp_path / "data.txt"
@@ -802,6 +902,100 @@ import utils  # Third time
         # Should only have one edge despite multiple imports
         assert len(edges_to_utils) == 1
     
+    def test_rebuild_sees_new_files(self, tmp_path):
+        """Test that a second build is not served stale directory listings."""
+        main = tmp_path / "main.py"
+        main.write_text("from . import utils")
+        
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.py'])
+        assert len(graph_data['edges']) == 0
+        
+        (tmp_path / "utils.py").write_text("# Utils")
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.py'])
+        assert len(graph_data['edges']) == 1
+    
+    def test_symlinked_root_directory(self, tmp_path):
+        """Test that a root reached through a symlink yields relative node ids."""
+        real = tmp_path / "real"
+        (real / "pkg").mkdir(parents=True)
+        (real / "pkg" / "main.py").write_text("from . import utils")
+        (real / "pkg" / "utils.py").write_text("# Utils")
+        link = tmp_path / "link"
+        link.symlink_to(real, target_is_directory=True)
+        
+        graph_data, errors = build_dependency_graph(link, include_patterns=['*.py'])
+        
+        assert errors == []
+        assert [n['id'] for n in graph_data['nodes']] == ['pkg/main.py', 'pkg/utils.py']
+        assert graph_data['edges'] == [{'source': 'pkg/main.py', 'target': 'pkg/utils.py'}]
+    
+    def test_nodes_sorted_by_path_components(self, tmp_path):
+        """Test that nodes are ordered component-wise, not by raw string."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b.py").write_text("# b")
+        (tmp_path / "a-c.py").write_text("# a-c")
+        
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.py'])
+        assert [n['id'] for n in graph_data['nodes']] == ['a/b.py', 'a-c.py']
+    
+    def test_shared_include_resolved_for_every_file(self, tmp_path):
+        """Test that includes shared across files resolve for each of them."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.c").write_text('#include "common.h"\n#include "missing.h"\n')
+        (src / "b.c").write_text('#include "common.h"\n#include "missing.h"\n')
+        (src / "common.h").write_text("#pragma once\n")
+        
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.c', '*.h'])
+        edges = {(e['source'], e['target']) for e in graph_data['edges']}
+        assert edges == {('src/a.c', 'src/common.h'), ('src/b.c', 'src/common.h')}
+        
+        (src / "missing.h").write_text("#pragma once\n")
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.c', '*.h'])
+        assert len(graph_data['edges']) == 4
+    
+    def test_parallel_scan_matches_serial_scan(self, tmp_path, monkeypatch):
+        """Test that the process-pool scan produces the same graph."""
+        from repo_analyzer import dependency_graph
+        
+        (tmp_path / "utils.py").write_text("import os\n")
+        (tmp_path / "main.py").write_text("from . import utils\nimport requests\n")
+        (tmp_path / "app.js").write_text("import './lib';\n")
+        (tmp_path / "lib.js").write_text("export const x = 1;\n")
+        
+        serial, serial_errors = build_dependency_graph(tmp_path)
+        monkeypatch.setattr(dependency_graph, "_PARALLEL_SCAN_THRESHOLD", 1)
+        monkeypatch.setattr(dependency_graph.os, "cpu_count", lambda: 2)
+        parallel, parallel_errors = build_dependency_graph(tmp_path)
+        
+        assert parallel == serial
+        assert parallel_errors == serial_errors == []
+        assert len(parallel['edges']) == 2
+    
+    def test_single_worker_scans_serially(self, tmp_path, monkeypatch):
+        """Test that max_workers=1 never starts a process pool."""
+        from repo_analyzer import dependency_graph
+        
+        (tmp_path / "utils.py").write_text("import os\n")
+        (tmp_path / "main.py").write_text("from . import utils\n")
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+        
+        monkeypatch.setattr(dependency_graph, "_PARALLEL_SCAN_THRESHOLD", 1)
+        monkeypatch.setattr(dependency_graph, "ProcessPoolExecutor", fail)
+        graph_data, errors = build_dependency_graph(tmp_path, max_workers=1)
+        
+        assert errors == []
+        assert len(graph_data['edges']) == 1
+    
+    def test_invalid_max_workers(self, tmp_path):
+        """Test that a worker count below 1 is rejected."""
+        (tmp_path / "main.py").write_text("import os\n")
+        
+        with pytest.raises(DependencyGraphError, match="max_workers"):
+            build_dependency_graph(tmp_path, max_workers=0)
+    
     def test_relative_root_path_js_dependencies(self, tmp_path):
         """Test that JS dependencies work with relative root paths."""
         # Create a structure
@@ -1092,6 +1286,16 @@ from django.http import HttpResponse
         assert 'requests' in main_node['external_dependencies']['third-party']
         assert 'numpy' in main_node['external_dependencies']['third-party']
     
+    def test_python_submodules_share_classification(self, tmp_path):
+        """Test that submodules of one package are classified alike but kept whole."""
+        (tmp_path / "main.py").write_text("import os.path\nimport os\nimport numpy.linalg\nimport numpy.fft\n")
+        
+        graph_data, _ = build_dependency_graph(tmp_path, include_patterns=['*.py'])
+        
+        ext = graph_data['nodes'][0]['external_dependencies']
+        assert ext['stdlib'] == ['os', 'os.path']
+        assert ext['third-party'] == ['numpy.fft', 'numpy.linalg']
+    
     def test_js_node_core_modules(self, tmp_path):
         """Test detection of Node.js core module dependencies."""
         source = tmp_path / "source"
@@ -1407,6 +1611,25 @@ class TestParseCCppIncludes:
         assert 'commented_out.h' not in includes
         assert 'also_commented.h' not in includes
     
+    def test_multiline_block_comments(self, tmp_path):
+        """Test that multi-line and unterminated block comments are handled."""
+        content = """
+/*
+#include "first.h"
+*/
+#include "kept.h"
+/* one */ #include "between.h" /* two */
+/* unterminated
+#include "tail.h"
+"""
+        file_path = tmp_path / "test.c"
+        includes = _parse_c_cpp_includes(content, file_path)
+        
+        assert 'first.h' not in includes
+        assert 'kept.h' in includes
+        assert 'between.h' in includes
+        assert 'tail.h' in includes
+    
     def test_whitespace_variations(self, tmp_path):
         """Test various whitespace patterns."""
         content = """
@@ -1550,6 +1773,23 @@ import "actual"
         assert 'actual' in imports
         assert 'commented' not in imports
         assert 'also_commented' not in imports
+    
+    def test_import_keyword_outside_statements(self, tmp_path):
+        """Test that 'import' in identifiers and strings is not an import."""
+        content = """
+import (
+    "fmt"
+    "strings")
+
+func main() {
+    importer := "import (\\"os\\")"
+    fmt.Println(importer, strings.ToUpper("x"))
+}
+"""
+        file_path = tmp_path / "test.go"
+        imports = _parse_go_imports(content, file_path)
+        
+        assert imports == ['fmt', 'strings']
 
 
 class TestParseJavaImports:
@@ -1806,6 +2046,19 @@ class TestParseHTMLCSSReferences:
         
         assert 'actual.css' in refs
         assert not any('data:' in ref for ref in refs)
+    
+    def test_skip_cdn_domains_without_scheme(self, tmp_path):
+        """Test that scheme-less CDN references are skipped case-insensitively."""
+        content = """
+<script src="unpkg.com/react/umd/react.js"></script>
+<link rel="stylesheet" href="Code.JQuery.com/ui.css">
+<style>.logo { background: url(cdnjs.example.org/logo.png); }</style>
+<script src="js/app.js"></script>
+"""
+        file_path = tmp_path / "test.html"
+        refs = _parse_html_css_references(content, file_path)
+        
+        assert refs == ['js/app.js']
 
 
 class TestParseSQLIncludes:
@@ -1862,6 +2115,33 @@ EXECUTE sp_executesql N'file "stored_proc.sql"';
         assert 'actual.sql' in includes
         assert 'commented.sql' not in includes
         assert 'also_commented.sql' not in includes
+    
+    def test_comments_are_skipped_in_document_order(self, tmp_path):
+        """Test multi-line block comments and trailing line comments."""
+        content = """
+/*
+SOURCE hidden.sql
+*/
+-- a line comment mentioning /* does not open a block
+\\i first.sql -- trailing comment
+SOURCE second.sql--no space
+EXEC run_script 'third.sql' -- 'not_this.sql'
+"""
+        file_path = tmp_path / "test.sql"
+        includes = _parse_sql_includes(content, file_path)
+        
+        assert includes == ['first.sql', 'second.sql', 'third.sql']
+    
+    def test_include_after_block_comment(self, tmp_path):
+        """Test includes following a block comment on the same line."""
+        content = """/* c */ \\i foo.sql
+/* a comment
+   spanning lines */ \\i bar.sql
+"""
+        file_path = tmp_path / "test.sql"
+        includes = _parse_sql_includes(content, file_path)
+        
+        assert includes == ['foo.sql', 'bar.sql']
 
 
 class TestResolveCCppInclude:
@@ -1908,6 +2188,33 @@ class TestResolveCCppInclude:
         resolved = _resolve_c_cpp_include("mylib.h", source_file, tmp_path)
         assert resolved == header_file
     
+    def test_include_case_follows_filesystem(self, tmp_path, monkeypatch):
+        """Test that an include differing only in case resolves only where case is ignored."""
+        import os
+        from repo_analyzer import dependency_graph
+        
+        source_file = tmp_path / "main.cpp"
+        source_file.touch()
+        header_file = tmp_path / "foo.h"
+        header_file.touch()
+        if (tmp_path / "FOO.H").exists():
+            pytest.skip("temporary directory is on a case-insensitive filesystem")
+        
+        dependency_graph._clear_resolution_caches()
+        assert _resolve_c_cpp_include("Foo.h", source_file, tmp_path) is None
+        
+        # Simulate a case-insensitive filesystem, where Foo.h exists as well
+        real_lexists = os.path.lexists
+        monkeypatch.setattr(
+            dependency_graph.os.path, "lexists",
+            lambda path: real_lexists(os.path.join(
+                os.path.dirname(path), os.path.basename(path).lower()
+            ))
+        )
+        dependency_graph._clear_resolution_caches()
+        assert _resolve_c_cpp_include("Foo.h", source_file, tmp_path) == tmp_path / "Foo.h"
+        assert _resolve_c_cpp_include("Bar.h", source_file, tmp_path) is None
+    
     def test_missing_include(self, tmp_path):
         """Test that missing includes return None."""
         source_file = tmp_path / "main.cpp"
@@ -1955,6 +2262,20 @@ class TestResolveRustImport:
         resolved = _resolve_rust_import("handlers", source_file, tmp_path)
         assert resolved == mod_file
     
+    def test_dangling_symlink_not_resolved(self, tmp_path):
+        """Test that a symlink to a missing file does not count as a module."""
+        source_file = tmp_path / "src" / "main.rs"
+        source_file.parent.mkdir(parents=True)
+        source_file.touch()
+        
+        link = tmp_path / "src" / "gone.rs"
+        try:
+            link.symlink_to(tmp_path / "src" / "missing.rs")
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+        
+        assert _resolve_rust_import("gone", source_file, tmp_path) is None
+    
     def test_crate_relative_import(self, tmp_path):
         """Test that crate-relative imports resolve from src root."""
         # Create src/lib.rs
@@ -2040,6 +2361,20 @@ class TestResolveHTMLCSSReference:
         
         resolved = _resolve_html_css_reference("nonexistent.css", source_file, tmp_path)
         assert resolved is None
+    
+    def test_sibling_directory_with_shared_prefix(self, tmp_path):
+        """Test that a sibling directory whose name extends the root is outside it."""
+        repo = tmp_path / "site"
+        repo.mkdir()
+        source_file = repo / "index.html"
+        source_file.touch()
+        
+        outside = tmp_path / "site-assets"
+        outside.mkdir()
+        (outside / "style.css").touch()
+        
+        resolved = _resolve_html_css_reference("../site-assets/style.css", source_file, repo)
+        assert resolved is None
 
 
 class TestResolveSQLInclude:
@@ -7,8 +7,9 @@ Tests for file_summary module.
 """
 
 import json
+import os
 import tempfile
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import pytest
 
@@ -20,6 +21,7 @@ from repo_analyzer.file_summary import (
     _generate_heuristic_summary,
     _matches_pattern,
     _detect_file_role,
+    _analyze_file,
     _create_structured_summary,
     SCHEMA_VERSION,
 )
@@ -82,6 +84,51 @@ class TestMatchesPattern:
         # Multiple wildcards
         assert _matches_pattern('test_utils.py', ['test_*.py']) is True
         assert _matches_pattern('my_test.py', ['*_test.py']) is True
+    
+    def test_wildcards_stay_within_one_component(self):
+        """Test that wildcards never match across a path separator."""
+        assert _matches_pattern('src/lib/helper.py', ['src/*']) is False
+        assert _matches_pattern('src/lib/helper.py', ['src*helper.py']) is False
+        assert _matches_pattern('src/lib', ['src/[!a]ib']) is True
+    
+    def test_anchored_patterns(self):
+        """Test that absolute patterns must match the whole path."""
+        assert _matches_pattern('/src/main.py', ['/src/*.py']) is True
+        assert _matches_pattern('/app/src/main.py', ['/src/*.py']) is False
+        assert _matches_pattern('src/main.py', ['/src/*.py']) is False
+    
+    def test_empty_pattern_rejected(self):
+        """Test that an empty pattern raises like Path.match."""
+        with pytest.raises(ValueError):
+            _matches_pattern('main.py', [''])
+    
+    def test_empty_pattern_only_raises_when_reached(self):
+        """Test that earlier matches win over a later '' or '.' pattern."""
+        assert _matches_pattern('main.py', ['*.py', '.']) is True
+        assert _matches_pattern('src/main.py', ['src/*.py', '']) is True
+        assert _matches_pattern('main.py', ['*', './']) is True
+        with pytest.raises(ValueError):
+            _matches_pattern('main.js', ['*.py', '.', '*.js'])
+        with pytest.raises(ValueError):
+            _matches_pattern('main.py', ['.', '*.py'])
+    
+    def test_mixed_pattern_list(self):
+        """Test a list mixing suffix, literal, wildcard and path patterns."""
+        patterns = ['*.py', 'Makefile', 'test_?', 'docs/*.md', '/build/*']
+        cases = {
+            'src/app.py': True,
+            'Makefile': True,
+            'sub/Makefile.in': False,
+            'tests/test_1': True,
+            'tests/test_12': False,
+            'docs/index.md': True,
+            'README.md': False,
+            '/build/out': True,
+            'build/out': False,
+        }
+        for path, expected in cases.items():
+            assert _matches_pattern(path, patterns) is expected
+            assert any(PurePosixPath(path).match(p) for p in patterns) is expected
 
 
 class TestGetLanguage:
@@ -204,6 +251,35 @@ class TestGenerateHeuristicSummary:
         summary2 = _generate_heuristic_summary(file_path, root)
         
         assert summary1 == summary2
+    
+    def test_analyze_file_matches_separate_helpers(self, tmp_path):
+        """Test that the single-pass analysis agrees with the separate helpers."""
+        root = tmp_path
+        for rel in ['main.py', 'tests/test_utils.py', 'docs/guide.md', 'src/lib.rs', 'api/routes.js']:
+            file_path = root / rel
+            assert _analyze_file(file_path, root) == (
+                _get_language(file_path),
+                *_detect_file_role(file_path, root),
+                _generate_heuristic_summary(file_path, root),
+            )
+            assert _analyze_file(file_path, root, include_summary=False)[3] is None
+    
+    def test_relative_parts_match_relative_to(self, tmp_path):
+        """Test that relative path splitting agrees with Path.relative_to."""
+        from repo_analyzer.file_summary import _relative_parts
+        
+        cases = [
+            (tmp_path / 'main.py', tmp_path),
+            (tmp_path / 'src' / 'pkg' / 'mod.py', tmp_path),
+            (Path('/') / 'etc' / 'hosts', Path('/')),
+            (Path('main.py'), Path('.')),
+            (Path('repo/../other/x.py'), Path('repo')),
+        ]
+        for file_path, root in cases:
+            assert _relative_parts(file_path, root) == list(file_path.relative_to(root).parts)
+        
+        # Sibling directories sharing a name prefix aren't the root
+        assert _relative_parts(tmp_path / 'rootx' / 'a.py', tmp_path / 'root') is None
 
 
 class TestScanFiles:
@@ -235,6 +311,33 @@ class TestScanFiles:
         assert len(files) == 1
         assert files[0].name == 'keep.py'
     
+    def test_catch_all_include_patterns(self, tmp_path):
+        """Test that catch-all includes match like no include patterns."""
+        (tmp_path / 'top.py').touch()
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'sub' / 'nested.txt').touch()
+        
+        all_files = scan_files(tmp_path)
+        assert len(all_files) == 2
+        assert scan_files(tmp_path, include_patterns=['*']) == all_files
+        assert scan_files(tmp_path, include_patterns=['*.md', '**']) == all_files
+        # '**/*' needs two components under Path.match semantics
+        assert scan_files(tmp_path, include_patterns=['**/*']) == [tmp_path / 'sub' / 'nested.txt']
+    
+    def test_empty_include_pattern_after_matches(self, tmp_path):
+        """Test that a trailing '.' include only raises for unmatched files."""
+        (tmp_path / 'main.py').touch()
+        
+        assert scan_files(tmp_path, include_patterns=['*.py', '.']) == [tmp_path / 'main.py']
+        assert scan_files(tmp_path, include_patterns=['*', '.']) == [tmp_path / 'main.py']
+        
+        (tmp_path / 'notes.txt').touch()
+        with pytest.raises(ValueError):
+            scan_files(tmp_path, include_patterns=['*.py', '.'])
+        # A catch-all after the empty pattern is never reached
+        with pytest.raises(ValueError):
+            scan_files(tmp_path, include_patterns=['.', '*'])
+    
     def test_exclude_directories(self, tmp_path):
         """Test excluding directories."""
         (tmp_path / 'file.py').touch()
@@ -290,6 +393,16 @@ class TestScanFiles:
         assert len(files) == 2
         assert all(not f.is_symlink() for f in files)
     
+    @pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="requires os.mkfifo")
+    def test_special_files_skipped(self, tmp_path):
+        """Test that FIFOs and other non-regular files are skipped."""
+        (tmp_path / 'real.py').touch()
+        os.mkfifo(tmp_path / 'pipe.py')
+        
+        files = scan_files(tmp_path, include_patterns=['*.py'])
+        
+        assert files == [tmp_path / 'real.py']
+    
     def test_deterministic_ordering(self, tmp_path):
         """Test that file ordering is deterministic."""
         (tmp_path / 'zebra.py').touch()
@@ -304,6 +417,18 @@ class TestScanFiles:
         assert files1[1].name == 'beta.py'
         assert files1[2].name == 'zebra.py'
     
+    def test_ordering_matches_path_ordering(self, tmp_path):
+        """Test that nested paths sort component-wise, as Path objects do."""
+        for rel in ['a-b.py', 'a.py', 'a/b.py', 'ab/c.py', 'a/b/c.py']:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        
+        files = scan_files(tmp_path)
+        
+        assert files == sorted(files)
+        assert files[0] == tmp_path / 'a' / 'b' / 'c.py'
+    
     def test_no_include_patterns(self, tmp_path):
         """Test scanning with no include patterns (should include all)."""
         (tmp_path / 'file1.py').touch()
@@ -572,6 +697,173 @@ class TestGenerateFileSummaries:
         assert paths[1] == 'beta.py'
         assert paths[2] == 'zebra.py'
     
+    def test_parallel_summaries_match_serial(self, tmp_path, monkeypatch):
+        """Test that process-pool summarization writes the same output in order."""
+        from repo_analyzer import file_summary
+        
+        source = tmp_path / 'source'
+        source.mkdir()
+        for i in range(12):
+            (source / f'module_{i:02d}.py').write_text(f"import os\n# TODO {i}\n")
+        
+        outputs = []
+        # Small chunks and one task in flight per worker, so the pool run
+        # both refills and drains its queue of chunks
+        monkeypatch.setattr(file_summary, "_SUMMARY_CHUNKSIZE", 2)
+        monkeypatch.setattr(file_summary, "_SUMMARY_TASKS_PER_WORKER", 1)
+        for threshold in (10**6, 1):
+            monkeypatch.setattr(file_summary, "_PARALLEL_SUMMARY_THRESHOLD", threshold)
+            output = tmp_path / f'output_{threshold}'
+            output.mkdir()
+            generate_file_summaries(source, output, detail_level="detailed", max_workers=2)
+            outputs.append([
+                (output / name).read_text()
+                for name in ('file-summaries.md', 'file-summaries.json')
+            ])
+        
+        assert outputs[0] == outputs[1]
+    
+    def test_markdown_batches_match_unbatched_output(self, tmp_path, monkeypatch):
+        """Test that Markdown written in batches is identical to one batch."""
+        from repo_analyzer import file_summary
+        
+        source = tmp_path / 'source'
+        source.mkdir()
+        for i in range(5):
+            (source / f'module_{i}.py').write_text(f"# TODO {i}\n")
+        
+        outputs = []
+        for batch in (2, 5, 1000):
+            monkeypatch.setattr(file_summary, "_MARKDOWN_WRITE_BATCH", batch)
+            output = tmp_path / f'output_{batch}'
+            output.mkdir()
+            generate_file_summaries(source, output, use_cache=False)
+            outputs.append((output / 'file-summaries.md').read_text())
+        
+        assert outputs[0] == outputs[1] == outputs[2]
+        assert outputs[0].count('## module_') == 5
+    
+    def test_invalid_max_workers(self, tmp_path):
+        """Test that a worker count below 1 is rejected."""
+        (tmp_path / 'main.py').write_text("print('hello')\n")
+        
+        with pytest.raises(FileSummaryError, match="max_workers"):
+            generate_file_summaries(tmp_path, tmp_path / 'output', max_workers=0)
+    
+    def test_summary_cache_reused_for_unchanged_files(self, tmp_path, monkeypatch):
+        """Test that a second run reuses cached summaries of unchanged files."""
+        from repo_analyzer import file_summary
+        
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'main.py').write_text("import os\n\ndef main():\n    pass\n")
+        (source / 'utils.js').write_text("export function helper() {}\n")
+        output = tmp_path / 'output'
+        output.mkdir()
+        
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        assert (output / '.file-summary-cache.json').exists()
+        first = [(output / name).read_text() for name in ('file-summaries.md', 'file-summaries.json')]
+    
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged file was summarized again")
+        
+        # Cached files aren't read again, even for their imports
+        monkeypatch.setattr(file_summary, "_summarize_file", fail)
+        monkeypatch.setattr(file_summary, "_parse_file_imports", fail)
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        second = [(output / name).read_text() for name in ('file-summaries.md', 'file-summaries.json')]
+        
+        assert first == second
+    
+    def test_summary_cache_refreshes_changed_files(self, tmp_path):
+        """Test that modified files are summarized again."""
+        source = tmp_path / 'source'
+        source.mkdir()
+        main = source / 'main.py'
+        main.write_text("def main():\n    pass\n")
+        output = tmp_path / 'output'
+        output.mkdir()
+        
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        main.write_text("def main():\n    pass\n\ndef other():\n    pass\n")
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        
+        data = json.loads((output / 'file-summaries.json').read_text())
+        assert data['files'][0]['structure']['declarations'] == ['function main', 'function other']
+    
+    def test_summary_cache_invalidated_by_context(self, tmp_path):
+        """Test that changed options don't reuse cached summaries."""
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'main.py').write_text("import helpers\n")
+        output = tmp_path / 'output'
+        output.mkdir()
+        
+        generate_file_summaries(source, output, detail_level="standard", max_workers=1, use_cache=True)
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        data = json.loads((output / 'file-summaries.json').read_text())
+        assert data['files'][0]['dependencies']['external']['third-party'] == ['helpers']
+        
+        # helpers is now part of the repository, so main.py's import is internal
+        (source / 'helpers.py').write_text("VALUE = 1\n")
+        generate_file_summaries(source, output, detail_level="detailed", max_workers=1, use_cache=True)
+        data = json.loads((output / 'file-summaries.json').read_text())
+        main_entry = next(entry for entry in data['files'] if entry['path'] == 'main.py')
+        assert main_entry['dependencies']['external']['third-party'] == []
+    
+    def test_summary_cache_recomputes_external_dependencies(self, tmp_path):
+        """Test that cached entries see files added outside the scanned set."""
+        (tmp_path / 'src').mkdir()
+        (tmp_path / 'src' / 'a.py').write_text("import helpers\n")
+        output = tmp_path / 'output'
+        output.mkdir()
+        options = dict(
+            include_patterns=['src/*.py'], detail_level="detailed", max_workers=1,
+            use_cache=True
+        )
+        
+        generate_file_summaries(tmp_path, output, **options)
+        data = json.loads((output / 'file-summaries.json').read_text())
+        assert data['files'][0]['dependencies']['external']['third-party'] == ['helpers']
+        
+        (tmp_path / 'helpers.py').write_text("VALUE = 1\n")
+        generate_file_summaries(tmp_path, output, **options)
+        data = json.loads((output / 'file-summaries.json').read_text())
+        assert data['files'][0]['dependencies']['external']['third-party'] == []
+        
+        # Entries are keyed by relative path, never the absolute one
+        cache_text = (output / '.file-summary-cache.json').read_text()
+        assert '"src/a.py"' in cache_text
+        assert str(tmp_path) not in cache_text
+    
+    def test_summary_cache_disabled(self, tmp_path):
+        """Test that the cache is neither read nor written by default."""
+        (tmp_path / 'main.py').write_text("print('hello')\n")
+        output = tmp_path / 'output'
+        output.mkdir()
+        
+        generate_file_summaries(tmp_path, output)
+        
+        assert (output / 'file-summaries.json').exists()
+        assert not (output / '.file-summary-cache.json').exists()
+    
+    def test_summary_worker_uses_parent_registry(self):
+        """Test that worker initialization installs the given registry."""
+        from repo_analyzer.file_summary import _init_summary_worker
+        from repo_analyzer.language_registry import (
+            LanguageRegistry, get_global_registry, reset_global_registry
+        )
+        
+        registry = LanguageRegistry()
+        registry.disable_language("Python")
+        try:
+            _init_summary_worker(registry)
+            assert get_global_registry() is registry
+            assert get_global_registry().get_language_by_extension('.py') is None
+        finally:
+            reset_global_registry()
+    
     def test_summary_content_quality(self, tmp_path):
         """Test that summaries contain useful information."""
         source = tmp_path / 'source'
@@ -785,8 +1077,7 @@ class TestStructuredSummarySchema:
         
         # Legacy compatibility fields
         assert 'summary' in summary
-        assert 'summary_text' in summary
-        assert summary['summary'] == summary['summary_text']
+        assert 'summary_text' not in summary
         
         # Standard detail level includes metrics
         assert 'metrics' in summary
@@ -903,6 +1194,57 @@ class TestStructuredSummarySchema:
         assert 'imports' in summary['dependencies']
         assert 'exports' in summary['dependencies']
     
+    def test_detailed_dependencies_reuse_read_content(self, tmp_path, monkeypatch):
+        """Test that the dependency scan reuses the content read for metrics."""
+        from repo_analyzer import dependency_graph
+        
+        def fail(file_path):
+            raise AssertionError("file was read again for its dependencies")
+        
+        file_path = tmp_path / 'main.py'
+        file_path.write_bytes(b"import os\r\nimport requests\r\n" + b"# padding\n" * 200)
+        monkeypatch.setattr(dependency_graph, "_read_source", fail)
+        
+        # Also for files too large to have been decoded for declarations
+        for max_file_size_kb in (1024, 1):
+            summary = _create_structured_summary(
+                file_path, tmp_path, detail_level='detailed', max_file_size_kb=max_file_size_kb
+            )
+            
+            assert summary['dependencies']['external'] == {
+                'stdlib': ['os'],
+                'third-party': ['requests'],
+            }
+    
+    def test_identical_files_parsed_once(self, tmp_path, monkeypatch):
+        """Test that declarations of files with identical bytes are reused."""
+        from repo_analyzer import file_summary
+        
+        calls = []
+        parse = file_summary._parse_python_declarations
+        
+        def counting_parse(content):
+            calls.append(content)
+            return parse(content)
+        
+        monkeypatch.setattr(file_summary, "_DECLARATION_CACHE", {})
+        monkeypatch.setattr(file_summary, "_parse_python_declarations", counting_parse)
+        for name in ('a.py', 'b.py'):
+            (tmp_path / name).write_text("def main():\n    pass\n")
+        (tmp_path / 'c.py').write_text("class Other:\n    pass\n")
+        
+        summaries = [
+            _create_structured_summary(tmp_path / name, tmp_path, detail_level='detailed')
+            for name in ('a.py', 'b.py', 'c.py')
+        ]
+        
+        assert len(calls) == 2
+        assert summaries[0]['structure'] == summaries[1]['structure'] == {
+            'declarations': ['function main'],
+        }
+        assert summaries[0]['structure']['declarations'] is not summaries[1]['structure']['declarations']
+        assert summaries[2]['structure']['declarations'] == ['class Other']
+    
     def test_legacy_summary_disabled(self, tmp_path):
         """Test disabling legacy summary field."""
         from repo_analyzer.file_summary import _create_structured_summary
@@ -924,6 +1266,23 @@ class TestStructuredSummarySchema:
         assert 'language' in summary
         assert 'role' in summary
     
+    def test_summary_text_alias_opt_in(self, tmp_path):
+        """Test that summary_text is only emitted when requested."""
+        from repo_analyzer.file_summary import _create_structured_summary
+        
+        source = tmp_path / 'source'
+        source.mkdir()
+        file_path = source / 'main.py'
+        file_path.write_text('# main')
+        
+        summary = _create_structured_summary(file_path, source, include_summary_text=True)
+        assert summary['summary_text'] == summary['summary']
+        
+        summary = _create_structured_summary(
+            file_path, source, include_legacy=False, include_summary_text=True
+        )
+        assert 'summary_text' not in summary
+    
     def test_generate_with_detail_levels(self, tmp_path):
         """Test generate_file_summaries with different detail levels."""
         source = tmp_path / 'source'
@@ -996,9 +1355,33 @@ class TestStructuredSummarySchema:
         keys = list(first_file.keys())
         
         # Expected order
-        expected_order = ['schema_version', 'path', 'language', 'role', 'role_justification', 'summary', 'summary_text', 'metrics']
+        expected_order = ['schema_version', 'path', 'language', 'role', 'role_justification', 'summary', 'metrics']
         assert keys == expected_order
     
+    def test_json_bytes_independent_of_serializer(self, tmp_path, monkeypatch):
+        """Test that orjson and the json fallback write identical bytes."""
+        pytest.importorskip('orjson')
+        from repo_analyzer import file_summary
+        from repo_analyzer.file_summary import _entry_json
+        
+        source = tmp_path / 'source'
+        source.mkdir()
+        (source / 'café.py').write_text('def grüße():\n    return "日本"\n', encoding='utf-8')
+        
+        outputs = []
+        for backend in (file_summary.orjson, None):
+            monkeypatch.setattr(file_summary, 'orjson', backend)
+            output = tmp_path / f'output_{len(outputs)}'
+            output.mkdir()
+            generate_file_summaries(source, output, detail_level='detailed', use_cache=False)
+            outputs.append((output / 'file-summaries.json').read_bytes())
+            # Strings that aren't valid Unicode fall back to \u escapes
+            assert _entry_json({'path': 'bad\udcff.py'}) == b'{\n  "path": "bad\\udcff.py"\n}'
+        
+        assert outputs[0] == outputs[1]
+        assert 'café.py'.encode('utf-8') in outputs[0]
+        assert 'function grüße'.encode('utf-8') in outputs[0]
+    
     def test_backward_compatibility_with_old_parsers(self, tmp_path):
         """Test that old parsers can still read new format."""
         source = tmp_path / 'source'
@@ -1063,6 +1446,54 @@ class TestStructuredSummarySchema:
         # Should include size from metrics
         assert '**Size:**' in content
         assert 'KB' in content
+    
+    def test_markdown_renderer_matches_generic_rendering(self, tmp_path):
+        """Test that per-run Markdown renderers match _summary_markdown."""
+        from repo_analyzer.file_summary import _summary_markdown, _summary_markdown_renderer
+        
+        (tmp_path / 'main.py').write_text("import os\n\ndef main():\n    pass  # TODO\n")
+        (tmp_path / 'README.md').write_text("# Title\n")
+        
+        for detail_level in ('minimal', 'standard', 'detailed'):
+            for include_legacy in (True, False):
+                render = _summary_markdown_renderer(detail_level, include_legacy)
+                entries = [
+                    _create_structured_summary(
+                        tmp_path / name, tmp_path,
+                        detail_level=detail_level, include_legacy=include_legacy
+                    )
+                    for name in ('main.py', 'README.md')
+                ]
+                if detail_level != 'minimal':
+                    # A file that couldn't be read has no LOC or TODO counts
+                    entries.append({**entries[0], 'metrics': {'size_bytes': 2048}})
+                
+                for entry in entries:
+                    assert render(entry) == _summary_markdown(entry)
+    
+    def test_markdown_truncates_long_lists(self):
+        """Test that long declaration and dependency lists end with a count."""
+        from repo_analyzer.file_summary import _summary_markdown
+        
+        entry = {
+            'path': 'big.py',
+            'language': 'Python',
+            'role': 'implementation',
+            'role_justification': 'default',
+            'structure': {'declarations': [f'function f{i}' for i in range(12)]},
+            'dependencies': {'external': {
+                'stdlib': [f'mod{i}' for i in range(7)],
+                'third-party': [f'pkg{i}' for i in range(5)],
+            }},
+        }
+        
+        markdown = _summary_markdown(entry)
+        
+        assert '  - function f9\n  - ... and 2 more\n' in markdown
+        assert 'function f10' not in markdown
+        assert '`mod4`\n    _(and 2 more)_\n' in markdown
+        assert '`pkg4`\n' in markdown
+        assert markdown.count('more') == 2
 
 
 class TestParsingFunctionality:
@@ -1086,6 +1517,10 @@ class TestParsingFunctionality:
         
         # Empty content
         assert _count_lines_of_code("") == 0
+        
+        # Indented comments, whitespace-only lines and CRLF endings
+        content = "  # comment\r\n\t// comment\r\n \t\r\n/ 2\r\n  x = 1\r\n"
+        assert _count_lines_of_code(content) == 2
     
     def test_count_todos(self):
         """Test TODO/FIXME counting."""
@@ -1104,11 +1539,106 @@ class TestParsingFunctionality:
         # Case insensitive
         assert _count_todos("# todo: lowercase") == 1
         assert _count_todos("# fixme: lowercase") == 1
+        # Non-ASCII case variants the regex also accepts
+        assert _count_todos("# F\u0130XME and F\u0131XME") == 2
         
         # In different comment styles
         content = "// TODO: js style\n/* FIXME: block comment */\n# TODO: python"
         assert _count_todos(content) == 3
     
+    def test_scan_ascii_metrics_matches_helpers(self):
+        """Test the single-pass ASCII scan against the LOC and TODO helpers."""
+        from repo_analyzer.file_summary import (
+            _count_lines_of_code, _count_todos, _decode_content,
+            _scan_ascii_metrics, _scan_content
+        )
+        
+        samples = [
+            b"",
+            b"x = 1\n# TODO: later\n\n  // fixme\nreturn x / 2\n",
+            b"TODO\nmy_todo = todos  # FIXME_not FIXME.\n",
+            b"\t\x0c\r\n/\n//\n#!\nFiXmE",
+            b"# old mac\rx = 1\rTODO",
+        ]
+        for data in samples:
+            content = _decode_content(data)
+            expected = (_count_lines_of_code(content), _count_todos(content))
+            assert _scan_ascii_metrics(data) == expected
+            assert _scan_content(data) == expected
+        
+        # Non-ASCII content goes through the regex helpers
+        assert _scan_content("caf\u00e9 = 1\n# F\u0130XME\n".encode('utf-8')) == (1, 1)
+    
+    def test_compiled_ascii_scan_matches_helpers(self):
+        """Test the numba-compiled scan against the LOC and TODO helpers."""
+        pytest.importorskip('numba')
+        from repo_analyzer.file_summary import (
+            _ascii_metrics_kernel, _count_lines_of_code, _count_todos,
+            _decode_content, _scan_content
+        )
+        
+        kernel = _ascii_metrics_kernel()
+        assert kernel is not None
+        
+        samples = [
+            b"",
+            b"\n",
+            b"x = 1\r\n# TODO: later\r\n\r\n  // fixme\r\nreturn x\r\n",
+            b"x = 1\ny = 2",
+            b"# FIXME",
+            b"TODO",
+            b"a\r\rb\r\n\n\rc",
+            b"\t\x0c\x1c\x1f\n/\n//\n#!\nmy_todo todo_ FiXmE9 (todo)",
+        ]
+        for data in samples:
+            content = _decode_content(data)
+            expected = (_count_lines_of_code(content), _count_todos(content))
+            assert kernel(data) == expected
+            assert _scan_content(data) == expected
+        
+        # Non-ASCII bytes never reach the kernel
+        for data in ["caf\u00e9 = 1\r\n# F\u0130XME".encode('utf-8'), b"x\xff\x85TODO\n"]:
+            content = _decode_content(data)
+            expected = (_count_lines_of_code(content), _count_todos(content))
+            assert _scan_content(data) == expected
+    
+    def test_numba_not_imported_with_module(self):
+        """Test that importing file_summary leaves numba unloaded."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, repo_analyzer.file_summary; "
+            "print('numba' in sys.modules, 'numpy' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ['False', 'False']
+    
+    def test_decode_content_matches_text_mode_read(self, tmp_path):
+        """Test that decoding read bytes matches a text-mode read."""
+        from repo_analyzer.file_summary import _decode_content
+        
+        data = b"a\r\nb\rc\n\xff\xc3\xa9\xe2\x82"
+        file_path = tmp_path / 'mixed.txt'
+        file_path.write_bytes(data)
+        
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            assert _decode_content(data) == f.read()
+    
+    def test_read_file_returns_size_and_content(self, tmp_path):
+        """Test reading empty, small and multi-chunk files."""
+        from repo_analyzer.file_summary import _READ_CHUNK_SIZE, _read_file
+        
+        for data in (b"", b"x = 1\n", bytes(range(256)) * (_READ_CHUNK_SIZE // 100)):
+            file_path = tmp_path / 'data.bin'
+            file_path.write_bytes(data)
+            assert _read_file(file_path) == (len(data), data)
+        
+        with pytest.raises(OSError):
+            _read_file(tmp_path / 'missing.py')
+    
     def test_parse_python_declarations_valid(self):
         """Test Python AST parsing with valid code."""
         from repo_analyzer.file_summary import _parse_python_declarations
@@ -155,6 +155,80 @@ class TestLanguageRegistry:
         # Try to disable non-existent language
         assert registry.disable_language("Nonexistent") is False
     
+    def test_extension_lookup_follows_state_changes(self):
+        """Test that cached extension lookups are refreshed on every change."""
+        registry = LanguageRegistry()
+        assert registry.get_language_by_extension(".py") == "Python"
+        
+        registry.disable_language("Python")
+        assert registry.get_language_by_extension(".py") is None
+        
+        registry.enable_language("Python")
+        assert registry.get_language_by_extension(".py") == "Python"
+        
+        registry.apply_config({"enabled_languages": ["JavaScript"]})
+        assert registry.get_language_by_extension(".py") is None
+        assert registry.get_language_by_extension(".js") == "JavaScript"
+        
+        registry.apply_config({"language_overrides": {"Python": {"enabled": True}}})
+        assert registry.get_language_by_extension(".py") == "Python"
+    
+    def test_extension_lookup_follows_enabled_field(self):
+        """Test that setting LanguageCapability.enabled directly is honoured."""
+        registry = LanguageRegistry()
+        assert registry.get_language_by_extension(".py") == "Python"
+        
+        registry.get_language("Python").enabled = False
+        assert registry.is_language_enabled("Python") is False
+        assert registry.get_language_by_extension(".py") is None
+        
+        registry.get_language("Python").enabled = True
+        assert registry.get_language_by_extension(".py") == "Python"
+    
+    def test_extension_lookup_case_and_shared_extensions(self):
+        """Test enabled lookups of mixed-case and shared extensions."""
+        registry = LanguageRegistry()
+        registry.register(LanguageCapability(name="Cython", extensions={".PYX", ".py"}, priority=20))
+        assert registry.get_language_by_extension(".py") == "Cython"
+        assert registry.get_language_by_extension(".Pyx") == "Cython"
+        assert registry.get_language_by_extension(".unknown") is None
+        
+        # A disabled language still owns its extensions
+        registry.disable_language("Cython")
+        assert registry.get_language_by_extension(".py") is None
+        assert registry.get_language_by_extension(".Pyx") is None
+        assert registry.get_language_by_extension_unfiltered(".PY") == "Cython"
+        
+        registry.apply_config({"language_overrides": {"Cython": {"enabled": True, "priority": 1}}})
+        assert registry.get_language_by_extension(".py") == "Python"
+        assert registry.get_language_by_extension(".pyx") == "Cython"
+    
+    def test_memoized_spellings_follow_enabled_field(self):
+        """Test that memoized mixed-case lookups see direct enabled changes."""
+        registry = LanguageRegistry()
+        assert registry.get_language_by_extension(".PY") == "Python"
+        assert registry.get_language_by_extension(".Js") == "JavaScript"
+        
+        registry.get_language("Python").enabled = False
+        registry.get_language("JavaScript").enabled = False
+        assert registry.get_language_by_extension(".PY") is None
+        assert registry.get_language_by_extension(".Js") is None
+        assert registry.get_language_by_extension_unfiltered(".PY") == "Python"
+        
+        registry.get_language("JavaScript").enabled = True
+        assert registry.get_language_by_extension(".Js") == "JavaScript"
+    
+    def test_registered_extensions_frozen(self):
+        """Test that registered extension sets can't drift from the maps."""
+        registry = LanguageRegistry()
+        language = LanguageCapability(name="Cython", extensions={".pyx", ".pxd"})
+        registry.register(language)
+        
+        assert language.extensions == frozenset({".pyx", ".pxd"})
+        with pytest.raises(AttributeError):
+            language.extensions.add(".pxi")
+        assert language.to_dict()["extensions"] == [".pxd", ".pyx"]
+    
     def test_get_all_extensions(self):
         """Test getting all registered extensions."""
         registry = LanguageRegistry()
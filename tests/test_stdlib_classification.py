@@ -12,6 +12,7 @@ from repo_analyzer.stdlib_classification import (
     classify_python_import,
     classify_js_import,
     classify_import,
+    classify_imports_batch,
     PYTHON_STDLIB,
     NODE_CORE_MODULES,
 )
@@ -178,6 +179,46 @@ class TestClassifyImport:
         assert classify_import('some_module', 'Ruby') == 'unknown'
         assert classify_import('some_module', 'Haskell') == 'unknown'
         assert classify_import('some_module', 'Unknown') == 'unknown'
+    
+    def test_batch_matches_single_classification(self):
+        """Test that batch classification agrees with classify_import."""
+        names = ['os', 'requests', 'os', 'collections.abc', '.utils']
+        result = classify_imports_batch(names, 'Python')
+        
+        assert result == {
+            'os': 'stdlib',
+            'requests': 'third-party',
+            'collections.abc': 'stdlib',
+            '.utils': 'unknown',
+        }
+        for name in names:
+            assert result[name] == classify_import(name, 'Python')
+    
+    def test_batch_per_language(self):
+        """Test batch classification for other languages."""
+        assert classify_imports_batch(['stdio.h', 'boost/asio.hpp'], 'C++') == {
+            'stdio.h': classify_import('stdio.h', 'C++'),
+            'boost/asio.hpp': classify_import('boost/asio.hpp', 'C++'),
+        }
+        assert classify_imports_batch(['fmt'], 'Go') == {'fmt': 'stdlib'}
+        assert classify_imports_batch(['x'], 'Ruby') == {'x': 'unknown'}
+        assert classify_imports_batch([], 'Python') == {}
+    
+    def test_batch_classifies_repeated_names_once(self, monkeypatch):
+        """Test that each distinct name reaches the classifier once."""
+        from repo_analyzer import stdlib_classification
+        
+        calls = []
+        
+        def counting_classifier(name):
+            calls.append(name)
+            return 'stdlib'
+        
+        monkeypatch.setitem(stdlib_classification._LANGUAGE_CLASSIFIERS, 'Python', counting_classifier)
+        result = classify_imports_batch(['os', 'sys', 'os', 'os', 'sys'], 'Python')
+        
+        assert result == {'os': 'stdlib', 'sys': 'stdlib'}
+        assert calls == ['os', 'sys']
 
 
 class TestStdlibTables:
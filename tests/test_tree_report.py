@@ -16,42 +16,53 @@ import pytest
 from repo_analyzer.tree_report import (
     generate_tree_report,
     TreeReportError,
-    _should_exclude,
+    _compile_excludes,
     _build_tree_structure,
     _tree_to_markdown,
     DEFAULT_EXCLUDES,
 )
 
 
-class TestShouldExclude:
-    """Tests for _should_exclude function."""
+class TestCompileExcludes:
+    """Tests for _compile_excludes function."""
     
     def test_exact_match(self):
         """Test exact name matching."""
-        patterns = {'.git', 'node_modules'}
-        assert _should_exclude('.git', patterns) is True
-        assert _should_exclude('node_modules', patterns) is True
-        assert _should_exclude('src', patterns) is False
+        is_excluded = _compile_excludes({'.git', 'node_modules'})
+        assert is_excluded('.git') is True
+        assert is_excluded('node_modules') is True
+        assert is_excluded('src') is False
     
     def test_wildcard_suffix(self):
         """Test wildcard suffix matching (*.ext)."""
-        patterns = {'*.pyc', '*.log'}
-        assert _should_exclude('test.pyc', patterns) is True
-        assert _should_exclude('debug.log', patterns) is True
-        assert _should_exclude('test.py', patterns) is False
+        is_excluded = _compile_excludes({'*.pyc', '*.log'})
+        assert is_excluded('test.pyc') is True
+        assert is_excluded('debug.log') is True
+        assert is_excluded('test.py') is False
     
     def test_wildcard_prefix(self):
         """Test wildcard prefix matching (prefix*)."""
-        patterns = {'test*', 'tmp*'}
-        assert _should_exclude('test_file', patterns) is True
-        assert _should_exclude('tmpdata', patterns) is True
-        assert _should_exclude('mytest', patterns) is False
+        is_excluded = _compile_excludes({'test*', 'tmp*'})
+        assert is_excluded('test_file') is True
+        assert is_excluded('tmpdata') is True
+        assert is_excluded('mytest') is False
     
     def test_no_match(self):
         """Test when no patterns match."""
-        patterns = {'.git', '*.pyc'}
-        assert _should_exclude('src', patterns) is False
-        assert _should_exclude('main.py', patterns) is False
+        is_excluded = _compile_excludes({'.git', '*.pyc'})
+        assert is_excluded('src') is False
+        assert is_excluded('main.py') is False
+    
+    def test_compiled_mixed_patterns(self):
+        """Test a compiled predicate over exact, suffix and prefix patterns."""
+        is_excluded = _compile_excludes({'build', '*.pyc', 'tmp*', 'a*b'})
+        assert is_excluded('build') is True
+        assert is_excluded('mod.pyc') is True
+        assert is_excluded('tmpdata') is True
+        # Patterns with a '*' only in the middle match exactly
+        assert is_excluded('a*b') is True
+        assert is_excluded('axb') is False
+        assert is_excluded('src') is False
 
 
 class TestBuildTreeStructure:
@@ -65,7 +76,7 @@ class TestBuildTreeStructure:
         (tmp_path / "subdir").mkdir()
         (tmp_path / "subdir" / "file3.txt").touch()
         
-        tree = _build_tree_structure(tmp_path, set())
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()))
         
         assert tree["type"] == "directory"
         assert tree["name"] == tmp_path.name
@@ -84,7 +95,7 @@ class TestBuildTreeStructure:
         (tmp_path / "node_modules").mkdir()
         
         excludes = {'.git', 'node_modules', '*.pyc'}
-        tree = _build_tree_structure(tmp_path, excludes)
+        tree = _build_tree_structure(tmp_path, _compile_excludes(excludes))
         
         # Should only have keep.txt
         assert len(tree["children"]) == 1
@@ -99,17 +110,17 @@ class TestBuildTreeStructure:
         (tmp_path / "level1" / "level2" / "level3" / "file.txt").touch()
         
         # Depth 0: only root
-        tree = _build_tree_structure(tmp_path, set(), max_depth=0)
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()), max_depth=0)
         assert len(tree["children"]) == 0
         
         # Depth 1: root + level1
-        tree = _build_tree_structure(tmp_path, set(), max_depth=1)
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()), max_depth=1)
         assert len(tree["children"]) == 1
         assert tree["children"][0]["name"] == "level1"
         assert len(tree["children"][0]["children"]) == 0
         
         # Depth 2: root + level1 + level2
-        tree = _build_tree_structure(tmp_path, set(), max_depth=2)
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()), max_depth=2)
         level1 = tree["children"][0]
         assert len(level1["children"]) == 1
         assert level1["children"][0]["name"] == "level2"
@@ -131,7 +142,7 @@ class TestBuildTreeStructure:
         link_dir = tmp_path / "linkdir"
         link_dir.symlink_to(real_dir)
         
-        tree = _build_tree_structure(tmp_path, set())
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()))
         
         # Should only have real.txt and realdir, no symlinks
         assert len(tree["children"]) == 2
@@ -146,7 +157,7 @@ class TestBuildTreeStructure:
         (tmp_path / "beta.txt").touch()
         (tmp_path / "Gamma").mkdir()
         
-        tree = _build_tree_structure(tmp_path, set())
+        tree = _build_tree_structure(tmp_path, _compile_excludes(set()))
         
         # Directories should come first, then files, case-insensitive sort
         names = [child["name"] for child in tree["children"]]
@@ -163,7 +174,7 @@ class TestBuildTreeStructure:
         file_path.touch()
         
         with pytest.raises(TreeReportError, match="not a directory"):
-            _build_tree_structure(file_path, set())
+            _build_tree_structure(file_path, _compile_excludes(set()))
     
     def test_permission_error_propagates(self, tmp_path, monkeypatch):
         """Test that permission errors are propagated as TreeReportError."""
@@ -189,7 +200,7 @@ class TestBuildTreeStructure:
         
         # Attempting to build tree should raise TreeReportError
         with pytest.raises(TreeReportError, match="Failed to read"):
-            _build_tree_structure(tmp_path, set())
+            _build_tree_structure(tmp_path, _compile_excludes(set()))
 
 
 class TestTreeToMarkdown:
@@ -322,6 +333,32 @@ class TestGenerateTreeReport:
         assert "exclude.log" not in content
         assert "test_file" not in content
     
+    def test_excludes_compiled_once(self, tmp_path, monkeypatch):
+        """Test that the exclude patterns are compiled once per report."""
+        from repo_analyzer import tree_report
+        
+        source = tmp_path / "source"
+        (source / "a" / "b" / "c").mkdir(parents=True)
+        (source / "a" / "b" / "c" / "deep.txt").touch()
+        (source / "a" / "skip.log").touch()
+        output = tmp_path / "output"
+        output.mkdir()
+        
+        calls = []
+        compile_excludes = tree_report._compile_excludes
+        
+        def counting_compile(patterns):
+            calls.append(patterns)
+            return compile_excludes(patterns)
+        
+        monkeypatch.setattr(tree_report, "_compile_excludes", counting_compile)
+        generate_tree_report(source, output, exclude_patterns=["*.log"])
+        
+        assert len(calls) == 1
+        content = (output / "tree.md").read_text()
+        assert "deep.txt" in content
+        assert "skip.log" not in content
+    
     def test_dry_run_mode(self, tmp_path, capsys):
         """Test dry-run mode doesn't write files."""
         source = tmp_path / "source"